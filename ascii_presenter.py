@@ -1,4 +1,9 @@
-import textwrap
+import importlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+from text_layout import box_inner_px, wrap_lines
 
 # ── Module colour palette (RGB tuples) ──────────────────────────────────────
 MODULE_COLORS = {
@@ -32,14 +37,47 @@ MODULE_BANNERS = {
 }
 
 
+# Framed text is memoised across all presenters; see make_text_slide
+FRAME_CACHE_SIZE = 512
+
+_frame_cache = OrderedDict()
+_frame_cache_lock = threading.Lock()
+_frame_cache_stats = {"hits": 0, "misses": 0}
+# Set while live slides rebuild themselves: their text changes every tick,
+# so caching it would only evict the static slides
+_live_build = threading.local()
+# Builders a live slide can name in its "live_recipe", by "module:function"
+_live_builders = {}
+
+
+@lru_cache(maxsize=256)
+def _color_for_title(title):
+    """MODULE_COLORS entry whose key appears in *title*, or None."""
+    title_lower = title.lower()
+    for key, col in MODULE_COLORS.items():
+        if key in title_lower:
+            return col
+    return None
+
+
+def frame_cache_info():
+    """Hit/miss counters and current size of the framed-slide cache."""
+    with _frame_cache_lock:
+        return dict(_frame_cache_stats, size=len(_frame_cache),
+                    maxsize=FRAME_CACHE_SIZE)
+
+
 class AsciiPresenter:
-    def __init__(self, screen_width=32, screen_height=12):
+    def __init__(self, screen_width=32, screen_height=12, font_size=None):
         """
         screen_width/screen_height are in characters, not pixels.
         Tuned for 320x240 LCD using 8x16 font size.
+        font_size is the size the slides will be drawn at (None = default);
+        body text is wrapped by measured width at that size.
         """
         self.screen_width = screen_width
         self.screen_height = screen_height
+        self.font_size = font_size
 
     # ----------------------------
     # Internal helpers
@@ -93,15 +131,9 @@ class AsciiPresenter:
         return [top, title_line, divider] + lines + [bottom]
 
     def _wrap(self, text):
-        # Split text by lines, preserve empty lines
-        lines = text.split("\n")
-        wrapped_lines = []
-        for line in lines:
-            if not line.strip():
-                wrapped_lines.append("")  # preserve blank line
-            else:
-                wrapped_lines.extend(textwrap.wrap(line, self.screen_width - 4))
-        return wrapped_lines
+        # Pixel-wrap to the box interior; blank lines are preserved
+        max_px = box_inner_px(self.screen_width - 4, self.font_size)
+        return wrap_lines(text, max_px, self.font_size)
 
     def _progress_bar(self, percent, width=20):
         """Return a progress bar string with label on a separate line."""
@@ -132,7 +164,41 @@ class AsciiPresenter:
         banner : str | None
             One-line decorative string prepended to the body (module
             header banner).  Pass an empty string "" to suppress.
+
+        Identical calls are served from a bounded LRU of framed output;
+        the returned slide dict is always a fresh copy.
         """
+        if getattr(_live_build, "active", False):
+            content, resolved_color = self._frame_text(title, body, footer,
+                                                       alert, color, banner)
+            slide = {"type": "text", "content": content}
+            if resolved_color is not None:
+                slide["color"] = resolved_color
+            return [slide]
+
+        key = (title, body, footer, alert, color, banner,
+               self.screen_width, self.screen_height, self.font_size)
+        with _frame_cache_lock:
+            cached = _frame_cache.get(key)
+            if cached is not None:
+                _frame_cache.move_to_end(key)
+                _frame_cache_stats["hits"] += 1
+        if cached is None:
+            cached = self._frame_text(title, body, footer, alert, color, banner)
+            with _frame_cache_lock:
+                _frame_cache_stats["misses"] += 1
+                _frame_cache[key] = cached
+                if len(_frame_cache) > FRAME_CACHE_SIZE:
+                    _frame_cache.popitem(last=False)
+
+        content, resolved_color = cached
+        slide = {"type": "text", "content": content}
+        if resolved_color is not None:
+            slide["color"] = resolved_color
+        return [slide]
+
+    def _frame_text(self, title, body, footer, alert, color, banner):
+        """Uncached body of make_text_slide: (framed content, colour or None)."""
         body_lines = self._wrap(body)
 
         # Prepend banner if provided
@@ -141,20 +207,10 @@ class AsciiPresenter:
 
         framed = self._box(title, body_lines, footer=footer, alert=alert)
 
-        slide = {"type": "text", "content": "\n".join(framed)}
-
-        # Resolve colour
-        if color is not None:
-            slide["color"] = color
-        else:
-            # Try to infer from title keywords
-            title_lower = title.lower()
-            for key, col in MODULE_COLORS.items():
-                if key in title_lower:
-                    slide["color"] = col
-                    break
-
-        return [slide]
+        # Resolve colour, inferring from title keywords if not given
+        if color is None:
+            color = _color_for_title(title)
+        return "\n".join(framed), color
 
     def make_progress_slide(self, title, label, percent, footer=None,
                             color=None):
@@ -165,3 +221,91 @@ class AsciiPresenter:
         if color is not None:
             slide["color"] = color
         return [slide]
+
+
+# Shared presenters, one per (width, height) in characters and font size
+_presenters = {}
+
+
+def get_presenter(screen_width=32, screen_height=12, font_size=None):
+    """The shared AsciiPresenter for a box size, created on first use."""
+    key = (screen_width, screen_height, font_size)
+    presenter = _presenters.get(key)
+    if presenter is None:
+        presenter = _presenters.setdefault(
+            key,
+            AsciiPresenter(screen_width=screen_width, screen_height=screen_height,
+                           font_size=font_size),
+        )
+    return presenter
+
+
+def live_builder(func):
+    """Register *func* as a live-slide builder that can be re-run by name.
+
+    Slides from ``make_live_slides(func, *args)`` then carry a
+    ``"live_recipe"`` naming the builder and its (JSON-safe) *args*, so a
+    deck shipped to another unit (see deck_server) keeps counting there.
+    """
+    _live_builders[f"{func.__module__}:{func.__name__}"] = func
+    return func
+
+
+def _run_live(build):
+    _live_build.active = True
+    try:
+        return build()
+    finally:
+        _live_build.active = False
+
+
+def _live_field(build, i, fallback):
+    """Callable returning the current content of slide *i* of *build*."""
+    def live():
+        fresh = _run_live(build)
+        if i < len(fresh) and fresh[i].get("type") == "text":
+            return fresh[i]["content"]
+        return fallback
+    return live
+
+
+def make_live_slides(build, *args):
+    """Mark the slides returned by ``build(*args)`` as live.
+
+    *build* returns a slide list (typically a call into ``make_text_slide``)
+    whose text depends on the clock, e.g. a countdown.  It is called once
+    now; each text slide then gets a ``"live"`` callable that re-runs it
+    and returns that slide's current content, so the display can refresh
+    it without a deck rebuild.  If *build* is a registered live_builder
+    the slides also get a ``"live_recipe"``.
+    """
+    run = (lambda: build(*args)) if args else build
+    name = f"{getattr(build, '__module__', '')}:{getattr(build, '__name__', '')}"
+    registered = _live_builders.get(name) is build
+
+    slides = _run_live(run)
+    for i, slide in enumerate(slides):
+        if isinstance(slide, dict) and slide.get("type") == "text":
+            slide["live"] = _live_field(run, i, slide["content"])
+            if registered:
+                slide["live_recipe"] = {"builder": name, "args": list(args), "index": i}
+    return slides
+
+
+def live_from_recipe(recipe, fallback):
+    """The ``"live"`` callable for a shipped *recipe*, or None if unknown here.
+
+    The builder's module is imported on demand; only functions registered
+    with live_builder are ever called.
+    """
+    module_name = recipe.get("builder", "").partition(":")[0]
+    try:
+        importlib.import_module(module_name)
+    except Exception as e:
+        print(f"[ascii_presenter] Can't load live builder {recipe.get('builder')}: {e}")
+        return None
+    build = _live_builders.get(recipe["builder"])
+    if build is None:
+        return None
+    args = recipe.get("args", [])
+    return _live_field(lambda: build(*args), recipe.get("index", 0), fallback)
@@ -0,0 +1,146 @@
+# circuit_breaker.py
+"""
+Circuit breakers for upstream APIs.
+
+A breaker is closed while its upstream works.  After FAILURE_THRESHOLD
+failures in a row it opens, and calls fail at once with ``CircuitOpen``
+instead of waiting out a timeout.  Once the cool-down has passed it goes
+half-open and lets exactly one probe through: success closes it, failure
+opens it again for twice as long (up to COOLDOWN_MAX).
+
+``get`` is a drop-in for ``requests.get`` with one breaker per host;
+connection errors, timeouts, 5xx and 429 count as failures.
+``CircuitOpen`` is a ``requests.RequestException``, so existing
+``except requests.RequestException`` handlers already treat a skipped
+call as a failed one.
+"""
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+
+FAILURE_THRESHOLD = 3
+COOLDOWN_MIN = 30.0          # seconds open after the first trip
+COOLDOWN_MAX = 1800.0
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half-open"
+
+
+class CircuitOpen(requests.RequestException):
+    """Raised instead of calling an upstream whose breaker is open."""
+
+    def __init__(self, name, retry_after):
+        super().__init__(f"{name} circuit open, retrying in {retry_after:.0f}s")
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    def __init__(self, name, failure_threshold=FAILURE_THRESHOLD,
+                 cooldown=COOLDOWN_MIN, max_cooldown=COOLDOWN_MAX):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.min_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+
+        self._lock = threading.Lock()
+        self.state = CLOSED
+        self.failures = 0
+        self.cooldown = cooldown
+        self.opened_at = 0.0
+        self.skipped = 0
+        self.trips = 0
+
+    def allow(self):
+        """Claim permission for one call; raises CircuitOpen if not allowed."""
+        with self._lock:
+            if self.state == CLOSED:
+                return
+            now = time.monotonic()
+            wait = self.opened_at + self.cooldown - now
+            if self.state == OPEN and wait <= 0:
+                # This caller is the probe; everyone else waits for its answer
+                self.state = HALF_OPEN
+                print(f"[circuit] {self.name}: half-open, probing")
+                return
+            self.skipped += 1
+            raise CircuitOpen(self.name, max(0.0, wait))
+
+    def success(self):
+        with self._lock:
+            if self.state != CLOSED:
+                print(f"[circuit] {self.name}: closed")
+            self.state = CLOSED
+            self.failures = 0
+            self.cooldown = self.min_cooldown
+
+    def failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN:
+                self.cooldown = min(self.max_cooldown, self.cooldown * 2)
+            elif self.state == OPEN or self.failures < self.failure_threshold:
+                return
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+            self.trips += 1
+            print(f"[circuit] {self.name}: open for {self.cooldown:.0f}s "
+                  f"after {self.failures} failures")
+
+    def call(self, func, *args, **kwargs):
+        """Run *func* through the breaker; any exception counts as a failure."""
+        self.allow()
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            self.failure()
+            raise
+        self.success()
+        return result
+
+    def snapshot(self):
+        with self._lock:
+            retry_in = 0.0
+            if self.state == OPEN:
+                retry_in = max(0.0, self.opened_at + self.cooldown - time.monotonic())
+            return {"state": self.state, "failures": self.failures,
+                    "cooldown": self.cooldown, "retry_in": round(retry_in, 1),
+                    "trips": self.trips, "skipped": self.skipped}
+
+
+# ── per-host breakers for HTTP ────────────────────────────────────────────────
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def breaker(name):
+    """The shared breaker called *name*, created on first use."""
+    with _breakers_lock:
+        if name not in _breakers:
+            _breakers[name] = CircuitBreaker(name, FAILURE_THRESHOLD,
+                                             COOLDOWN_MIN, COOLDOWN_MAX)
+        return _breakers[name]
+
+
+def states():
+    """Snapshot of every shared breaker, by name."""
+    with _breakers_lock:
+        named = list(_breakers.items())
+    return {name: b.snapshot() for name, b in named}
+
+
+def get(url, **kwargs):
+    """``requests.get`` behind the breaker for *url*'s host (and port)."""
+    host_breaker = breaker(urlparse(url).netloc or url)
+    host_breaker.allow()
+    try:
+        resp = requests.get(url, **kwargs)
+    except requests.RequestException:
+        host_breaker.failure()
+        raise
+    if resp.status_code >= 500 or resp.status_code == 429:
+        host_breaker.failure()
+    else:
+        host_breaker.success()
+    return resp
@@ -1 +1,20 @@
-from .slides import get_climate_slides
+# climate_module/__init__.py
+import importlib
+
+# Read by ProviderRegistry.add_module; see providers.Provider
+PROVIDER = {
+    "name": "climate",
+    "entry": "climate_module.slides:get_climate_slides",
+    "ttl": 3600,
+    "timeout": 15,
+}
+
+# Exported lazily so importing the package for PROVIDER stays cheap
+_EXPORTS = {"get_climate_slides": ".slides"}
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,6 +5,11 @@ LAST_FETCH_FILE = "climate_last_fetch.txt"
 REFRESH_INTERVAL = 3600     # refresh API call every 1h
 API_URL = "https://api.climateclock.world/v2/clock.json"
 
+# Live counter slide: deadline + lifelines animated on one screen
+LIVE_COUNTER = True
+LIVE_COUNTER_FPS = 15
+LIVE_COUNTER_LIFELINES = 3   # the box has room for three value rows
+
 # Lifeline toggles: set to False to hide a lifeline from slides
 LIFELINE_TOGGLES = {
     "actnow": False,
@@ -1,13 +1,15 @@
 # climate_module/slides.py
-import requests
+import circuit_breaker
 from datetime import datetime, timezone
 
-from .config import API_URL, LIFELINE_TOGGLES
+from .config import (API_URL, LIFELINE_TOGGLES, LIVE_COUNTER, LIVE_COUNTER_FPS,
+                     LIVE_COUNTER_LIFELINES)
 from .utils import load_cache, save_cache, should_fetch, compute_current_value
-from ascii_presenter import AsciiPresenter, MODULE_BANNERS, MODULE_COLORS
+from ascii_presenter import (get_presenter, MODULE_BANNERS, MODULE_COLORS,
+                             make_live_slides, live_builder)
 
 # Use the presenter configured to your requested box size
-presenter = AsciiPresenter()
+presenter = get_presenter()
 
 _DEADLINE_COLOR  = MODULE_COLORS["deadline"]
 _LIFELINE_COLOR  = MODULE_COLORS["lifeline"]
@@ -18,7 +20,7 @@ _LIFELINE_BANNER = MODULE_BANNERS["lifeline"]
 def fetch_climate_data():
     """Fetch the climate clock modules from the remote API."""
     try:
-        r = requests.get(API_URL, timeout=10)
+        r = circuit_breaker.get(API_URL, timeout=10)
         r.raise_for_status()
         return r.json()["data"]["modules"]
     except Exception as e:
@@ -104,6 +106,58 @@ def format_lifeline(key, lifeline, show_banner=False):
                                          color=_LIFELINE_COLOR)
 
 
+def _countdown(timer):
+    """Time left to a timer's deadline as "Xy Xd HH:MM:SS.t"."""
+    deadline_dt = datetime.fromisoformat(timer["timestamp"])
+    if deadline_dt.tzinfo is None:
+        deadline_dt = deadline_dt.replace(tzinfo=timezone.utc)
+    left = max(0.0, (deadline_dt - datetime.now(timezone.utc)).total_seconds())
+    # Whole tenths, truncated: rounding would show e.g. 59.96 s as "60.0"
+    seconds, tenths = divmod(int(left * 10), 10)
+    days, rest = divmod(seconds, 86400)
+    hours, rest = divmod(rest, 3600)
+    minutes, seconds = divmod(rest, 60)
+    years, days = divmod(days, 365)
+    return f"{years}y {days}d {hours:02d}:{minutes:02d}:{seconds:02d}.{tenths}"
+
+
+@live_builder
+def _live_counter_slides(timers, lifelines):
+    """The climate clock slide at this instant, from the modules' raw dicts."""
+    label_width = presenter.screen_width - 4
+    lines = []
+    for timer in timers[:1]:
+        lines += ["Carbon Deadline:", f"  {_countdown(timer)}"]
+    for lifeline in lifelines:
+        labels = lifeline.get("labels") or ["Lifeline"]
+        units = lifeline.get("unit_labels") or [""]
+        value = compute_current_value(lifeline, lifeline.get("decimals", 2))
+        lines.append(labels[0][:label_width])
+        lines.append(f"  {value:,.{lifeline.get('decimals', 2)}f} {units[0]}".rstrip())
+    return presenter.make_text_slide(
+        "CLIMATE CLOCK", "\n".join(lines), color=_DEADLINE_COLOR,
+    )
+
+
+def format_live_counter(data):
+    """One slide ticking the deadline and top lifelines at LIVE_COUNTER_FPS."""
+    timers = [m for m in data.values()
+              if m.get("type") == "timer" and m.get("flavor") == "deadline"
+              and m.get("timestamp")]
+    lifelines = [m for k, m in data.items()
+                 if m.get("type") == "value" and m.get("flavor") == "lifeline"
+                 and LIFELINE_TOGGLES.get(k, True)][:LIVE_COUNTER_LIFELINES]
+    if not timers and not lifelines:
+        return []
+
+    # The raw module dicts are the recipe, so a deck-server client can
+    # keep the counter running locally
+    slides = make_live_slides(_live_counter_slides, timers[:1], lifelines)
+    for slide in slides:
+        slide["live_fps"] = LIVE_COUNTER_FPS
+    return slides
+
+
 def get_climate_slides():
     """Fetch/cached climate data and build slides (timers + lifelines only)."""
     if should_fetch():
@@ -135,16 +189,24 @@ def get_climate_slides():
         module_type = module.get("type")
         flavor = module.get("flavor")
 
+        # Countdowns and growing values are recomputed on every display
         if module_type == "timer" and flavor == "deadline":
-            slides.extend(format_deadline(module, show_banner=first_deadline))
+            slides.extend(make_live_slides(
+                lambda m=module, b=first_deadline: format_deadline(m, show_banner=b)
+            ))
             first_deadline = False
 
         elif module_type == "value" and flavor == "lifeline":
             if LIFELINE_TOGGLES.get(key, True):
-                slides.extend(format_lifeline(key, module,
-                                              show_banner=first_lifeline))
+                slides.extend(make_live_slides(
+                    lambda k=key, m=module, b=first_lifeline:
+                        format_lifeline(k, m, show_banner=b)
+                ))
                 first_lifeline = False
 
+    if LIVE_COUNTER:
+        slides.extend(format_live_counter(data))
+
     return slides
 
 
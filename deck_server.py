@@ -0,0 +1,287 @@
+# deck_server.py
+"""
+Fan-out deck server: one unit runs the providers, every display pulls.
+
+``DeckServer`` calls the slide functions once per refresh interval, packs
+the deck with slide_bundle and serves it over local HTTP (TCP or a Unix
+socket).  Each slide is keyed by its content hash, so a display that
+already holds version N asks for ``/deck?since=N`` and receives a delta
+bundle with only the slides it doesn't have.  ``DeckClient.fetch_slides``
+is an ordinary slide function for SlideshowHandler on the display units.
+
+Versions start at 1.  Until the first refresh has published one the
+server answers 503, and a client that holds no deck yet treats that as a
+failed pull rather than an empty deck.
+
+Live slides built by a registered live_builder (the climate clock, NEO
+countdowns) ship their recipe and keep counting on the client; other
+live slides are a snapshot taken at refresh time.  Image slides are
+fitted to the screen on the server and shipped as PNG.
+"""
+import http.client
+import os
+import socket
+import socketserver
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs, unquote
+
+from slide_bundle import BundleReader, content_hash, pack_slide, write_bundle
+from providers import ProviderRunner, DEFAULT_DEADLINE
+
+DEFAULT_PORT = 8765
+# Versions whose slide sets are remembered for delta requests
+HISTORY = 8
+BUNDLE_MIME = "application/x-oracle-bundle"
+# Retry-After for clients that ask before the first deck is published
+NOT_READY_RETRY = 5
+
+
+class DeckNotReady(RuntimeError):
+    """Raised by DeckClient.pull while the server has no deck to serve yet."""
+
+
+# ── server ────────────────────────────────────────────────────────────────────
+
+class DeckServer:
+    def __init__(self, slide_functions, refresh_interval=900, width=320, height=240,
+                 provider_deadline=DEFAULT_DEADLINE):
+        self.slide_functions = slide_functions
+        self.providers = ProviderRunner(provider_deadline)
+        self.refresh_interval = refresh_interval
+        self.width = width
+        self.height = height
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self.version = 0                   # 0: nothing published yet
+        self._order = []
+        self._bodies = {}
+        self._history = OrderedDict()      # version -> set of slide hashes
+        # Encoded bundles for the current version, by base version (0 for a
+        # full bundle): at most HISTORY + 1, dropped on every publish
+        self._bundles = {}
+        self._building = {}                # base version -> Lock
+        self.stats = {"refreshes": 0, "requests": 0, "not_modified": 0,
+                      "not_ready": 0, "slides_sent": 0, "bytes_sent": 0,
+                      "bundles_built": 0}
+
+    def refresh(self):
+        """Run the providers once and publish the result as a new version."""
+        packed = [pack_slide(s, self.width, self.height)
+                  for s in self.providers.collect(self.slide_functions)]
+        order = [content_hash(*p) for p in packed]
+        with self._lock:
+            if order == self._order:
+                self.stats["refreshes"] += 1
+                return self.version
+            self.version += 1
+            self._order = order
+            self._bodies = dict(zip(order, packed))
+            self._history[self.version] = set(order)
+            while len(self._history) > HISTORY:
+                self._history.popitem(last=False)
+            self._bundles = {}
+            self._building = {}
+            self.stats["refreshes"] += 1
+            print(f"[DeckServer] Published version {self.version} ({len(order)} slides)")
+            return self.version
+
+    def delta(self, since=0):
+        """Bundle bytes for a client at version *since*, or None if it is current.
+
+        Slides the client already has (by hash) are sent as references only;
+        an unknown or expired *since* gets a full bundle.  Each bundle is
+        encoded once per version, outside the server lock; clients asking
+        for the same one meanwhile wait for it rather than encode it again.
+        """
+        with self._lock:
+            if since == self.version:
+                return None
+            version, order, bodies = self.version, self._order, self._bodies
+            known = self._history.get(since)
+            base = since if known else 0
+            bundle = self._bundles.get(base)
+            if bundle is not None:
+                return bundle
+            building = self._building.setdefault(base, threading.Lock())
+
+        with building:
+            with self._lock:
+                bundle = self._bundles.get(base) if self.version == version else None
+            if bundle is not None:
+                return bundle
+            bundle = write_bundle(version, order, bodies, self.width, self.height,
+                                  base_version=base, known=known or ())
+            with self._lock:
+                self.stats["bundles_built"] += 1
+                if self.version == version:
+                    self._bundles[base] = bundle
+            return bundle
+
+    def _refresh_loop(self):
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"[DeckServer] Refresh failed: {e}")
+            self._stop.wait(self.refresh_interval)
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlparse(self.path)
+                if url.path != "/deck":
+                    self.send_error(404)
+                    return
+                try:
+                    since = int(parse_qs(url.query).get("since", ["0"])[0])
+                except ValueError:
+                    since = 0
+                with server._lock:
+                    server.stats["requests"] += 1
+                    ready = server.version > 0
+                    if not ready:
+                        server.stats["not_ready"] += 1
+                if not ready:
+                    self.send_response(503)
+                    self.send_header("Retry-After", str(NOT_READY_RETRY))
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                bundle = server.delta(since)
+                if bundle is None:
+                    with server._lock:
+                        server.stats["not_modified"] += 1
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                with server._lock:
+                    server.stats["slides_sent"] += len(BundleReader(bundle).entries)
+                    server.stats["bytes_sent"] += len(bundle)
+                self.send_response(200)
+                self.send_header("Content-Type", BUNDLE_MIME)
+                self.send_header("Content-Length", str(len(bundle)))
+                self.end_headers()
+                self.wfile.write(bundle)
+
+            def log_message(self, fmt, *args):
+                pass
+
+        return Handler
+
+    def serve(self, address=("0.0.0.0", DEFAULT_PORT)):
+        """Start refreshing and serve until stop().
+
+        *address* is a ``(host, port)`` tuple or a Unix socket path.
+        """
+        if isinstance(address, str):
+            if os.path.exists(address):
+                os.unlink(address)
+            self._httpd = _UnixHTTPServer(address, self._make_handler())
+        else:
+            self._httpd = _TCPHTTPServer(address, self._make_handler())
+        threading.Thread(target=self._refresh_loop, daemon=True).start()
+        self._httpd.serve_forever()
+
+    def stop(self):
+        self._stop.set()
+        if getattr(self, "_httpd", None):
+            self._httpd.shutdown()
+            self._httpd.server_close()
+
+
+# A whole room of displays may pull in the same second; the default listen
+# backlog of 5 makes Unix-socket connects fail with EAGAIN under a burst
+LISTEN_BACKLOG = 128
+
+
+class _TCPHTTPServer(ThreadingHTTPServer):
+    request_queue_size = LISTEN_BACKLOG
+
+
+class _UnixHTTPServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+    request_queue_size = LISTEN_BACKLOG
+
+    def get_request(self):
+        # BaseHTTPRequestHandler expects a (host, port) client address
+        request, _ = super().get_request()
+        return request, ("local", 0)
+
+
+# ── thin client ───────────────────────────────────────────────────────────────
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path, timeout):
+        super().__init__("localhost", timeout=timeout)
+        self._path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self._path)
+
+
+class DeckClient:
+    """Pulls deck deltas from a DeckServer; ``fetch_slides`` is a slide function.
+
+    *url* is ``http://host:port`` or ``unix:///path/to/socket``.  If the
+    server can't be reached the last deck received is shown again; before
+    any deck has arrived a failed pull raises, so the refresh counts as
+    failed instead of installing an empty deck.
+    """
+
+    def __init__(self, url, timeout=5):
+        self.url = url
+        self.timeout = timeout
+        self.version = 0
+        self._order = []
+        self._slides = {}          # hash -> decoded slide
+        self.bytes_received = 0
+
+    def _connection(self):
+        parsed = urlparse(self.url)
+        if parsed.scheme == "unix":
+            return _UnixHTTPConnection(unquote(parsed.path), self.timeout)
+        return http.client.HTTPConnection(parsed.hostname, parsed.port or DEFAULT_PORT,
+                                          timeout=self.timeout)
+
+    def pull(self):
+        """Fetch changes since our version; returns True if the deck changed."""
+        conn = self._connection()
+        try:
+            conn.request("GET", f"/deck?since={self.version}")
+            resp = conn.getresponse()
+            body = resp.read()
+        finally:
+            conn.close()
+        if resp.status == 304:
+            return False
+        if resp.status == 503:
+            raise DeckNotReady("deck server has not published a deck yet")
+        if resp.status != 200:
+            raise RuntimeError(f"deck server returned {resp.status}")
+
+        self.bytes_received += len(body)
+        bundle = BundleReader(body)
+        for h in bundle.entries:
+            self._slides[h] = bundle.slide(h)
+        self._order = [h for h in bundle.order if h in self._slides]
+        # Forget slides no longer in the deck
+        self._slides = {h: self._slides[h] for h in self._order}
+        self.version = bundle.version
+        return True
+
+    def fetch_slides(self):
+        try:
+            self.pull()
+        except Exception as e:
+            if not self.version:
+                raise
+            print(f"[DeckClient] Pull failed, keeping version {self.version}: {e}")
+        # Fresh dicts each time; the handler may annotate its slides
+        return [dict(self._slides[h]) for h in self._order]
@@ -0,0 +1,163 @@
+# display_output.py
+"""
+Dedicated panel-output thread with a one-slot "latest frame wins" mailbox.
+
+Producers hand frames to ``submit`` and return at once; the output thread
+does the RGB565 conversion and the blocking SPI transfer.  If a frame is
+still waiting when a newer one arrives, the old one is dropped (partial
+updates are merged, since the newer image already holds their pixels),
+and a full frame being transferred is abandoned between chunks as soon
+as something newer is waiting.
+"""
+import threading
+
+import numpy as np
+
+# Bytes per SPI write (matches st7789.display)
+SPI_CHUNK = 4096
+
+
+def image_to_rgb565(img):
+    """Convert an RGB PIL image to big-endian RGB565 bytes for the ST7789."""
+    arr = np.asarray(img, dtype=np.uint16)
+    rgb565 = ((arr[..., 0] & 0xF8) << 8) | ((arr[..., 1] & 0xFC) << 3) | (arr[..., 2] >> 3)
+    return rgb565.astype(">u2").tobytes()
+
+
+class Frame:
+    """A finished slide: a PIL image plus its RGB565 bytes for SPI."""
+
+    __slots__ = ("image", "rgb565")
+
+    def __init__(self, image, rgb565):
+        self.image = image
+        self.rgb565 = rgb565
+
+
+def merge_rows(boxes):
+    """Merge pixel boxes ``(x0, y0, x1, y1)`` on the same row band into one."""
+    rows = {}
+    for x0, y0, x1, y1 in boxes:
+        key = (y0, y1)
+        if key in rows:
+            rx0, rx1 = rows[key]
+            rows[key] = (min(rx0, x0), max(rx1, x1))
+        else:
+            rows[key] = (x0, x1)
+    return [(x0, y0, x1, y1) for (y0, y1), (x0, x1) in rows.items()]
+
+
+class DisplayOutput:
+    def __init__(self, disp, width=320, height=240):
+        self.disp = disp
+        self.width = width
+        self.height = height
+        # Drivers without set_window/data only take whole frames
+        self.partial = hasattr(disp, "set_window") and hasattr(disp, "data")
+
+        self._cond = threading.Condition()
+        self._slot = None          # (image, boxes or None, stale or None, rgb565 or None)
+        self._running = True
+        self.presented = 0
+        self.dropped = 0
+        self.aborted = 0
+        self.pixels = 0
+
+        self._thread = threading.Thread(target=self._loop, daemon=True,
+                                        name="display-output")
+        self._thread.start()
+
+    def submit(self, img, boxes=None, stale=None, rgb565=None):
+        """Queue *img* for the panel without waiting for SPI.
+
+        *boxes* limits the transfer to those regions (None = whole frame).
+        *stale* is an optional callable; once it returns True the frame is
+        skipped or its transfer abandoned.  *rgb565* is the whole frame
+        already converted (e.g. pre-rendered), used as-is.  The image is
+        copied, so the caller may keep drawing on it.  Returns the pixel
+        count queued.
+        """
+        full = boxes is None or not self.partial
+        frame_boxes = None if full else merge_rows(boxes)
+        with self._cond:
+            if self._slot is not None:
+                self.dropped += 1
+                pending_boxes = self._slot[1]
+                if frame_boxes is not None:
+                    # A waiting full frame stays full; partials accumulate
+                    frame_boxes = None if pending_boxes is None \
+                        else merge_rows(pending_boxes + frame_boxes)
+            if frame_boxes is not None:
+                rgb565 = None
+            self._slot = (img.copy(), frame_boxes, stale, rgb565)
+            self._cond.notify()
+        if frame_boxes is None:
+            return self.width * self.height
+        return sum((x1 - x0) * (y1 - y0) for x0, y0, x1, y1 in frame_boxes)
+
+    def _take(self):
+        with self._cond:
+            while self._slot is None and self._running:
+                self._cond.wait()
+            frame, self._slot = self._slot, None
+            return frame
+
+    def _newer_waiting(self):
+        return self._slot is not None and self._slot[1] is None
+
+    def _loop(self):
+        while self._running:
+            frame = self._take()
+            if frame is None:
+                continue
+            img, boxes, stale, rgb565 = frame
+            if stale and stale():
+                self.dropped += 1
+                continue
+            try:
+                if self._push(img, boxes, stale, rgb565):
+                    self.presented += 1
+                else:
+                    self.aborted += 1
+            except Exception as e:
+                print(f"[DisplayOutput] Push failed: {e}")
+
+    def _push(self, img, boxes, stale, rgb565=None):
+        """Transfer a frame; False if it was abandoned part-way."""
+        if not self.partial:
+            self.disp.display(img)
+            self.pixels += self.width * self.height
+            return True
+
+        full = boxes is None
+        for x0, y0, x1, y1 in boxes or [(0, 0, self.width, self.height)]:
+            x0, y0 = max(0, x0), max(0, y0)
+            x1, y1 = min(self.width, x1), min(self.height, y1)
+            if x1 <= x0 or y1 <= y0:
+                continue
+            if full and rgb565 is not None:
+                data = rgb565
+            else:
+                data = image_to_rgb565(img.crop((x0, y0, x1, y1)))
+            # Panel is driven at rotation 0, so image and panel coords agree
+            self.disp.set_window(x0, y0, x1 - 1, y1 - 1)
+            for i in range(0, len(data), SPI_CHUNK):
+                # Only whole frames are abandoned: a newer full frame
+                # repaints everything, but partial regions must land
+                if full and (self._newer_waiting() or (stale and stale())):
+                    self.pixels += i // 2
+                    return False
+                self.disp.data(list(data[i:i + SPI_CHUNK]))
+            self.pixels += (x1 - x0) * (y1 - y0)
+        return True
+
+    def stats(self):
+        with self._cond:
+            return {"presented": self.presented, "dropped": self.dropped,
+                    "aborted": self.aborted, "pixels": self.pixels}
+
+    def stop(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        self._thread.join(timeout=1.0)
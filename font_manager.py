@@ -0,0 +1,112 @@
+# font_manager.py
+"""
+Shared, pre-warmed TrueType fonts for every size the slides ask for.
+
+Slides may carry a ``font_size`` hint.  Rather than parse the TTF per
+slide, one FontManager loads a bounded set of sizes once at startup and
+caches their cell metrics and per-glyph advances.  Requests for sizes
+outside the set snap to the nearest loaded size.
+"""
+import threading
+
+from PIL import Image, ImageDraw, ImageFont
+
+FONT_PATH = "/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf"
+FONT_SIZES = tuple(range(8, 17))
+DEFAULT_SIZE = 16
+
+# Extra pixels between text lines (Pillow's multiline_text default)
+LINE_SPACING = 4
+
+# Top-left corner of rendered text, in pixels; the same margin is kept on
+# the right so boxed text stays on the panel
+TEXT_ORIGIN = (10, 10)
+
+# Glyphs measured up front: printable ASCII plus the box/bar characters
+_PREWARM_GLYPHS = ("".join(chr(c) for c in range(32, 127))
+                   + "┌┐└┘├┤│─█░…°—")
+
+
+class FontManager:
+    def __init__(self, path=FONT_PATH, sizes=FONT_SIZES, default_size=DEFAULT_SIZE):
+        self.path = path
+        self.sizes = tuple(sorted(set(sizes) | {default_size}))
+        self.default_size = default_size
+        self._lock = threading.Lock()
+        self._fonts = {}
+        self._cells = {}
+        self._advances = {}
+
+    def _load(self, size):
+        font = ImageFont.truetype(self.path, size)
+        probe = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+        self._cells[size] = (font.getlength("M"),
+                             probe.textbbox((0, 0), "A", font=font)[3] + LINE_SPACING)
+        self._advances[size] = {}
+        self._fonts[size] = font
+        return font
+
+    def prewarm(self):
+        """Load every size and measure the common glyphs; call once at startup."""
+        for size in self.sizes:
+            self.get(size)
+            for ch in _PREWARM_GLYPHS:
+                self.advance(size, ch)
+        return self
+
+    def nearest(self, size):
+        """The loaded size closest to *size* (the default for ``None``)."""
+        if not size:
+            return self.default_size
+        return min(self.sizes, key=lambda s: (abs(s - size), -s))
+
+    def get(self, size=None):
+        """The FreeTypeFont for *size*, snapped to the configured set."""
+        size = self.nearest(size)
+        font = self._fonts.get(size)
+        if font is None:
+            with self._lock:
+                font = self._fonts.get(size) or self._load(size)
+        return font
+
+    @property
+    def default(self):
+        return self.get(self.default_size)
+
+    def cell_size(self, size=None):
+        """(width, height) in pixels of one character cell at *size*."""
+        size = self.nearest(size)
+        if size not in self._cells:
+            self.get(size)
+        return self._cells[size]
+
+    def advance(self, size, text):
+        """Advance width of *text* in pixels, summed from cached glyph widths."""
+        size = self.nearest(size)
+        font = self.get(size)
+        advances = self._advances[size]
+        total = 0.0
+        for ch in text:
+            width = advances.get(ch)
+            if width is None:
+                width = advances[ch] = font.getlength(ch)
+            total += width
+        return total
+
+
+_fonts = None
+
+
+def configure_fonts(path=FONT_PATH, sizes=FONT_SIZES, default_size=DEFAULT_SIZE):
+    """Create and pre-warm the process-wide FontManager."""
+    global _fonts
+    _fonts = FontManager(path, sizes, default_size).prewarm()
+    return _fonts
+
+
+def get_fonts():
+    """The process-wide FontManager (default configuration if none was set)."""
+    global _fonts
+    if _fonts is None:
+        _fonts = FontManager()
+    return _fonts
@@ -1 +1,22 @@
-from .slides import get_inaturalist_slides
+# inaturalist_module/__init__.py
+import importlib
+
+# Read by ProviderRegistry.add_module; see providers.Provider
+PROVIDER = {
+    "name": "inaturalist",
+    "entry": "inaturalist_module.slides:get_inaturalist_slides",
+    "ttl": 900,
+    "timeout": 60,
+    "needs": ("location",),
+    "args": ("latitude", "longitude"),
+}
+
+# Exported lazily so importing the package for PROVIDER stays cheap
+_EXPORTS = {"get_inaturalist_slides": ".slides"}
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
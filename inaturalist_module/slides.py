@@ -1,12 +1,12 @@
 # inaturalist_module/slides.py
-import requests
+import circuit_breaker
 from datetime import datetime, timedelta
-from ascii_presenter import AsciiPresenter, MODULE_BANNERS, MODULE_COLORS
+from ascii_presenter import get_presenter, MODULE_BANNERS, MODULE_COLORS
 from .config import DAYS_BACK, RADIUS_KM, MAX_RESULTS
 from .utils import group_and_sort_observations
 from slideshow_handler import fetch_and_fit_image
 
-presenter = AsciiPresenter()
+presenter = get_presenter()
 
 _INAT_COLOR  = MODULE_COLORS["inaturalist"]
 _INAT_BANNER = MODULE_BANNERS["inaturalist"]
@@ -34,7 +34,7 @@ def get_inaturalist_slides(latitude, longitude):
     }
 
     try:
-        resp = requests.get(obs_url, params=obs_params, timeout=10)
+        resp = circuit_breaker.get(obs_url, params=obs_params, timeout=10)
         resp.raise_for_status()
         data = resp.json().get("results", [])
     except Exception:
@@ -1,4 +1,4 @@
-import requests
+import circuit_breaker
 from datetime import datetime
 from collections import defaultdict
 from .config import ICONIC_PRIORITY
@@ -12,7 +12,7 @@ def get_taxon_names(taxon_id):
         return taxon_cache[taxon_id]
     taxon_url = f"https://api.inaturalist.org/v1/taxa/{taxon_id}"
     try:
-        r = requests.get(taxon_url, timeout=10)
+        r = circuit_breaker.get(taxon_url, timeout=10)
         r.raise_for_status()
         tdata = r.json().get("results", [])
         if tdata:
@@ -29,32 +29,6 @@ def get_taxon_names(taxon_id):
     taxon_cache[taxon_id] = ("Unknown", [])
     return "Unknown", []
 
-def wrap_text_into_slides(text, max_chars=30, max_lines_per_slide=8):
-    """Wrap text to max_chars per line, split into slides if > max_lines_per_slide."""
-    paragraphs = text.split("\n")
-    wrapped_lines = []
-
-    for para in paragraphs:
-        words = para.split()
-        current_line = []
-        current_len = 0
-        for word in words:
-            if current_len + len(word) + (1 if current_line else 0) > max_chars:
-                wrapped_lines.append(" ".join(current_line))
-                current_line = [word]
-                current_len = len(word)
-            else:
-                current_line.append(word)
-                current_len += len(word) + (1 if current_line else 0)
-        if current_line:
-            wrapped_lines.append(" ".join(current_line))
-        if not para.strip():
-            wrapped_lines.append("")
-
-    slides = []
-    for i in range(0, len(wrapped_lines), max_lines_per_slide):
-        slides.append("\n".join(wrapped_lines[i:i + max_lines_per_slide]))
-    return slides
 
 def group_and_sort_observations(data):
     """Group observations by iconic taxon and sort them by priority."""
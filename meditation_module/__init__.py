@@ -1 +1,20 @@
-from .slides import get_meditation_slides
+# meditation_module/__init__.py
+import importlib
+
+# Read by ProviderRegistry.add_module; see providers.Provider
+PROVIDER = {
+    "name": "meditation",
+    "entry": "meditation_module.slides:get_meditation_slides",
+    "ttl": 0,
+    "timeout": 30,
+}
+
+# Exported lazily so importing the package for PROVIDER stays cheap
+_EXPORTS = {"get_meditation_slides": ".slides"}
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
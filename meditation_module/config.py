@@ -1,6 +1,19 @@
 # API Endpoints
 ZEN_API_URL = "https://zenquotes.io/api/random"
+ZEN_BATCH_URL = "https://zenquotes.io/api/quotes"   # 50 quotes per call
 STOIC_API_URL = "https://stoic.tekloon.net/stoic-quote"
 
 # Wrapping configuration
 WRAP_WIDTH = 32
+
+# Local quote pool (see pool.py)
+POOL_FILE = "quote_pool.json"
+POOL_REFILL_THRESHOLD = 5    # refill a pool once it holds fewer quotes than this
+STOIC_BATCH_SIZE = 8         # the stoic API has no batch endpoint: calls made per refill
+RECENT_HISTORY = 200         # quotes remembered so they aren't shown again soon
+REFILL_BACKOFF_MIN = 60      # seconds before retrying a refill that fetched nothing
+REFILL_BACKOFF_MAX = 3600
+REQUEST_TIMEOUT = 10
+
+# Quote box fitting (see layout.py); candidate font sizes come from font_manager
+SCREEN_PX = (320, 240)
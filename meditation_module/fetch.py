@@ -1,10 +1,13 @@
 import requests
-from .config import ZEN_API_URL, STOIC_API_URL
+import circuit_breaker
+from concurrent.futures import ThreadPoolExecutor
+from .config import (ZEN_API_URL, ZEN_BATCH_URL, STOIC_API_URL, STOIC_BATCH_SIZE,
+                     REQUEST_TIMEOUT)
 
 def fetch_quote(api_url, quote_type=None):
     """Fetch a quote from the given API."""
     try:
-        response = requests.get(api_url, timeout=10)
+        response = circuit_breaker.get(api_url, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
         data = response.json()
 
@@ -22,4 +25,27 @@ def fetch_zen_quote():
     return fetch_quote(ZEN_API_URL)
 
 def fetch_stoic_quote():
-    return fetch_quote(STOIC_API_URL, quote_type="stoic")
\ No newline at end of file
+    return fetch_quote(STOIC_API_URL, quote_type="stoic")
+
+def fetch_zen_batch():
+    """Fetch zenquotes' batch of 50 in one call; [] on failure."""
+    try:
+        response = circuit_breaker.get(ZEN_BATCH_URL, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        return [(d['q'], d['a']) for d in response.json() if d.get('q')]
+    except (requests.RequestException, ValueError, KeyError, TypeError) as e:
+        print(f"Error fetching zen batch: {e}")
+        return []
+
+def fetch_stoic_batch(count=STOIC_BATCH_SIZE):
+    """The stoic API serves one quote per call, so make *count* calls in parallel."""
+    def _one(_):
+        try:
+            return fetch_stoic_quote()
+        except (ValueError, KeyError, TypeError) as e:
+            print(f"Error parsing stoic quote: {e}")
+            return None, None
+
+    with ThreadPoolExecutor(max_workers=min(count, 4)) as pool:
+        results = list(pool.map(_one, range(count)))
+    return [(q, a) for q, a in results if q]
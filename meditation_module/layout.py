@@ -0,0 +1,94 @@
+# meditation_module/layout.py
+"""
+Box-fitting solver for quote slides.
+
+Every font size gives a character grid that fills the panel.  Smaller
+fonts give bigger grids, so "does the quote fit" is monotone in the font
+size and the largest size that fits is found by binary search.  Line
+counts come straight from word lengths (the font is monospaced), and the
+chosen size is confirmed with one real text_layout wrap.  Results are
+cached per text.
+"""
+from functools import lru_cache
+
+from .config import SCREEN_PX
+from ascii_presenter import get_presenter
+from font_manager import get_fonts, TEXT_ORIGIN
+
+# Box rows that aren't body text: top, title, divider, bottom
+_FRAME_ROWS = 4
+# "│ " + text + "│" (plus one spare column, as AsciiPresenter._wrap does)
+_FRAME_COLS = 4
+
+
+@lru_cache(maxsize=None)
+def grid_for(font_size):
+    """(columns, rows) of characters that fill the panel at *font_size*."""
+    cell_w, cell_h = get_fonts().cell_size(font_size)
+    # Text starts at TEXT_ORIGIN and keeps the same margin on the right, so
+    # the box's right border stays on the panel
+    cols = (SCREEN_PX[0] - 2 * TEXT_ORIGIN[0]) // cell_w
+    return int(cols), int((SCREEN_PX[1] - TEXT_ORIGIN[1]) // cell_h)
+
+
+def count_lines(text, width):
+    """Lines a greedy *width*-column wrap produces for *text*, from word lengths."""
+    total = 0
+    for para in text.split("\n"):
+        lengths = [len(w) for w in para.split()]
+        if not lengths:
+            total += 1
+            continue
+        lines, used = 1, -1          # used == -1: nothing on the line yet
+        for length in lengths:
+            if length > width:
+                # Long words start a fresh line and are split into full pieces
+                if used >= 0:
+                    lines += 1
+                while length > width:
+                    lines += 1
+                    length -= width
+                used = length
+            elif used < 0:
+                used = length
+            elif used + 1 + length <= width:
+                used += 1 + length
+            else:
+                lines += 1
+                used = length
+        total += lines
+    return total
+
+
+def _fits(text, font_size, banner_rows):
+    cols, rows = grid_for(font_size)
+    return count_lines(text, cols - _FRAME_COLS) + banner_rows <= rows - _FRAME_ROWS
+
+
+@lru_cache(maxsize=64)
+def solve(text, has_banner=False):
+    """Return ``(width, height, font_size)`` of the largest font that fits *text*.
+
+    Falls back to the smallest font (text truncated) when nothing fits.
+    """
+    banner_rows = 2 if has_banner else 0
+    sizes = sorted(get_fonts().sizes, reverse=True)
+
+    # sizes[lo] is the best candidate; fitting is monotone along the list
+    lo, hi = 0, len(sizes) - 1
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if _fits(text, sizes[mid], banner_rows):
+            hi = mid
+        else:
+            lo = mid + 1
+
+    # Confirm with the real wrapper at that size
+    for size in sizes[lo:]:
+        cols, rows = grid_for(size)
+        wrapped = get_presenter(cols, rows, size)._wrap(text)
+        if len(wrapped) + banner_rows <= rows - _FRAME_ROWS:
+            return cols, rows, size
+    cols, rows = grid_for(sizes[-1])
+    return cols, rows, sizes[-1]
+
@@ -0,0 +1,126 @@
+# meditation_module/pool.py
+"""
+On-disk pool of quotes, filled in bulk and drawn from one at a time.
+
+Each source ("zen", "stoic") keeps a queue of unseen quotes plus a bounded
+list of recently shown ones.  A draw only touches the network when the
+queue has dropped below POOL_REFILL_THRESHOLD, so most refreshes are
+served locally even while zenquotes is rate-limiting us.  A refill that
+fetches nothing isn't retried until a back-off has passed (doubling, from
+REFILL_BACKOFF_MIN to REFILL_BACKOFF_MAX), so an outage doesn't turn
+every draw into another batch fetch.
+"""
+import os
+import json
+import random
+import hashlib
+import threading
+import time
+
+from .config import (POOL_FILE, POOL_REFILL_THRESHOLD, RECENT_HISTORY,
+                     REFILL_BACKOFF_MIN, REFILL_BACKOFF_MAX)
+from .fetch import fetch_zen_batch, fetch_stoic_batch
+
+# source name -> bulk fetcher returning [(quote, author), ...]
+SOURCES = {
+    "zen": fetch_zen_batch,
+    "stoic": fetch_stoic_batch,
+}
+
+
+def _quote_key(quote):
+    normalized = " ".join(quote.lower().split())
+    return hashlib.sha1(normalized.encode()).hexdigest()[:16]
+
+
+class QuotePool:
+    def __init__(self, path=POOL_FILE, sources=None):
+        self.path = path
+        self.sources = sources or SOURCES
+        self._lock = threading.Lock()
+        self._state = self._load()
+        self._backoff = {}         # source -> seconds of the last back-off
+        self._retry_at = {}        # source -> monotonic time refills resume
+
+    def _load(self):
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r") as f:
+                    return json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"[meditation_module] Ignoring unreadable quote pool: {e}")
+        return {}
+
+    def _save(self):
+        try:
+            with open(self.path, "w") as f:
+                json.dump(self._state, f, separators=(",", ":"))
+        except OSError as e:
+            print(f"[meditation_module] Failed to save quote pool: {e}")
+
+    def _entry(self, source):
+        return self._state.setdefault(source, {"queue": [], "recent": []})
+
+    def refill(self, source):
+        """Fetch a batch for *source* and queue every quote not already known."""
+        try:
+            fetched = self.sources[source]()
+        except Exception as e:
+            print(f"[meditation_module] Refilling {source} failed: {e}")
+            fetched = []
+        with self._lock:
+            if not fetched:
+                backoff = min(REFILL_BACKOFF_MAX,
+                              max(REFILL_BACKOFF_MIN, self._backoff.get(source, 0) * 2))
+                self._backoff[source] = backoff
+                self._retry_at[source] = time.monotonic() + backoff
+                print(f"[meditation_module] No {source} quotes fetched, "
+                      f"next refill in {backoff:.0f}s")
+                return 0
+            self._backoff.pop(source, None)
+            self._retry_at.pop(source, None)
+            entry = self._entry(source)
+            known = set(entry["recent"]) | {_quote_key(q) for q, _ in entry["queue"]}
+            added = 0
+            random.shuffle(fetched)
+            for quote, author in fetched:
+                key = _quote_key(quote)
+                if key not in known:
+                    known.add(key)
+                    entry["queue"].append([quote, author])
+                    added += 1
+            self._save()
+        return added
+
+    def draw(self, source):
+        """Next unseen ``(quote, author)`` for *source*, or ``(None, None)``."""
+        with self._lock:
+            low = len(self._entry(source)["queue"]) < POOL_REFILL_THRESHOLD
+            due = time.monotonic() >= self._retry_at.get(source, 0.0)
+        if low and due:
+            self.refill(source)
+
+        with self._lock:
+            entry = self._entry(source)
+            if not entry["queue"]:
+                return None, None
+            quote, author = entry["queue"].pop(0)
+            entry["recent"].append(_quote_key(quote))
+            del entry["recent"][:-RECENT_HISTORY]
+            self._save()
+            return quote, author
+
+    def sizes(self):
+        with self._lock:
+            return {source: len(self._entry(source)["queue"]) for source in self.sources}
+
+
+_pool = None
+
+
+def get_pool():
+    """The process-wide quote pool, loaded from disk on first use."""
+    global _pool
+    if _pool is None:
+        _pool = QuotePool()
+    return _pool
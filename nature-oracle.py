@@ -1,19 +1,14 @@
 import os
 os.environ["ST7789_GPIO"] = "lgpio"
 
-import time
-import requests
 import st7789
-from PIL import ImageFont
 from threading import Thread
 from rotary_encoder import RotaryEncoder
 from slideshow_handler import SlideshowHandler
-
-from inaturalist_module import get_inaturalist_slides
-from weather_module import get_weather_slides
-from meditation_module import get_meditation_slides
-from neo_module import get_neo_slides
-from climate_module import get_climate_slides
+from ascii_presenter import make_live_slides
+from font_manager import configure_fonts
+from deck_server import DeckServer, DeckClient, DEFAULT_PORT
+from providers import ProviderRegistry
 
 # === CONFIGURATION ===
 SCREEN_WIDTH, SCREEN_HEIGHT = 320, 240
@@ -21,24 +16,43 @@ TEXT_DISPLAY_TIME = 3
 IMAGE_DISPLAY_TIME = 5
 REFRESH_INTERVAL = 900
 
+# Provider packages, in slide order; each declares itself in its __init__.
+# Set ORACLE_DISABLED_PROVIDERS=neo_module,inaturalist_module (say) to skip
+# some: they are never imported.
+PROVIDER_MODULES = ["weather_module", "neo_module", "climate_module",
+                    "meditation_module", "inaturalist_module"]
+DISABLED_PROVIDERS = set(filter(None, os.environ.get("ORACLE_DISABLED_PROVIDERS", "").split(",")))
+
+# standalone: fetch and display (default)
+# server:     fetch once for the whole site and publish the deck, no display
+# client:     display the deck pulled from ORACLE_DECK_SERVER, no providers
+ORACLE_MODE = os.environ.get("ORACLE_MODE", "standalone")
+DECK_SERVER = os.environ.get("ORACLE_DECK_SERVER", f"http://oracle-hub.local:{DEFAULT_PORT}")
+
 # === INIT DISPLAY ===
-disp = st7789.ST7789(
-    height=SCREEN_HEIGHT,
-    width=SCREEN_WIDTH,
-    rotation=0,
-    port=0,
-    cs=0,
-    dc=25,
-    rst=27,
-    spi_speed_hz=80_000_000
-)
-disp.begin()
+if ORACLE_MODE != "server":
+    disp = st7789.ST7789(
+        height=SCREEN_HEIGHT,
+        width=SCREEN_WIDTH,
+        rotation=0,
+        port=0,
+        cs=0,
+        dc=25,
+        rst=27,
+        spi_speed_hz=80_000_000
+    )
+    disp.begin()
 
 # === FONT ===
-font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf", 16)
+# Every size a slide may ask for is loaded and measured once, here
+fonts = configure_fonts("/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf",
+                        sizes=range(8, 17), default_size=16)
+font = fonts.default
 
-# === LOCATION HANDLER ===
+# === DEPENDENCIES ===
+# Resolved on first need by a provider, on the refresh's provider threads
 def get_current_location():
+    import requests
     try:
         r = requests.get("https://ipinfo.io/json", timeout=5)
         data = r.json()
@@ -54,53 +68,66 @@ def get_current_location():
         print(f"Could not determine location: {e}")
         return 44.5161, -88.0903, "Unknown City", "Unknown State"
 
-# === INITIALIZE LOCATION DATA ===
-latitude, longitude, city, region = get_current_location()
-print(f"Using location: {city}, {region} ({latitude}, {longitude})")
+def location():
+    latitude, longitude, city, region = get_current_location()
+    print(f"Using location: {city}, {region} ({latitude}, {longitude})")
+    return {"latitude": latitude, "longitude": longitude, "city": city, "region": region}
 
-# === SAFE WRAPPER ===
-def safe_slide(func):
-    """Wrap slide function so exceptions return an error slide."""
-    def wrapper():
-        try:
-            return func()
-        except Exception as e:
-            return [{"type": "text", "content": f"[ERROR] {e}"}]
-    return wrapper
+def timezone():
+    # timezone_config looks the zone up over the network when imported
+    from timezone_config import LOCAL_TZ
+    return {"tz": LOCAL_TZ}
 
 # === SLIDE FUNCTIONS ===
 def welcome_slide():
     return [{"type": "text", "content": "Welcome"}]
 
-def location_slide():
+def location_slide(city, region):
     from datetime import datetime
-    now = datetime.now()
 
-    line1 = f"{city}, {region}, Earth"
-    line2 = f"{now.day} {now.strftime('%B')} {now.year},"
-    line3 = f"Anthropocene Epoch"
-
-    return [{"type": "text", "content": f"{line1}\n{line2}\n{line3}"}]
-
-# Weather slide wrapped in a lambda to pass lat/lon
-weather_slide_func = lambda: get_weather_slides(latitude, longitude)
-
-slide_functions = [
-     safe_slide(welcome_slide),
-     safe_slide(location_slide),
-     safe_slide(weather_slide_func),        # Unified weather + season + event slides
-     safe_slide(get_neo_slides),
-     safe_slide(get_climate_slides),
-     safe_slide(get_meditation_slides),
-     safe_slide(lambda: get_inaturalist_slides(latitude, longitude))
+    def build():
+        now = datetime.now()
+        line1 = f"{city}, {region}, Earth"
+        line2 = f"{now.day} {now.strftime('%B')} {now.year},"
+        line3 = f"Anthropocene Epoch"
+        return [{"type": "text", "content": f"{line1}\n{line2}\n{line3}"}]
+
+    # Live so the date rolls over at midnight without a refresh
+    return make_live_slides(build)
+
+# === PROVIDER REGISTRY ===
+# Errors and overruns are handled by the refresh (last good slides, shown
+# as stale), so providers no longer need an error-slide wrapper
+registry = ProviderRegistry()
+registry.dependency("location", location)
+registry.dependency("timezone", timezone)
+registry.add("welcome", welcome_slide)
+registry.add("location", location_slide, needs=("location",), args=("city", "region"))
+for package in PROVIDER_MODULES:
+    registry.add_module(package, enabled=package not in DISABLED_PROVIDERS)
+
+slide_functions = registry.slide_functions()
+
+# === DECK SERVER / CLIENT ===
+if ORACLE_MODE == "server":
+    server = DeckServer(slide_functions, refresh_interval=REFRESH_INTERVAL,
+                        width=SCREEN_WIDTH, height=SCREEN_HEIGHT)
+    print(f"Serving decks on port {DEFAULT_PORT}")
+    try:
+        server.serve(("0.0.0.0", DEFAULT_PORT))
+    except KeyboardInterrupt:
+        server.stop()
+    raise SystemExit(0)
 
-]
+if ORACLE_MODE == "client":
+    slide_functions = [DeckClient(DECK_SERVER).fetch_slides]
 
 # === SLIDESHOW HANDLER ===
 slideshow = SlideshowHandler(
     slide_functions=slide_functions,
     disp=disp,
     font=font,
+    fonts=fonts,
     screen_width=SCREEN_WIDTH,
     screen_height=SCREEN_HEIGHT,
     text_display_time=TEXT_DISPLAY_TIME,
@@ -122,11 +149,11 @@ slideshow.show_splash(duration=2.5)
 slideshow_thread = Thread(target=slideshow.run, daemon=True)
 slideshow_thread.start()
 
-# Keep main thread alive for encoder
+# Keep main thread alive for encoder (blocks without waking until exit)
 try:
-    while True:
-        time.sleep(1)
+    slideshow_thread.join()
 except KeyboardInterrupt:
+    slideshow.stop()
     encoder.stop()
     # Clear display on exit
     from PIL import Image
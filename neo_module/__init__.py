@@ -1,3 +1,20 @@
-from .slides import get_neo_slides
+# neo_module/__init__.py
+import importlib
 
-__all__ = ["get_neo_slides"]
+# Read by ProviderRegistry.add_module; see providers.Provider
+PROVIDER = {
+    "name": "neo",
+    "entry": "neo_module.slides:get_neo_slides",
+    "ttl": 900,
+    "timeout": 30,
+}
+
+# Exported lazily so importing the package for PROVIDER stays cheap
+_EXPORTS = {"get_neo_slides": ".slides", "nasa_scheduler": ".ratelimit", "RateLimited": ".ratelimit"}
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
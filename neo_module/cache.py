@@ -1,19 +1,47 @@
 import os
 import json
 from datetime import datetime, timedelta
-from .config import CACHE_FILE, LAST_FETCH_FILE
+from .config import CACHE_FILE, LAST_FETCH_FILE, DONKI_STATE_FILE
+from .snapshot import pack, unpack, parse_feed
+
+# (mtime, data) of the last cache file read, so repeat loads skip the parse
+_loaded = None
+
 
 def load_cache():
-    if os.path.exists(CACHE_FILE):
-        with open(CACHE_FILE, "r") as f:
-            return json.load(f)
-    return None
+    """Load the cached snapshot as ``{"asteroids": [Asteroid], ...}``.
+
+    Older caches holding the raw NeoWs feed under "neo" are converted
+    on the fly.
+    """
+    global _loaded
+    if not os.path.exists(CACHE_FILE):
+        return None
+    mtime = os.path.getmtime(CACHE_FILE)
+    if _loaded is not None and _loaded[0] == mtime:
+        return _loaded[1]
+
+    with open(CACHE_FILE, "r") as f:
+        data = json.load(f)
+
+    asteroids = unpack(data.get("asteroids"))
+    if asteroids is None:
+        raw = data.pop("neo", None)
+        asteroids = parse_feed(raw) if raw else []
+    data["asteroids"] = asteroids
+
+    _loaded = (mtime, data)
+    return data
 
 def save_cache(data):
+    global _loaded
+    out = dict(data)
+    out["asteroids"] = pack(data.get("asteroids", []))
     with open(CACHE_FILE, "w") as f:
-        json.dump(data, f, indent=2)
+        json.dump(out, f, separators=(",", ":"))
     with open(LAST_FETCH_FILE, "w") as f:
         f.write(datetime.now().isoformat())
+    _loaded = (os.path.getmtime(CACHE_FILE), data)
 
 def should_fetch():
     if not os.path.exists(LAST_FETCH_FILE):
@@ -21,3 +49,17 @@ def should_fetch():
     with open(LAST_FETCH_FILE, "r") as f:
         last_fetch_time = datetime.fromisoformat(f.read().strip())
     return datetime.now() - last_fetch_time > timedelta(hours=1)
+
+def load_donki_state():
+    """Per event type: the last day fetched and the events already seen."""
+    if os.path.exists(DONKI_STATE_FILE):
+        try:
+            with open(DONKI_STATE_FILE, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[neo_module] Ignoring unreadable DONKI state: {e}")
+    return {}
+
+def save_donki_state(state):
+    with open(DONKI_STATE_FILE, "w") as f:
+        json.dump(state, f, separators=(",", ":"))
@@ -5,3 +5,28 @@ LAST_FETCH_FILE = "space_last_fetch.txt"
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 METEOR_IMAGE_PATH = os.path.join(BASE_DIR, "meteor.png")
+
+# Harmless asteroids kept in the snapshot (all hazardous ones are kept)
+NON_HAZARDOUS_LIMIT = 3
+
+# DONKI space-weather feeds, fetched in parallel
+DONKI_EVENT_TYPES = ["GST", "FLR", "CME", "SEP", "IPS"]
+DONKI_EVENT_NAMES = {
+    "GST": "Geomagnetic Storm",
+    "FLR": "Solar Flare",
+    "CME": "Coronal Mass Ejection",
+    "SEP": "Solar Energetic Particles",
+    "IPS": "Interplanetary Shock",
+}
+DONKI_WINDOW_DAYS = 3        # events are shown from +/- this many days
+DONKI_STATE_FILE = "donki_state.json"
+REQUEST_TIMEOUT = 10         # per HTTP request, seconds
+DONKI_TIMEOUT = 15           # for the whole parallel DONKI fetch, seconds
+
+# api.nasa.gov quota handling (see ratelimit.py)
+NASA_HOURLY_LIMIT = 1000     # requests per hour for a personal API key
+NASA_QUOTA_RESERVE = 50      # tokens left for other devices on the key (at most 10% of it)
+NASA_COALESCE_TTL = 60       # identical requests within this many seconds share a response
+NASA_BACKOFF_MIN = 60        # first back-off after a 429, seconds
+NASA_BACKOFF_MAX = 3600
+NASA_QUOTA_FILE = "nasa_quota.json"
@@ -1,27 +1,100 @@
-import requests
-from datetime import datetime, timedelta
+import json
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, date
 from secrets import NASA_API_KEY
+from .config import (DONKI_EVENT_TYPES, DONKI_WINDOW_DAYS, REQUEST_TIMEOUT,
+                     DONKI_TIMEOUT)
+from .cache import load_donki_state, save_donki_state
+from .snapshot import parse_feed
+from .ratelimit import nasa_scheduler
+
+DONKI_BASE_URL = "https://api.nasa.gov/DONKI"
 
 def fetch_neo_data():
     start_date = datetime.now().strftime("%Y-%m-%d")
     end_date = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
-    url = f"https://api.nasa.gov/neo/rest/v1/feed?start_date={start_date}&end_date={end_date}&api_key={NASA_API_KEY}"
-    r = requests.get(url)
-    r.raise_for_status()
-    return {"neo": r.json()}
+    r = nasa_scheduler.get(
+        "https://api.nasa.gov/neo/rest/v1/feed",
+        params={"start_date": start_date, "end_date": end_date, "api_key": NASA_API_KEY},
+        timeout=REQUEST_TIMEOUT,
+    )
+    return {"asteroids": parse_feed(r.json())}
+
+def _event_time(event):
+    return (event.get("startTime") or event.get("beginTime")
+            or event.get("eventTime") or event.get("time21_5") or "")
+
+def _event_id(event_type, event):
+    # CME/IPS use activityID; GST/FLR/SEP carry their own <type>ID.  Anything
+    # else is told apart by its body: many events share (or lack) a time
+    event_id = event.get("activityID") or event.get(f"{event_type.lower()}ID")
+    if event_id:
+        return event_id
+    body = json.dumps(event, sort_keys=True, default=str).encode()
+    return f"{event_type}-{hashlib.sha1(body).hexdigest()[:12]}"
+
+def _fetch_donki_type(event_type, start_date, end_date):
+    r = nasa_scheduler.get(
+        f"{DONKI_BASE_URL}/{event_type}",
+        params={"startDate": f"{start_date:%Y-%m-%d}", "endDate": f"{end_date:%Y-%m-%d}",
+                "api_key": NASA_API_KEY},
+        timeout=REQUEST_TIMEOUT,
+    )
+    # DONKI answers "no events" with an empty body rather than []
+    return r.json() if r.text.strip() else []
 
 def fetch_donki_data():
-    start_date = (datetime.now() - timedelta(days=3)).strftime("%Y-%m-%d")
-    end_date = (datetime.now() + timedelta(days=3)).strftime("%Y-%m-%d")
-    base_url = "https://api.nasa.gov/DONKI"
+    """Fetch every DONKI event type in parallel, incrementally.
+
+    Each type remembers the events it has already seen and the last day it
+    fetched, so a refresh only asks for the days since then.  A type that
+    fails or overruns DONKI_TIMEOUT keeps the events it already had.
+    """
+    today = datetime.now().date()
+    window_start = today - timedelta(days=DONKI_WINDOW_DAYS)
+    window_end = today + timedelta(days=DONKI_WINDOW_DAYS)
+    state = load_donki_state()
+
+    pool = ThreadPoolExecutor(max_workers=len(DONKI_EVENT_TYPES))
+    futures = {}
+    for event_type in DONKI_EVENT_TYPES:
+        start = window_start
+        fetched_through = state.get(event_type, {}).get("fetched_through")
+        if fetched_through:
+            start = max(window_start, date.fromisoformat(fetched_through))
+        futures[pool.submit(_fetch_donki_type, event_type, start, window_end)] = event_type
+    done, _ = wait(futures, timeout=DONKI_TIMEOUT)
+    # Don't let a hung request hold up the refresh; its thread ends on its own timeout
+    pool.shutdown(wait=False, cancel_futures=True)
+
     events = {}
-    for event_type in ["GST", "FLR"]:
-        url = f"{base_url}/{event_type}?startDate={start_date}&endDate={end_date}&api_key={NASA_API_KEY}"
-        try:
-            r = requests.get(url)
-            r.raise_for_status()
-            events[event_type] = r.json()
-        except Exception as e:
-            print(f"Failed to fetch {event_type}: {e}")
-            events[event_type] = []
+    for future, event_type in futures.items():
+        entry = state.setdefault(event_type, {"events": {}})
+        seen = entry.setdefault("events", {})
+        if future not in done:
+            print(f"Timed out fetching {event_type}")
+        elif future.exception() is not None:
+            print(f"Failed to fetch {event_type}: {future.exception()}")
+        else:
+            for e in future.result():
+                event_id = _event_id(event_type, e)
+                if event_id not in seen:
+                    seen[event_id] = {"time": _event_time(e), "note": e.get("note") or "",
+                                      "fetched": today.isoformat()}
+            # Today is re-asked next time: DONKI keeps posting same-day events
+            entry["fetched_through"] = today.isoformat()
+
+        # Drop events that have slid out of the window; events without a
+        # time go by the day they were first fetched
+        cutoff = window_start.isoformat()
+        for event_id in [k for k, e in seen.items()
+                         if (e["time"] or e.get("fetched", ""))[:10] < cutoff]:
+            del seen[event_id]
+        events[event_type] = sorted(seen.values(), key=lambda e: e["time"])
+
+    try:
+        save_donki_state(state)
+    except OSError as e:
+        print(f"Failed to save DONKI state: {e}")
     return {"donki": events}
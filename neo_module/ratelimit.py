@@ -0,0 +1,246 @@
+# neo_module/ratelimit.py
+"""
+Rate-limit-aware scheduler for api.nasa.gov requests.
+
+Every NASA endpoint shares one hourly quota per API key, and several
+devices may share a key.  The scheduler keeps a token bucket per key that
+refills at the hourly rate, trims it to the server's X-RateLimit-Remaining
+header after each response, and backs off after a 429.  Requests that would
+overdraw the budget raise ``RateLimited`` instead of reaching the network,
+so callers fall back to their cache.  Identical requests made close
+together are coalesced into one.
+
+State is persisted so a restart doesn't forget an exhausted quota.
+"""
+import os
+import json
+import time
+import hashlib
+import threading
+import requests
+
+from .config import (NASA_HOURLY_LIMIT, NASA_QUOTA_RESERVE, NASA_COALESCE_TTL,
+                     NASA_BACKOFF_MIN, NASA_BACKOFF_MAX, NASA_QUOTA_FILE,
+                     REQUEST_TIMEOUT)
+
+_WINDOW = 3600.0
+
+
+class RateLimited(Exception):
+    """Raised instead of sending a request the quota can't afford."""
+
+    def __init__(self, message, retry_after):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """Classic token bucket; *capacity* tokens refilled over one hour."""
+
+    def __init__(self, capacity, tokens=None, updated=None):
+        self.capacity = float(capacity)
+        self.tokens = self.capacity if tokens is None else float(tokens)
+        self.updated = time.time() if updated is None else updated
+        self.blocked_until = 0.0
+        self.backoff = 0.0
+        self.server_limit = None
+        self.server_remaining = None
+
+    def refill(self, now):
+        elapsed = max(0.0, now - self.updated)
+        self.tokens = min(self.capacity,
+                          self.tokens + elapsed * self.capacity / _WINDOW)
+        self.updated = now
+
+    def seconds_until(self, tokens, now):
+        """How long until the bucket holds *tokens* (0 if it already does)."""
+        self.refill(now)
+        wait = max(0.0, self.blocked_until - now)
+        missing = tokens - self.tokens
+        if missing > 0:
+            wait = max(wait, missing * _WINDOW / self.capacity)
+        return wait
+
+
+def _key_id(api_key):
+    # Never write the key itself to disk
+    return hashlib.sha1((api_key or "").encode()).hexdigest()[:12]
+
+
+class NasaScheduler:
+    def __init__(self, hourly_limit=NASA_HOURLY_LIMIT,
+                 reserve=NASA_QUOTA_RESERVE, coalesce_ttl=NASA_COALESCE_TTL,
+                 state_file=NASA_QUOTA_FILE, session=None):
+        self.hourly_limit = hourly_limit
+        self.reserve = reserve
+        self.coalesce_ttl = coalesce_ttl
+        self.state_file = state_file
+        self.session = session or requests
+
+        self._lock = threading.Lock()
+        self._buckets = {}
+        self._recent = {}      # request key -> (monotonic time, response)
+        self._inflight = {}    # request key -> threading.Event
+        self._load_state()
+
+    # ── persistence ──────────────────────────────────────────────────────────
+
+    def _load_state(self):
+        if not self.state_file or not os.path.exists(self.state_file):
+            return
+        try:
+            with open(self.state_file, "r") as f:
+                saved = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[neo_module] Ignoring unreadable quota state: {e}")
+            return
+        for key_id, s in saved.items():
+            bucket = TokenBucket(s["capacity"], s["tokens"], s["updated"])
+            bucket.blocked_until = s.get("blocked_until", 0.0)
+            bucket.backoff = s.get("backoff", 0.0)
+            bucket.server_limit = s.get("server_limit")
+            bucket.server_remaining = s.get("server_remaining")
+            self._buckets[key_id] = bucket
+
+    def _save_state(self):
+        if not self.state_file:
+            return
+        saved = {
+            key_id: {
+                "capacity": b.capacity, "tokens": b.tokens,
+                "updated": b.updated, "blocked_until": b.blocked_until,
+                "backoff": b.backoff, "server_limit": b.server_limit,
+                "server_remaining": b.server_remaining,
+            }
+            for key_id, b in self._buckets.items()
+        }
+        try:
+            with open(self.state_file, "w") as f:
+                json.dump(saved, f, separators=(",", ":"))
+        except OSError as e:
+            print(f"[neo_module] Failed to save quota state: {e}")
+
+    # ── budget ───────────────────────────────────────────────────────────────
+
+    def _bucket(self, api_key):
+        key_id = _key_id(api_key)
+        bucket = self._buckets.get(key_id)
+        if bucket is None:
+            # DEMO_KEY has a far smaller allowance than personal keys
+            limit = 30 if api_key == "DEMO_KEY" else self.hourly_limit
+            bucket = self._buckets[key_id] = TokenBucket(limit)
+        return bucket
+
+    def _acquire(self, api_key, now):
+        bucket = self._bucket(api_key)
+        # A reserve as big as the bucket (DEMO_KEY's 30 against the default
+        # 50) would defer every request forever
+        reserve = min(self.reserve, bucket.capacity * 0.1)
+        wait = bucket.seconds_until(1 + reserve, now)
+        if wait > 0:
+            raise RateLimited(
+                f"NASA quota exhausted, deferring for {wait:.0f}s", wait)
+        bucket.tokens -= 1
+
+    def _record(self, api_key, resp, now):
+        bucket = self._bucket(api_key)
+        headers = resp.headers
+        try:
+            limit = int(headers["X-RateLimit-Limit"])
+            bucket.server_limit = limit
+            if limit != bucket.capacity:
+                bucket.capacity = float(limit)
+        except (KeyError, ValueError):
+            pass
+        try:
+            remaining = int(headers["X-RateLimit-Remaining"])
+            bucket.server_remaining = remaining
+            # Other devices on the same key spend it too: trust the server
+            bucket.tokens = min(bucket.tokens, float(remaining))
+        except (KeyError, ValueError):
+            pass
+
+        if resp.status_code == 429:
+            try:
+                retry_after = float(headers["Retry-After"])
+            except (KeyError, ValueError):
+                retry_after = None
+            bucket.backoff = min(NASA_BACKOFF_MAX,
+                                 max(NASA_BACKOFF_MIN, bucket.backoff * 2))
+            bucket.blocked_until = now + (retry_after or bucket.backoff)
+            bucket.tokens = 0.0
+        else:
+            bucket.backoff = 0.0
+
+    # ── public API ───────────────────────────────────────────────────────────
+
+    def get(self, url, params=None, timeout=REQUEST_TIMEOUT):
+        """``requests.get`` within the key's budget.
+
+        Raises ``RateLimited`` when the request is deferred (budget spent,
+        or backing off after a 429) and ``requests.HTTPError`` for other
+        error statuses.
+        """
+        params = dict(params or {})
+        api_key = params.get("api_key")
+        request_key = (url, tuple(sorted(params.items())))
+
+        while True:
+            with self._lock:
+                recent = self._recent.get(request_key)
+                if recent and time.monotonic() - recent[0] < self.coalesce_ttl:
+                    return recent[1]
+                inflight = self._inflight.get(request_key)
+                if inflight is None:
+                    self._acquire(api_key, time.time())
+                    self._inflight[request_key] = threading.Event()
+                    break
+            # Someone is already fetching this exact URL: share their answer
+            if not inflight.wait(timeout):
+                raise requests.Timeout(f"Coalesced request timed out: {url}")
+            with self._lock:
+                recent = self._recent.get(request_key)
+            if recent:
+                return recent[1]
+
+        try:
+            resp = self.session.get(url, params=params, timeout=timeout)
+            with self._lock:
+                self._record(api_key, resp, time.time())
+                self._save_state()
+                if resp.status_code == 429:
+                    bucket = self._bucket(api_key)
+                    raise RateLimited("NASA API returned 429",
+                                      bucket.blocked_until - time.time())
+                resp.raise_for_status()
+                self._recent[request_key] = (time.monotonic(), resp)
+                self._prune_recent()
+            return resp
+        finally:
+            with self._lock:
+                self._inflight.pop(request_key).set()
+
+    def _prune_recent(self):
+        cutoff = time.monotonic() - self.coalesce_ttl
+        for k in [k for k, (t, _) in self._recent.items() if t < cutoff]:
+            del self._recent[k]
+
+    def quota(self):
+        """Snapshot of every key's budget, keyed by a hash of the key."""
+        now = time.time()
+        with self._lock:
+            state = {}
+            for key_id, b in self._buckets.items():
+                b.refill(now)
+                state[key_id] = {
+                    "tokens": round(b.tokens, 1),
+                    "capacity": b.capacity,
+                    "server_limit": b.server_limit,
+                    "server_remaining": b.server_remaining,
+                    "blocked_for": max(0.0, round(b.blocked_until - now, 1)),
+                }
+            return state
+
+
+# Shared by every NASA fetch in the process
+nasa_scheduler = NasaScheduler()
@@ -2,9 +2,12 @@
 from .cache import load_cache, save_cache, should_fetch
 from .fetch import fetch_neo_data, fetch_donki_data
 from .formatters import get_sorted_asteroids, format_asteroid_slide, get_donki_slides
-from ascii_presenter import AsciiPresenter, MODULE_BANNERS, MODULE_COLORS
+from .config import DONKI_EVENT_NAMES, METEOR_IMAGE_PATH
+from .snapshot import Asteroid
+from ascii_presenter import (get_presenter, MODULE_BANNERS, MODULE_COLORS,
+                             make_live_slides, live_builder)
 
-presenter = AsciiPresenter()
+presenter = get_presenter()
 
 _NEO_COLOR       = MODULE_COLORS["neo"]
 _HAZARD_COLOR    = MODULE_COLORS["hazardous"]
@@ -84,13 +87,58 @@ def _is_meteor_image_slide(s):
     return False
 
 
+def _hazardous_asteroid_slides(asteroid, show_banner):
+    """Framed alert slides for one hazardous asteroid, without the meteor image."""
+    out = []
+    asteroid_title = f"Asteroid {asteroid.name}"
+    for s in format_asteroid_slide(asteroid):
+        if _is_meteor_image_slide(s):
+            continue
+        # Hazardous slides: red-orange color, alert border, banner on first
+        banner = _HAZARD_BANNER if show_banner else None
+        if not isinstance(s, dict):
+            out.extend(presenter.make_text_slide(
+                asteroid_title, str(s),
+                color=_HAZARD_COLOR, alert=True, banner=banner,
+            ))
+        elif s.get("type") == "text":
+            out.extend(_convert_text_slide(
+                s, default_title=asteroid_title,
+                color=_HAZARD_COLOR, alert=True, banner=banner,
+            ))
+        else:
+            out.append(s)
+        show_banner = False
+    return out
+
+
+def _asteroid_slides(asteroid, show_banner):
+    """Framed slides for one non-hazardous asteroid."""
+    out = []
+    _emit_slide_list_into(
+        format_asteroid_slide(asteroid), out,
+        default_title=f"Asteroid {asteroid.name}",
+        color=_NEO_COLOR, banner=_NEO_BANNER if show_banner else None,
+    )
+    return out
+
+
+@live_builder
+def _live_asteroid_slides(row, show_banner):
+    """Slides for one asteroid, from its snapshot row (a live-slide recipe)."""
+    asteroid = Asteroid(*row)
+    if asteroid.hazardous:
+        return _hazardous_asteroid_slides(asteroid, show_banner)
+    return _asteroid_slides(asteroid, show_banner)
+
+
 def get_neo_slides():
     """
     Fetch NEO + DONKI data (with caching) and return slides:
       - text slides converted to ASCII framed slides
       - image slides preserved
     Meteor image (if any) is shown only once, after hazardous asteroid slides.
-    DONKI titles GST/FLR will be renamed.
+    DONKI event codes (GST, FLR, CME, SEP, IPS) are renamed.
     """
     if should_fetch():
         try:
@@ -112,32 +160,16 @@ def get_neo_slides():
     slides = []
     deferred_meteor_slide = None
 
-    # Process hazardous asteroids first; capture meteor image and emit it once later
+    # Process hazardous asteroids first; the meteor image is emitted once later.
+    # Asteroid slides are live so "Time until approach" keeps counting down.
     if hazardous:
         first_hazardous = True
         for a in hazardous:
-            fmt_slides = format_asteroid_slide(a)
-            asteroid_title = f"Asteroid {a.get('name', '')}"
-            for s in fmt_slides:
-                if _is_meteor_image_slide(s):
-                    if deferred_meteor_slide is None:
-                        deferred_meteor_slide = s
-                    continue
-                # Hazardous slides: red-orange color, alert border, banner on first
-                banner = _HAZARD_BANNER if first_hazardous else None
-                if not isinstance(s, dict):
-                    slides.extend(presenter.make_text_slide(
-                        asteroid_title, str(s),
-                        color=_HAZARD_COLOR, alert=True, banner=banner,
-                    ))
-                elif s.get("type") == "text":
-                    slides.extend(_convert_text_slide(
-                        s, default_title=asteroid_title,
-                        color=_HAZARD_COLOR, alert=True, banner=banner,
-                    ))
-                else:
-                    slides.append(s)
-                first_hazardous = False
+            slides.extend(make_live_slides(_live_asteroid_slides, a.row(),
+                                           first_hazardous))
+            if deferred_meteor_slide is None:
+                deferred_meteor_slide = {"type": "image", "path": METEOR_IMAGE_PATH}
+            first_hazardous = False
     else:
         slides.extend(presenter.make_text_slide(
             "NEO Monitor", "0 hazardous asteroids detected.",
@@ -145,29 +177,23 @@ def get_neo_slides():
         ))
         first_neo = True
         for a in non_hazardous[:3]:
-            fmt_slides = format_asteroid_slide(a)
-            banner = _NEO_BANNER if first_neo else None
-            _emit_slide_list_into(
-                fmt_slides, slides,
-                default_title=f"Asteroid {a.get('name', '')}",
-                color=_NEO_COLOR, banner=banner,
-            )
+            slides.extend(make_live_slides(_live_asteroid_slides, a.row(), first_neo))
             first_neo = False
 
     # Emit the deferred meteor image once, after all hazardous slides
     if deferred_meteor_slide is not None:
         slides.append(deferred_meteor_slide)
 
-    # DONKI slides: rename GST/FLR in content if present
+    # DONKI slides: replace "<TYPE> Event" with the readable event name
     donki_slides = get_donki_slides(data)
     normalized_donki = []
     for s in donki_slides:
         if isinstance(s, dict) and s.get("type") == "text":
             content = s.get("content", "")
-            if content.startswith("GST Event"):
-                content = content.replace("GST Event", "Geomagnetic Storm", 1)
-            elif content.startswith("FLR Event"):
-                content = content.replace("FLR Event", "Solar Flare", 1)
+            for etype, name in DONKI_EVENT_NAMES.items():
+                if content.startswith(f"{etype} Event"):
+                    content = content.replace(f"{etype} Event", name, 1)
+                    break
             s = dict(s)
             s["content"] = content
         normalized_donki.append(s)
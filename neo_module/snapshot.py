@@ -0,0 +1,100 @@
+# neo_module/snapshot.py
+"""
+Compact, pre-parsed NEO snapshot.
+
+The raw NeoWs feed is a deeply nested document full of string floats and
+unit variants we never show.  At fetch time it is reduced once to a short
+list of ``Asteroid`` records, pre-sorted by miss distance, and that list
+(stored as rows under a field header) is what gets cached and loaded.
+"""
+from .config import NON_HAZARDOUS_LIMIT
+
+SNAPSHOT_VERSION = 1
+
+
+class Asteroid:
+    """A single close approach, reduced to the fields the slides use."""
+
+    __slots__ = ("name", "hazardous", "distance_km", "speed_kmh",
+                 "approach_time", "diameter_min_m", "diameter_max_m")
+
+    def __init__(self, name, hazardous, distance_km, speed_kmh,
+                 approach_time, diameter_min_m, diameter_max_m):
+        self.name = name
+        self.hazardous = hazardous
+        self.distance_km = distance_km
+        self.speed_kmh = speed_kmh
+        self.approach_time = approach_time
+        self.diameter_min_m = diameter_min_m
+        self.diameter_max_m = diameter_max_m
+
+    @property
+    def diameter(self):
+        return f"{self.diameter_min_m:.0f}-{self.diameter_max_m:.0f} m"
+
+    def row(self):
+        return [getattr(self, f) for f in self.__slots__]
+
+    def __repr__(self):
+        return f"Asteroid({self.name!r}, {self.distance_km:.0f} km)"
+
+
+def parse_feed(feed, non_hazardous_limit=NON_HAZARDOUS_LIMIT):
+    """Reduce a raw NeoWs ``feed`` response to a sorted list of Asteroids.
+
+    Every hazardous object is kept; only the closest
+    *non_hazardous_limit* harmless ones are.
+    """
+    asteroids = []
+    for objs in feed.get("near_earth_objects", {}).values():
+        for obj in objs:
+            approaches = obj.get("close_approach_data") or []
+            if not approaches:
+                continue
+            approach = approaches[0]
+            meters = obj["estimated_diameter"]["meters"]
+            asteroids.append(Asteroid(
+                obj["name"],
+                bool(obj["is_potentially_hazardous_asteroid"]),
+                float(approach["miss_distance"]["kilometers"]),
+                float(approach["relative_velocity"]["kilometers_per_hour"]),
+                approach["close_approach_date_full"],
+                float(meters["estimated_diameter_min"]),
+                float(meters["estimated_diameter_max"]),
+            ))
+
+    asteroids.sort(key=lambda a: a.distance_km)
+
+    kept, harmless = [], 0
+    for a in asteroids:
+        if not a.hazardous:
+            if harmless >= non_hazardous_limit:
+                continue
+            harmless += 1
+        kept.append(a)
+    return kept
+
+
+def pack(asteroids):
+    """Serialise Asteroids to a JSON-friendly ``{fields, rows}`` table."""
+    return {
+        "version": SNAPSHOT_VERSION,
+        "fields": list(Asteroid.__slots__),
+        "rows": [a.row() for a in asteroids],
+    }
+
+
+def unpack(table):
+    """Inverse of :func:`pack`.  Returns ``None`` for unknown versions."""
+    if not table or table.get("version") != SNAPSHOT_VERSION:
+        return None
+    if table.get("fields") != list(Asteroid.__slots__):
+        return None
+    return [Asteroid(*row) for row in table.get("rows", [])]
+
+
+def split_by_hazard(asteroids):
+    """Return ``(hazardous, non_hazardous)``, each still sorted by distance."""
+    hazardous = [a for a in asteroids if a.hazardous]
+    non_hazardous = [a for a in asteroids if not a.hazardous]
+    return hazardous, non_hazardous
@@ -0,0 +1,159 @@
+# prerender.py
+"""
+Opt-in multi-process pre-rendering of a freshly fetched deck.
+
+At refresh time every static slide (text without a live field, and every
+image slide) is handed to a process pool: text rasterization, image
+download and LANCZOS fitting, and RGB565 conversion all run off the GIL.
+Workers write finished frames straight into one shared-memory block,
+RGB888 followed by RGB565 per slot, so only the small job descriptions
+are pickled.  Slides that fail, or live slides, render at show time as
+before.
+"""
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+from PIL import Image
+
+from display_output import Frame, image_to_rgb565
+from font_manager import FontManager
+from slideshow_handler import DEFAULT_COLOR, render_text_image, load_slide_image
+
+# Worker-process FontManager, loaded once by the pool initializer
+_worker_fonts = None
+
+
+def _init_worker(font_path, sizes, default_size):
+    global _worker_fonts
+    _worker_fonts = FontManager(font_path, sizes, default_size).prewarm()
+
+
+def _ping():
+    return True
+
+
+def slide_job(slide, font_size):
+    """Picklable description of a slide's frame, or None to render at show time.
+
+    *font_size* is the size used when the slide carries no hint.  Text
+    frames leave out the progress dots; the handler adds them when shown.
+    """
+    kind = slide.get("type")
+    if kind == "text" and slide.get("live") is None:
+        return {"kind": "text", "text": slide.get("content", ""),
+                "color": slide.get("color", DEFAULT_COLOR),
+                "font_size": slide.get("font_size") or font_size}
+    if kind == "image":
+        return {"kind": "image",
+                "slide": {k: slide[k] for k in ("url", "image", "path", "content")
+                          if k in slide}}
+    return None
+
+
+def render_job(job, width, height, fonts):
+    """Render one job description to an RGB PIL image."""
+    if job["kind"] == "text":
+        size = job["font_size"]
+        return render_text_image(job["text"], fonts.get(size), fonts.cell_size(size)[1],
+                                 width, height, job["color"])
+    return load_slide_image(job["slide"], width, height)
+
+
+def _frame_views(buf, slot, width, height):
+    """(rgb888 array, rgb565 memoryview) for *slot* of a frame block."""
+    rgb_bytes = width * height * 3
+    slot_bytes = rgb_bytes + width * height * 2
+    start = slot * slot_bytes
+    rgb = np.ndarray((height, width, 3), dtype=np.uint8, buffer=buf, offset=start)
+    return rgb, buf[start + rgb_bytes:start + slot_bytes]
+
+
+def _run_job(shm_name, slot, job, width, height):
+    img = render_job(job, width, height, _worker_fonts)
+    shm = shared_memory.SharedMemory(name=shm_name)
+    # Attaching registers the block with the resource tracker as if this
+    # process owned it; the parent unlinks it, so don't let the tracker try
+    resource_tracker.unregister(shm._name, "shared_memory")
+    try:
+        rgb, rgb565 = _frame_views(shm.buf, slot, width, height)
+        rgb[...] = np.asarray(img, dtype=np.uint8)
+        rgb565[:] = image_to_rgb565(img)
+        del rgb, rgb565
+    finally:
+        shm.close()
+    return slot
+
+
+class DeckPrerenderer:
+    def __init__(self, workers, fonts, width=320, height=240):
+        self.workers = workers
+        self.width = width
+        self.height = height
+        self.slot_bytes = width * height * 5
+        self.last_build = None
+        self._retired = []
+        # Forked before the caller starts its own threads, and all workers
+        # are started by the warm-up below, so nothing forks later.  (The
+        # forkserver/spawn methods would re-run the caller's main script.)
+        self._pool = ProcessPoolExecutor(
+            workers, mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_worker,
+            initargs=(fonts.path, fonts.sizes, fonts.default_size),
+        )
+        self._pool.submit(_ping).result()
+
+    def render(self, slides, font_size=None, indices=None):
+        """Pre-render *slides*; returns ``{index: Frame}`` for those that worked.
+
+        *indices* limits the work to those positions in the deck, so slides
+        whose frames are already cached are skipped.
+        """
+        started = time.perf_counter()
+        total = len(slides)
+        if indices is None:
+            indices = range(total)
+        jobs = [(i, job) for i, job in
+                ((i, slide_job(slides[i], font_size)) for i in indices)
+                if job is not None]
+        if not jobs:
+            return {}
+
+        shm = shared_memory.SharedMemory(create=True, size=len(jobs) * self.slot_bytes)
+        futures = {self._pool.submit(_run_job, shm.name, slot, job, self.width, self.height): i
+                   for slot, (i, job) in enumerate(jobs)}
+        frames = {}
+        for future, index in futures.items():
+            try:
+                slot = future.result()
+            except Exception as e:
+                print(f"[prerender] Slide {index} failed: {e}")
+                continue
+            rgb, rgb565 = _frame_views(shm.buf, slot, self.width, self.height)
+            frames[index] = Frame(Image.fromarray(rgb, "RGB"), bytes(rgb565))
+            del rgb, rgb565
+
+        # The block is only read while building Frames; release it now.
+        shm.unlink()
+        self._retire(shm)
+        self.last_build = {"slides": total, "jobs": len(jobs), "frames": len(frames),
+                           "workers": self.workers,
+                           "seconds": round(time.perf_counter() - started, 3)}
+        print(f"[prerender] {self.last_build}")
+        return frames
+
+    def _retire(self, shm):
+        """Close shared memory once no array views into it remain."""
+        self._retired.append(shm)
+        still_open = []
+        for block in self._retired:
+            try:
+                block.close()
+            except BufferError:
+                still_open.append(block)
+        self._retired = still_open
+
+    def close(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
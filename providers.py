@@ -0,0 +1,252 @@
+# providers.py
+"""
+Slide providers: a declarative registry, and a runner that calls them for
+a refresh under hard deadlines.
+
+``ProviderRegistry`` holds one ``Provider`` per source of slides.  Each
+declares its name, entry point (``"package.module:function"``, imported
+on the first call), TTL, timeout and the shared dependencies it needs,
+such as location or timezone.  Dependencies are resolved once, on first
+need, so a disabled provider costs nothing and nothing touches the
+network at import time.  A package declares its provider as a
+``PROVIDER`` dict in its ``__init__`` (see ``add_module``).
+
+Every provider is called on its own thread and the refresh waits for
+each one only until its deadline (``func.deadline`` seconds if the
+function carries one, else the runner's default), so a refresh takes at
+most the longest deadline however the network behaves.  A provider
+that runs over or raises is abandoned and its last good slides are
+shown again, marked ``"stale": True``.
+
+Python threads can't be killed: an abandoned call finishes (or hits its
+own request timeout) in the background and its result is discarded.
+Until it does, later refreshes don't call that provider again and use
+its last good slides straight away.
+
+Each provider also has a circuit breaker (see circuit_breaker.py):
+after repeated timeouts or errors it is skipped outright, with a growing
+cool-down, until a single probe call succeeds.
+"""
+import importlib
+import threading
+import time
+
+from circuit_breaker import CircuitBreaker, CircuitOpen
+
+DEFAULT_DEADLINE = 20.0
+
+NO_SLIDES = [{"type": "text", "content": "No slides available."}]
+
+
+def provider_name(func):
+    return getattr(func, "__name__", type(func).__name__)
+
+
+def _as_list(result):
+    if not result:
+        return []
+    return result if isinstance(result, list) else [result]
+
+
+class ProviderRunner:
+    def __init__(self, deadline=DEFAULT_DEADLINE):
+        self.deadline = deadline
+        self._last_good = {}       # func -> slides from its last good call
+        self._running = {}         # func -> thread of an abandoned call
+        self._breakers = {}        # func -> CircuitBreaker
+        # One entry per provider for the latest collect(): its name, outcome
+        # (ok, timeout, error, open if its breaker skipped it, or busy if
+        # still running from before), run time, and how many stale slides
+        # stood in for it
+        self.last_run = []
+
+    def _start(self, func):
+        box = {}
+
+        def call():
+            began = time.monotonic()
+            try:
+                box["slides"] = _as_list(func())
+            except Exception as e:
+                box["error"] = e
+            box["seconds"] = round(time.monotonic() - began, 3)
+
+        thread = threading.Thread(target=call, daemon=True,
+                                  name=f"provider-{provider_name(func)}")
+        thread.start()
+        return thread, box
+
+    def collect(self, slide_functions):
+        """Call every provider and flatten the results into one deck."""
+        started = time.monotonic()
+        calls = []
+        for func in slide_functions:
+            busy = self._running.get(func)
+            if busy is not None and busy.is_alive():
+                calls.append((func, "busy"))
+                continue
+            self._running.pop(func, None)
+            try:
+                self._breaker(func).allow()
+            except CircuitOpen:
+                calls.append((func, "open"))
+                continue
+            calls.append((func, self._start(func)))
+
+        slides, report = [], []
+        for func, call in calls:
+            name = provider_name(func)
+            box = {}
+            if isinstance(call, str):
+                outcome = call
+            else:
+                thread, box = call
+                deadline = started + getattr(func, "deadline", self.deadline)
+                thread.join(max(0.0, deadline - time.monotonic()))
+                if thread.is_alive():
+                    self._running[func] = thread
+                    outcome = "timeout"
+                elif "error" in box:
+                    print(f"Slide error: {box['error']}")
+                    outcome = "error"
+                else:
+                    outcome = "ok"
+                    self._last_good[func] = box["slides"]
+                    slides.extend(box["slides"])
+                if outcome == "ok":
+                    self._breakers[func].success()
+                else:
+                    self._breakers[func].failure()
+
+            stale = 0
+            if outcome != "ok":
+                last = [dict(s, stale=True) for s in self._last_good.get(func, [])]
+                slides.extend(last)
+                stale = len(last)
+                print(f"[providers] {name}: {outcome}, showing {stale} stale slide(s)")
+            report.append({"provider": name, "outcome": outcome,
+                           "seconds": box.get("seconds"), "stale": stale})
+
+        self.last_run = report
+        return slides or list(NO_SLIDES)
+
+    def _breaker(self, func):
+        if func not in self._breakers:
+            self._breakers[func] = CircuitBreaker(f"provider {provider_name(func)}")
+        return self._breakers[func]
+
+    def breaker_states(self):
+        """Snapshot of every provider's circuit breaker, by provider name."""
+        return {provider_name(f): b.snapshot() for f, b in self._breakers.items()}
+
+
+# ── registry ──────────────────────────────────────────────────────────────────
+
+class Provider:
+    """One declared slide source; calling it returns its slides.
+
+    Parameters
+    ----------
+    name : str
+        Shown in logs and stats.
+    entry : str | callable
+        ``"package.module:function"``, imported on the first call, or the
+        function itself.
+    ttl : float
+        Seconds a result is reused before the entry point is called again
+        (0 calls it every refresh).
+    timeout : float
+        Hard deadline for one call, enforced by ProviderRunner.
+    needs : tuple of str
+        Registry dependencies resolved before the first call.
+    args : tuple of str
+        Dependency values passed to the entry point, in order.
+    """
+
+    def __init__(self, registry, name, entry, ttl=0, timeout=DEFAULT_DEADLINE,
+                 needs=(), args=()):
+        self.registry = registry
+        self.__name__ = name
+        self.entry = entry
+        self.ttl = ttl
+        self.deadline = timeout
+        self.needs = tuple(needs)
+        self.args = tuple(args)
+        self._func = entry if callable(entry) else None
+        self._slides = None
+        self._fetched = 0.0
+
+    @property
+    def loaded(self):
+        return self._func is not None
+
+    def _load(self):
+        if self._func is None:
+            module_name, _, attr = self.entry.partition(":")
+            started = time.perf_counter()
+            self._func = getattr(importlib.import_module(module_name), attr)
+            print(f"[providers] Loaded {self.__name__} in "
+                  f"{(time.perf_counter() - started) * 1000:.0f} ms")
+        return self._func
+
+    def __call__(self):
+        if self._slides is not None and time.monotonic() - self._fetched < self.ttl:
+            return self._slides
+        func = self._load()
+        values = self.registry.resolve(self.needs)
+        slides = func(*(values[a] for a in self.args))
+        self._slides, self._fetched = slides, time.monotonic()
+        return slides
+
+
+class ProviderRegistry:
+    def __init__(self):
+        self.providers = []
+        self._resolvers = {}       # dependency name -> zero-argument function
+        self._values = {}          # dependency name -> dict it resolved to
+        self._locks = {}
+
+    def dependency(self, name, resolver):
+        """Declare dependency *name*; *resolver* returns a dict of values."""
+        self._resolvers[name] = resolver
+        self._locks[name] = threading.Lock()
+
+    def resolve(self, needs):
+        """Values of every dependency in *needs*, merged into one dict."""
+        values = {}
+        for name in needs:
+            with self._locks[name]:
+                if name not in self._values:
+                    self._values[name] = self._resolvers[name]()
+            values.update(self._values[name])
+        return values
+
+    def add(self, name, entry, enabled=True, **options):
+        """Register a provider; returns it (None when not *enabled*)."""
+        if not enabled:
+            return None
+        for need in options.get("needs", ()):
+            if need not in self._resolvers:
+                raise ValueError(f"provider {name} needs unknown dependency {need!r}")
+        provider = Provider(self, name, entry, **options)
+        self.providers.append(provider)
+        return provider
+
+    def add_module(self, package, enabled=True):
+        """Register the provider declared by *package*'s ``PROVIDER`` dict.
+
+        Only the package's ``__init__`` is imported here; its slide code
+        loads on the provider's first call.
+        """
+        if not enabled:
+            return None
+        return self.add(**importlib.import_module(package).PROVIDER)
+
+    def slide_functions(self):
+        return list(self.providers)
+
+    def stats(self):
+        now = time.monotonic()
+        return [{"provider": p.__name__, "loaded": p.loaded,
+                 "age": round(now - p._fetched, 1) if p._slides is not None else None}
+                for p in self.providers]
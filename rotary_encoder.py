@@ -2,6 +2,21 @@ import lgpio
 import time
 import threading
 
+# Quadrature transitions, indexed by (previous << 2) | current where a state
+# is (CLK << 1) | DT.  +1 is one quarter step clockwise, -1 anticlockwise,
+# 0 is no change or an impossible jump (both lines moved: a missed edge).
+# Clockwise runs 00 -> 10 -> 11 -> 01 -> 00, i.e. CLK rises while DT is low,
+# which is what the polling loop has always called CLOCKWISE.
+_QUADRATURE = (
+    0, -1, +1, 0,
+    +1, 0, 0, -1,
+    -1, 0, 0, +1,
+    0, +1, -1, 0,
+)
+# Both lines idle high between detents (one full cycle per click)
+_REST_STATE = 0b11
+
+
 class RotaryEncoder:
     """
     Rotary encoder event handler using lgpio.
@@ -12,10 +27,16 @@ class RotaryEncoder:
         encoder.start()
         ...
         encoder.stop()
+
+    mode="alert" (the default) claims the lines for edge alerts and runs
+    a quadrature state machine from lgpio's callback thread, so nothing
+    runs while the knob is still.  mode="poll" keeps the original
+    1 ms sampling loop for chips without alert support.
     """
     def __init__(self, clk_board=11, dt_board=16, sw_board=18,
                  board_to_bcm=None,
-                 button_debounce=0.05, rotary_debounce=0.002, sample_interval=0.001):
+                 button_debounce=0.05, rotary_debounce=0.002, sample_interval=0.001,
+                 mode="alert"):
         if board_to_bcm is None:
             board_to_bcm = {11: 17, 16: 23, 18: 24}
 
@@ -26,20 +47,77 @@ class RotaryEncoder:
         self.button_debounce = button_debounce
         self.rotary_debounce = rotary_debounce
         self.sample_interval = sample_interval
+        self.mode = mode
 
         self._chip = lgpio.gpiochip_open(0)
-        lgpio.gpio_claim_input(self._chip, self.CLK)
-        lgpio.gpio_claim_input(self._chip, self.DT)
-        lgpio.gpio_claim_input(self._chip, self.SW)
+        claim = (self._claim_alert if mode == "alert"
+                 else lambda gpio: lgpio.gpio_claim_input(self._chip, gpio))
+        claim(self.CLK)
+        claim(self.DT)
+        claim(self.SW)
 
         self.last_clk = lgpio.gpio_read(self._chip, self.CLK)
         self.last_button_time = 0
 
+        # Edge-mode state: current line levels, quarter steps since the last
+        # detent and lgpio timestamps (ns) of the last accepted events
+        self._levels = {self.CLK: self.last_clk,
+                        self.DT: lgpio.gpio_read(self._chip, self.DT)}
+        self._steps = 0
+        self._last_detent_ns = 0
+        self._last_button_ns = 0
+        self._edge_lock = threading.Lock()
+        self._callbacks = []
+
         self.on_rotate = None  # callback(direction: str: 'CLOCKWISE'/'COUNTERCLOCKWISE')
         self.on_button = None  # callback()
         self._running = False
         self._thread = None
 
+    def _claim_alert(self, gpio):
+        lgpio.gpio_claim_alert(self._chip, gpio, lgpio.BOTH_EDGES)
+
+    # ── edge-triggered mode ───────────────────────────────────────────────────
+
+    def _state(self):
+        return (self._levels[self.CLK] << 1) | self._levels[self.DT]
+
+    def _on_rotary_edge(self, chip, gpio, level, timestamp):
+        """lgpio alert for CLK/DT; *timestamp* is in nanoseconds."""
+        if level > 1:          # watchdog timeout, not an edge
+            return
+        direction = None
+        with self._edge_lock:
+            previous = self._state()
+            self._levels[gpio] = level
+            current = self._state()
+            # Contact bounce shows up as a step forward and straight back,
+            # which cancels out here; no sleeping needed
+            self._steps += _QUADRATURE[(previous << 2) | current]
+            if current == _REST_STATE:
+                steps, self._steps = self._steps, 0
+                # Half a cycle is enough to tolerate one missed edge; the
+                # timestamp guard drops a click re-reported by rest-state chatter
+                if abs(steps) >= 2 and \
+                        timestamp - self._last_detent_ns >= self.rotary_debounce * 1e9:
+                    self._last_detent_ns = timestamp
+                    direction = 'CLOCKWISE' if steps > 0 else 'COUNTERCLOCKWISE'
+        if direction and self.on_rotate:
+            self.on_rotate(direction)
+
+    def _on_button_edge(self, chip, gpio, level, timestamp):
+        """lgpio alert for SW: fire on press, ignoring chatter by timestamp."""
+        if level != 0:
+            return
+        with self._edge_lock:
+            if timestamp - self._last_button_ns <= self.button_debounce * 1e9:
+                return
+            self._last_button_ns = timestamp
+        if self.on_button:
+            self.on_button()
+
+    # ── polling mode ──────────────────────────────────────────────────────────
+
     def _poll_loop(self):
         while self._running:
             clk_state = lgpio.gpio_read(self._chip, self.CLK)
@@ -69,16 +147,26 @@ class RotaryEncoder:
             time.sleep(self.sample_interval)
 
     def start(self):
-        """Start polling in a background thread."""
+        """Start listening: register edge alerts, or start the polling thread."""
         if self._running:
             return
         self._running = True
+        if self.mode == "alert":
+            self._callbacks = [
+                lgpio.callback(self._chip, self.CLK, lgpio.BOTH_EDGES, self._on_rotary_edge),
+                lgpio.callback(self._chip, self.DT, lgpio.BOTH_EDGES, self._on_rotary_edge),
+                lgpio.callback(self._chip, self.SW, lgpio.BOTH_EDGES, self._on_button_edge),
+            ]
+            return
         self._thread = threading.Thread(target=self._poll_loop, daemon=True)
         self._thread.start()
 
     def stop(self):
-        """Stop polling and release GPIO."""
+        """Stop listening and release GPIO."""
         self._running = False
+        for cb in self._callbacks:
+            cb.cancel()
+        self._callbacks = []
         if self._thread:
             self._thread.join()
         lgpio.gpiochip_close(self._chip)
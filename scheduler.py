@@ -0,0 +1,98 @@
+# scheduler.py
+"""
+Deadline scheduler for the display loop.
+
+One thread runs ``Scheduler.run``: it sleeps on a condition variable until
+the earliest timer in a heap is due or another thread posts work with
+``call_soon`` (encoder input, a finished fetch), so an idle slideshow wakes
+only when something actually has to happen.  All times are on the
+monotonic clock.
+"""
+import heapq
+import itertools
+import threading
+import time
+
+
+class Timer:
+    """Handle returned by call_at/call_later; ``cancel()`` is idempotent."""
+
+    __slots__ = ("when", "fn", "args", "cancelled")
+
+    def __init__(self, when, fn, args):
+        self.when = when
+        self.fn = fn
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class Scheduler:
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self._heap = []
+        self._ready = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._running = False
+        self.wakeups = 0
+        self.started = clock()
+
+    def call_at(self, when, fn, *args):
+        """Run ``fn(*args)`` on the scheduler thread at monotonic time *when*."""
+        timer = Timer(when, fn, args)
+        with self._cond:
+            heapq.heappush(self._heap, (when, next(self._seq), timer))
+            # Only a new earliest deadline needs to shorten the current sleep
+            if self._heap[0][2] is timer:
+                self._cond.notify()
+        return timer
+
+    def call_later(self, delay, fn, *args):
+        return self.call_at(self.clock() + delay, fn, *args)
+
+    def call_soon(self, fn, *args):
+        """Queue ``fn(*args)`` from any thread and wake the scheduler."""
+        with self._cond:
+            self._ready.append((fn, args))
+            self._cond.notify()
+
+    def _next_batch(self):
+        """Block until work is due; return it as a list of (fn, args)."""
+        with self._cond:
+            while self._running:
+                while self._heap and self._heap[0][2].cancelled:
+                    heapq.heappop(self._heap)
+                now = self.clock()
+                batch, self._ready = self._ready, []
+                while self._heap and self._heap[0][0] <= now:
+                    timer = heapq.heappop(self._heap)[2]
+                    if not timer.cancelled:
+                        batch.append((timer.fn, timer.args))
+                if batch:
+                    return batch
+                timeout = self._heap[0][0] - now if self._heap else None
+                self._cond.wait(timeout)
+                self.wakeups += 1
+        return []
+
+    def run(self):
+        """Dispatch timers and posted calls until stop() is called."""
+        self._running = True
+        while self._running:
+            for fn, args in self._next_batch():
+                try:
+                    fn(*args)
+                except Exception as e:
+                    print(f"[Scheduler] {getattr(fn, '__name__', fn)} failed: {e}")
+
+    def stop(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+
+    def wakeup_rate(self):
+        """Mean wakeups per second since the scheduler was created."""
+        return self.wakeups / max(self.clock() - self.started, 1e-9)
@@ -0,0 +1,232 @@
+# slide_bundle.py
+"""
+Versioned binary slide-bundle format.
+
+A bundle is one deck version, or the difference from an older one::
+
+    header    magic "ORCB", format, flags, deck version, base version,
+              frame width/height, order count, entry count
+    order     8-byte content hash per slide, in display order
+    entries   hash, then (offset, length) of metadata, data and frame
+    blobs     metadata  UTF-8 JSON (type, content, color, font_size, and
+                        for live slides their recipe and frame rate)
+              data      PNG bytes for image slides, empty for text
+              frame     optional zlib-compressed RGB565 frame
+
+All integers are little-endian and offsets are from the start of the
+bundle.  A slide's hash covers its metadata and data (minus the
+content of a live slide with a recipe), so the same slide hashes the same
+in every version.  A delta bundle (FLAG_DELTA) carries the
+full order but only the entries the receiver doesn't already hold.
+
+``BundleReader`` parses a bytes object or a memory-mapped file in place:
+metadata, image data and compressed frames are memoryviews into the
+buffer, nothing is copied until a slide or frame is decoded.
+"""
+import hashlib
+import io
+import json
+import mmap
+import struct
+import zlib
+
+from PIL import Image
+
+from ascii_presenter import live_from_recipe
+from slideshow_handler import load_slide_image
+
+MAGIC = b"ORCB"
+FORMAT_VERSION = 1
+FLAG_DELTA = 0x1
+HASH_BYTES = 8
+
+_HEADER = struct.Struct("<4sHHIIHHII")
+_ENTRY = struct.Struct(f"<{HASH_BYTES}sIIIIII")
+
+
+class BundleError(ValueError):
+    """Raised for a truncated or foreign bundle."""
+
+
+# ── slides ────────────────────────────────────────────────────────────────────
+
+def pack_slide(slide, width=320, height=240):
+    """Serialize one slide dict to ``(meta, data)`` bytes.
+
+    Image slides are fitted to the screen and stored as PNG.  A live text
+    slide is stored with its current content and, if it has one, its
+    ``live_recipe`` so the receiver can keep it live; without a recipe it
+    is only a snapshot.
+    """
+    if slide.get("type") == "image":
+        buf = io.BytesIO()
+        load_slide_image(slide, width, height).save(buf, format="PNG")
+        return json.dumps({"type": "image"}).encode(), buf.getvalue()
+
+    meta = {"type": "text", "content": slide.get("content", "")}
+    if slide.get("live") is not None:
+        try:
+            meta["content"] = slide["live"]()
+        except Exception as e:
+            print(f"[slide_bundle] Live field error: {e}")
+        if slide.get("live_recipe"):
+            meta["live"] = slide["live_recipe"]
+            if slide.get("live_fps"):
+                meta["live_fps"] = slide["live_fps"]
+    if slide.get("color") is not None:
+        meta["color"] = list(slide["color"])
+    if slide.get("font_size"):
+        meta["font_size"] = slide["font_size"]
+    return json.dumps(meta, sort_keys=True, separators=(",", ":")).encode(), b""
+
+
+def unpack_slide(meta, data):
+    """Slide dict for SlideshowHandler from packed ``(meta, data)``."""
+    info = json.loads(bytes(meta))
+    if info["type"] == "image":
+        return {"type": "image", "image": Image.open(io.BytesIO(data)).convert("RGB")}
+    slide = {"type": "text", "content": info["content"]}
+    if "color" in info:
+        slide["color"] = tuple(info["color"])
+    if "font_size" in info:
+        slide["font_size"] = info["font_size"]
+    if "live" in info:
+        live = live_from_recipe(info["live"], info["content"])
+        if live is not None:
+            slide["live"] = live
+            slide["live_recipe"] = info["live"]
+            if "live_fps" in info:
+                slide["live_fps"] = info["live_fps"]
+    return slide
+
+
+def content_hash(meta, data=b""):
+    """Stable 8-byte hash of a packed slide.
+
+    A live slide with a recipe is hashed without its content, which is
+    only what it showed when packed: the receiver re-runs the recipe.
+    """
+    meta = bytes(meta)
+    if b'"live":' in meta:
+        info = json.loads(meta)
+        info.pop("content", None)
+        meta = json.dumps(info, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.sha1(meta + bytes(data)).digest()[:HASH_BYTES]
+
+
+# ── writing ───────────────────────────────────────────────────────────────────
+
+def write_bundle(version, order, slides, width=320, height=240,
+                 base_version=0, known=(), frames=None, level=6):
+    """Encode a bundle and return its bytes.
+
+    Parameters
+    ----------
+    version : int
+        Deck version this bundle describes.
+    order : list of bytes
+        Slide hashes in display order.
+    slides : dict
+        ``{hash: (meta, data)}`` for every hash in *order*.
+    base_version : int
+        Version the receiver holds; non-zero makes this a delta bundle.
+    known : collection of bytes
+        Hashes the receiver already has.  Their entries are left out.
+    frames : dict, optional
+        ``{hash: rgb565 bytes}`` pre-rendered at *width* x *height*.
+    level : int
+        zlib level for frames.
+    """
+    frames = frames or {}
+    known = set(known)
+    included = [h for h in dict.fromkeys(order) if h not in known]
+
+    blobs = []
+    offset = _HEADER.size + len(order) * HASH_BYTES + len(included) * _ENTRY.size
+    entries = []
+    for h in included:
+        meta, data = slides[h]
+        frame = zlib.compress(frames[h], level) if h in frames else b""
+        fields = []
+        for blob in (meta, data, frame):
+            fields += [offset, len(blob)]
+            blobs.append(blob)
+            offset += len(blob)
+        entries.append(_ENTRY.pack(h, *fields))
+
+    flags = FLAG_DELTA if base_version else 0
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, flags, version, base_version,
+                          width, height, len(order), len(included))
+    return b"".join([header, *order, *entries, *blobs])
+
+
+# ── reading ───────────────────────────────────────────────────────────────────
+
+class BundleReader:
+    """Zero-copy view of a bundle in *buffer* (bytes, bytearray or mmap)."""
+
+    def __init__(self, buffer):
+        self._mmap = None
+        self._buf = memoryview(buffer)
+        if len(self._buf) < _HEADER.size:
+            raise BundleError("bundle truncated")
+        (magic, fmt, flags, self.version, self.base_version,
+         self.width, self.height, n_order, n_entries) = _HEADER.unpack_from(self._buf)
+        if magic != MAGIC:
+            raise BundleError("not a slide bundle")
+        if fmt != FORMAT_VERSION:
+            raise BundleError(f"unsupported bundle format {fmt}")
+        self.is_delta = bool(flags & FLAG_DELTA)
+
+        pos = _HEADER.size
+        end = pos + n_order * HASH_BYTES + n_entries * _ENTRY.size
+        if end > len(self._buf):
+            raise BundleError("bundle truncated")
+        self.order = [bytes(self._buf[p:p + HASH_BYTES])
+                      for p in range(pos, pos + n_order * HASH_BYTES, HASH_BYTES)]
+        pos += n_order * HASH_BYTES
+        self.entries = {}
+        for _ in range(n_entries):
+            h, *fields = _ENTRY.unpack_from(self._buf, pos)
+            if any(off + n > len(self._buf) for off, n in zip(fields[0::2], fields[1::2])):
+                raise BundleError("bundle truncated")
+            self.entries[h] = fields
+            pos += _ENTRY.size
+
+    @classmethod
+    def open(cls, path):
+        """Memory-map the bundle file at *path*."""
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        reader = cls(mapped)
+        reader._mmap = mapped
+        return reader
+
+    def _blob(self, h, which):
+        fields = self.entries[h]
+        offset, length = fields[2 * which], fields[2 * which + 1]
+        return self._buf[offset:offset + length]
+
+    def meta(self, h):
+        return self._blob(h, 0)
+
+    def data(self, h):
+        return self._blob(h, 1)
+
+    def compressed_frame(self, h):
+        """The stored frame as a memoryview, or None."""
+        blob = self._blob(h, 2)
+        return blob if len(blob) else None
+
+    def frame(self, h):
+        """Decompressed RGB565 frame bytes for *h*, or None."""
+        blob = self.compressed_frame(h)
+        return zlib.decompress(blob) if blob is not None else None
+
+    def slide(self, h):
+        return unpack_slide(self.meta(h), self.data(h))
+
+    def close(self):
+        self._buf.release()
+        if self._mmap is not None:
+            self._mmap.close()
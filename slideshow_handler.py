@@ -1,7 +1,13 @@
 import time
+import hashlib
 from PIL import Image, ImageDraw, ImageFont
 from io import BytesIO
-import requests
+from collections import deque
+from font_manager import FontManager, TEXT_ORIGIN
+from scheduler import Scheduler
+from providers import ProviderRunner, DEFAULT_DEADLINE
+from display_output import DisplayOutput, Frame, image_to_rgb565
+import circuit_breaker
 import threading
 import re
 
@@ -10,12 +16,110 @@ DEFAULT_COLOR = (255, 191, 0)
 
 # Spinner frames for the animated refresh screen
 _SPINNER_FRAMES = ["|", "/", "─", "\\"]
+_SPINNER_INTERVAL = 0.15
+
+
+class FrameStats:
+    """Rolling frame-time statistics for live slides.
+
+    ``budget`` is the fraction of one core a live slide may use; frames
+    that take longer than ``budget * interval`` are counted as over budget.
+    """
+
+    def __init__(self, fps, budget, window=256):
+        self.fps = fps
+        self.budget = budget
+        self.times = deque(maxlen=window)
+        self.frames = 0
+        self.over_budget = 0
+        self.pixels = 0
+        self.busy = 0.0
+        self.started = time.perf_counter()
+
+    def add(self, seconds, pixels):
+        self.times.append(seconds)
+        self.frames += 1
+        self.pixels += pixels
+        self.busy += seconds
+        if seconds > self.budget / self.fps:
+            self.over_budget += 1
+
+    def summary(self):
+        ordered = sorted(self.times) or [0.0]
+        elapsed = max(time.perf_counter() - self.started, 1e-9)
+        return {
+            "frames": self.frames,
+            "fps": round(self.frames / elapsed, 1),
+            "mean_ms": round(sum(ordered) / len(ordered) * 1000, 2),
+            "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 2),
+            "max_ms": round(ordered[-1] * 1000, 2),
+            "over_budget": self.over_budget,
+            "cpu_pct": round(self.busy / elapsed * 100, 1),
+            "px_per_frame": self.pixels // max(self.frames, 1),
+        }
+
+
+class InputQueue:
+    """Encoder input coalesced into one pending navigation target.
+
+    Rotations accumulate into a signed step count and a button press
+    resets it to "slide 0", so however many detents arrive before the
+    render loop looks, it makes a single jump.  ``generation`` bumps on
+    every event; a frame started under an older generation is superseded
+    and may be abandoned.  ``on_push`` is called after each event (the
+    handler uses it to wake its scheduler).
+    """
+
+    def __init__(self, on_push=None):
+        self.on_push = on_push
+        self._lock = threading.Lock()
+        self._steps = 0
+        self._restart = False
+        self._pending = 0
+        self.generation = 0
+        self.received = 0
+        self.coalesced = 0
+
+    def push_rotate(self, steps):
+        with self._lock:
+            self._steps += steps
+            self._pending += 1
+            self.received += 1
+            self.generation += 1
+        if self.on_push:
+            self.on_push()
+
+    def push_restart(self):
+        with self._lock:
+            self._steps = 0
+            self._restart = True
+            self._pending += 1
+            self.received += 1
+            self.generation += 1
+        if self.on_push:
+            self.on_push()
+
+    def pending(self):
+        return self._pending > 0
+
+    def take(self):
+        """Return and clear ``(restart, steps, generation)``."""
+        with self._lock:
+            if self._pending > 1:
+                self.coalesced += self._pending - 1
+            result = (self._restart, self._steps, self.generation)
+            self._steps, self._restart, self._pending = 0, False, 0
+            return result
+
+    def stats(self):
+        with self._lock:
+            return {"received": self.received, "coalesced": self.coalesced}
 
 
 def fetch_and_fit_image(url, target_width=320, target_height=240):
     """Fetch an image from URL and resize/crop to fit target resolution without distortion."""
     try:
-        resp = requests.get(url, timeout=10)
+        resp = circuit_breaker.get(url, timeout=10)
         resp.raise_for_status()
         img = Image.open(BytesIO(resp.content)).convert("RGB")
 
@@ -45,33 +149,203 @@ def fetch_and_fit_image(url, target_width=320, target_height=240):
         return Image.new("RGB", (target_width, target_height), "black")
 
 
+def slide_hash(slide):
+    """Stable content hash of a slide dict, ignoring its own ``hash`` key.
+
+    PIL images are hashed by their pixels, so a deck rebuilt from the same
+    data (a deck-server pull, say) hashes the same; callables by name.  A
+    live slide with a ``live_recipe`` is hashed by the recipe, not by the
+    content it happened to show when the deck was fetched.
+    """
+    skip = ("hash", "content") if slide.get("live_recipe") else ("hash",)
+    h = hashlib.sha1()
+    for key in sorted(slide):
+        if key in skip:
+            continue
+        value = slide[key]
+        if isinstance(value, Image.Image):
+            value = (value.mode, value.size, hashlib.sha1(value.tobytes()).hexdigest())
+        elif callable(value):
+            value = getattr(value, "__qualname__", type(value).__name__)
+        h.update(f"{key}={value!r};".encode())
+    return h.hexdigest()[:16]
+
+
+def render_text_image(text, font, line_height, width, height, color=None, overlay=None):
+    """Draw *text* line by line on a fixed grid onto a new black image.
+
+    The fixed grid lets single character cells be repainted later.
+    *overlay* is an optional ``fn(draw, img)`` called after the text.
+    """
+    img = Image.new("RGB", (width, height), "black")
+    draw = ImageDraw.Draw(img)
+    x0, y0 = TEXT_ORIGIN
+    for row, line in enumerate(text.split("\n")):
+        draw.text((x0, y0 + row * line_height), line, font=font, fill=color or DEFAULT_COLOR)
+    if overlay:
+        overlay(draw, img)
+    return img
+
+
+# Bottom rows of the screen that hold the progress dots
+DOT_BAND = 20
+
+
+def dot_overlay(width, height, total, current):
+    """Return an overlay function that paints a progress-dot row.
+
+    Dots are drawn at the bottom of the screen.  Filled dot = current
+    slide; hollow dot = other slides.  Only shown when there are
+    between 2 and 12 slides (beyond that it gets too crowded).
+    """
+    if total < 2 or total > 12:
+        return None
+
+    DOT_RADIUS = 4
+    DOT_SPACING = 12
+    DOT_Y = height - 12
+    color_filled  = DEFAULT_COLOR
+    color_hollow  = (80, 60, 0)
+
+    total_width = (total - 1) * DOT_SPACING
+    start_x = (width - total_width) // 2
+
+    def _draw(draw, img):
+        for i in range(total):
+            cx = start_x + i * DOT_SPACING
+            cy = DOT_Y
+            bbox = [cx - DOT_RADIUS, cy - DOT_RADIUS,
+                    cx + DOT_RADIUS, cy + DOT_RADIUS]
+            fill = color_filled if i == current else color_hollow
+            draw.ellipse(bbox, fill=fill)
+
+    return _draw
+
+
+def with_dots(frame, width, height, total, current):
+    """*frame* with the progress dots for slide *current* of *total* drawn on.
+
+    Cached text frames are kept without dots, so they stay valid when
+    slides are added or removed; the dots go on at present time and only
+    the bottom DOT_BAND rows are converted to RGB565 again.
+    """
+    overlay = dot_overlay(width, height, total, current)
+    if overlay is None:
+        return frame
+    img = frame.image.copy()
+    overlay(ImageDraw.Draw(img), img)
+    top = height - DOT_BAND
+    band = image_to_rgb565(img.crop((0, top, width, height)))
+    return Frame(img, frame.rgb565[:top * width * 2] + band)
+
+
+def load_slide_image(slide, width, height):
+    """The full-screen RGB image for an image slide (black on any failure)."""
+    img = None
+    try:
+        if "url" in slide:
+            # Remote image URL (string)
+            img = fetch_and_fit_image(slide["url"], width, height)
+
+        elif "image" in slide:
+            if isinstance(slide["image"], Image.Image):
+                # Already a PIL image (from slides.py)
+                img = slide["image"].convert("RGB")
+                img = img.resize((width, height), Image.LANCZOS)
+            elif isinstance(slide["image"], str):
+                # Local file path
+                img_path = slide["image"]
+                img = Image.open(img_path).convert("RGB")
+                img = img.resize((width, height), Image.LANCZOS)
+
+        elif "path" in slide:
+            # Legacy: explicit local path
+            img_path = slide["path"]
+            img = Image.open(img_path).convert("RGB")
+            img = img.resize((width, height), Image.LANCZOS)
+
+        elif "content" in slide and isinstance(slide["content"], Image.Image):
+            # Directly an Image object
+            img = slide["content"].convert("RGB")
+            img = img.resize((width, height), Image.LANCZOS)
+
+    except Exception as e:
+        print(f"[show_image] Image error: {e}")
+        img = Image.new("RGB", (width, height), "black")
+
+    if img is None:
+        img = Image.new("RGB", (width, height), "black")
+    return img
+
+
 class SlideshowHandler:
     def __init__(self, slide_functions, disp, font,
                  screen_width=320, screen_height=240,
                  text_display_time=2.5, image_display_time=3,
-                 refresh_interval=900):
+                 refresh_interval=900, live_tick=1.0, live_cpu_budget=0.25,
+                 fonts=None, scheduler=None, prerender_workers=0,
+                 provider_deadline=DEFAULT_DEADLINE, retry_interval=30):
         self.slide_functions = slide_functions
+        # Each refresh waits at most this long for any one provider
+        self.providers = ProviderRunner(provider_deadline)
         self.disp = disp
         self.font = font
+        # Per-slide font_size hints are served from here; without a shared
+        # manager only the handler's own font size is available
+        self.fonts = fonts or FontManager(font.path, sizes=(font.size,),
+                                          default_size=font.size)
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.text_display_time = text_display_time
         self.image_display_time = image_display_time
         self.refresh_interval = refresh_interval
+        # Used instead when a refresh got nothing from any provider
+        self.retry_interval = retry_interval
+        self.live_tick = live_tick
+        self.live_cpu_budget = live_cpu_budget
+        # Frame-time summary of the last high-frame-rate live slide
+        self.live_stats = None
+
+        # Opt-in: static slides are rendered by a process pool at refresh
+        # time.  Created first, so its workers fork before any thread starts.
+        self.prerender = None
+        if prerender_workers:
+            from prerender import DeckPrerenderer
+            self.prerender = DeckPrerenderer(prerender_workers, self.fonts,
+                                             screen_width, screen_height)
+        # Finished frames of static slides (text without its progress dots),
+        # kept across refreshes while the slide is unchanged; see _frame_key
+        self._frames = {}
+        self.refresh_stats = {}
+
+        # Frames are handed to the panel's own thread and never wait on SPI
+        self.output = DisplayOutput(disp, screen_width, screen_height)
 
         self.slides = []
         self.last_refresh = 0
         self.current_index = 0
 
-        self._skip_event = threading.Event()
+        # Everything after start-up (dwell timers, live ticks, spinner frames,
+        # input) runs as callbacks on this scheduler's thread
+        self.scheduler = scheduler or Scheduler()
+        self._refresh_deadline = 0
+        self._timer = None
+        self._finish = None
+
         self._lock = threading.Lock()
 
+        # Encoder input waits here until the render loop applies it; frames
+        # for a generation older than the queue's are dropped mid-flight
+        self.input = InputQueue(on_push=lambda: self.scheduler.call_soon(self._on_input))
+        self._frame_generation = 0
+        self.frames_cancelled = 0
+
         # Flag set while a background refresh is in progress
         self._refreshing = False
 
     # ── helpers ──────────────────────────────────────────────────────────────
 
-    def _render_text(self, text, color=None, overlay=None):
+    def _render_text(self, text, color=None, overlay=None, font_size=None):
         """Render *text* onto a black PIL image and return it.
 
         Parameters
@@ -83,137 +357,279 @@ class SlideshowHandler:
         overlay : callable | None
             Optional ``fn(draw, img)`` called after the text is drawn,
             used to paint progress-dot overlays etc.
+        font_size : int | None
+            Point size from the slide's ``font_size`` hint.  Defaults to
+            the size of the handler's font.
         """
-        color = color or DEFAULT_COLOR
-        img = Image.new("RGB", (self.screen_width, self.screen_height), "black")
-        draw = ImageDraw.Draw(img)
-        draw.multiline_text((10, 10), text, font=self.font, fill=color)
-        if overlay:
-            overlay(draw, img)
-        return img
+        _, line_height = self._cell_size(font_size)
+        return render_text_image(text, self._font_for(font_size), line_height,
+                                 self.screen_width, self.screen_height, color, overlay)
 
-    def _dot_overlay(self, total, current):
-        """Return an overlay function that paints a progress-dot row.
+    def _font_for(self, font_size):
+        """The pre-loaded font nearest *font_size* (the handler font for None)."""
+        if not font_size:
+            return self.font
+        return self.fonts.get(font_size)
 
-        Dots are drawn at the bottom of the screen.  Filled dot = current
-        slide; hollow dot = other slides.  Only shown when there are
-        between 2 and 12 slides (beyond that it gets too crowded).
-        """
-        if total < 2 or total > 12:
-            return None
+    def _cell_size(self, font_size=None):
+        """(width, height) in pixels of one character cell at *font_size*."""
+        return self.fonts.cell_size(font_size or self.font.size)
 
-        DOT_RADIUS = 4
-        DOT_SPACING = 12
-        DOT_Y = self.screen_height - 12
-        color_filled  = DEFAULT_COLOR
-        color_hollow  = (80, 60, 0)
+    def _redraw_changed(self, img, old_text, new_text, color=None, font_size=None):
+        """Repaint only the character cells that differ between two texts.
 
-        total_width = (total - 1) * DOT_SPACING
-        start_x = (self.screen_width - total_width) // 2
+        Returns the list of pixel boxes ``(x0, y0, x1, y1)`` that changed,
+        empty if the texts render identically.
+        """
+        color = color or DEFAULT_COLOR
+        font = self._font_for(font_size)
+        draw = ImageDraw.Draw(img)
+        cell_w, cell_h = self._cell_size(font_size)
+        x0, y0 = TEXT_ORIGIN
+        old_lines = old_text.split("\n")
+        new_lines = new_text.split("\n")
+        boxes = []
+
+        for row in range(max(len(old_lines), len(new_lines))):
+            old = old_lines[row] if row < len(old_lines) else ""
+            new = new_lines[row] if row < len(new_lines) else ""
+            if old == new:
+                continue
+            width = max(len(old), len(new))
+            old, new = old.ljust(width), new.ljust(width)
+
+            # Group differing columns into runs and repaint each run
+            col = 0
+            while col < width:
+                if old[col] == new[col]:
+                    col += 1
+                    continue
+                start = col
+                while col < width and old[col] != new[col]:
+                    col += 1
+                box = (int(x0 + start * cell_w), y0 + row * cell_h,
+                       int(x0 + col * cell_w + 0.999), y0 + (row + 1) * cell_h)
+                draw.rectangle((box[0], box[1], box[2] - 1, box[3] - 1), fill="black")
+                draw.text((x0 + start * cell_w, box[1]), new[start:col].rstrip(),
+                          font=font, fill=color)
+                boxes.append(box)
+        return boxes
+
+    def _push_regions(self, img, boxes):
+        """Queue only *boxes* of *img* for the panel (see DisplayOutput).
+
+        Boxes on the same text row are merged into one SPI window; displays
+        without ``set_window``/``data`` get the full frame.  Returns the
+        number of pixels queued.
+        """
+        return self.output.submit(img, boxes)
 
-        def _draw(draw, img):
-            for i in range(total):
-                cx = start_x + i * DOT_SPACING
-                cy = DOT_Y
-                bbox = [cx - DOT_RADIUS, cy - DOT_RADIUS,
-                        cx + DOT_RADIUS, cy + DOT_RADIUS]
-                fill = color_filled if i == current else color_hollow
-                draw.ellipse(bbox, fill=fill)
+    def _superseded(self):
+        """True once encoder input has arrived since this frame was started."""
+        return self.input.generation != self._frame_generation
 
-        return _draw
+    def _present(self, img, rgb565=None):
+        """Queue a whole slide frame; it's dropped if spun past before it lands."""
+        if self._superseded():
+            self.frames_cancelled += 1
+            return
+        self.output.submit(img, stale=self._superseded, rgb565=rgb565)
+
+    def _dot_overlay(self, total, current):
+        """Progress-dot overlay for slide *current* of *total* (see dot_overlay)."""
+        return dot_overlay(self.screen_width, self.screen_height, total, current)
 
     # ── slide retrieval ───────────────────────────────────────────────────────
 
+    def _refresh_due(self):
+        return not self.slides or time.monotonic() >= self._refresh_deadline
+
     def get_slides(self):
-        now = time.time()
-        if not self.slides or (now - self.last_refresh) > self.refresh_interval:
-            self._do_refresh()
+        """The current deck, fetched synchronously first if empty or stale."""
+        if self._refresh_due():
+            slides = self._fetch_slides()
+            self._install_slides(slides, self._prepare(slides), show=False)
         return self.slides
 
-    def _do_refresh(self):
-        """Fetch all slide functions, showing an animated spinner while loading."""
-        print("Refreshing slides...")
-        self._refreshing = True
+    @staticmethod
+    def _frame_key(slide):
+        """Cache key for a slide's frame, or None if it can't be cached.
 
-        # Run the actual fetch in a background thread so we can animate
-        result_holder = []
+        Text frames are cached without the progress dots (see with_dots),
+        so a slide keeps its frame wherever it moves in the deck.
+        """
+        if slide.get("type") == "image":
+            return (slide["hash"],)
+        if slide.get("type") == "text" and slide.get("live") is None:
+            return (slide["hash"],)
+        return None
 
-        def _fetch():
-            slides = []
-            for func in self.slide_functions:
-                try:
-                    slide = func()
-                    if slide:
-                        if isinstance(slide, list):
-                            slides.extend(slide)
-                        else:
-                            slides.append(slide)
-                except Exception as e:
-                    print(f"Slide error: {e}")
-            if not slides:
-                slides = [{"type": "text", "content": "No slides available."}]
-            result_holder.append(slides)
-
-        fetch_thread = threading.Thread(target=_fetch, daemon=True)
-        fetch_thread.start()
-
-        # Animate spinner on the display while fetching
-        frame_idx = 0
-        while fetch_thread.is_alive():
-            spinner = _SPINNER_FRAMES[frame_idx % len(_SPINNER_FRAMES)]
-            refresh_text = (
-                f"  Consulting the oracle...\n\n"
-                f"         {spinner}"
-            )
-            img = self._render_text(refresh_text, color=DEFAULT_COLOR)
-            self.disp.display(img)
-            frame_idx += 1
-            time.sleep(0.15)
+    def _prepare(self, slides):
+        """Hash a freshly fetched deck and pre-render what isn't cached.
 
-        fetch_thread.join()
+        Runs on the fetch thread.  Returns ``{frame key: Frame}`` for the
+        newly rendered slides ({} when pre-rendering is not enabled).
+        """
+        for slide in slides:
+            slide["hash"] = slide_hash(slide)
+        if self.prerender is None:
+            return {}
+        keys = [self._frame_key(s) for s in slides]
+        missing = [i for i, key in enumerate(keys) if key is not None and key not in self._frames]
+        try:
+            frames = self.prerender.render(slides, self.font.size, indices=missing)
+        except Exception as e:
+            print(f"[SlideshowHandler] Pre-render failed: {e}")
+            return {}
+        return {keys[i]: frame for i, frame in frames.items()}
 
-        new_slides = result_holder[0] if result_holder else [
-            {"type": "text", "content": "No slides available."}
-        ]
+    def _fetch_slides(self):
+        return self.providers.collect(self.slide_functions)
 
-        with self._lock:
-            self.slides = new_slides
-            self.last_refresh = time.time()
-            self.current_index = 0
+    def _do_refresh(self):
+        """Fetch all slide functions, showing an animated spinner while loading.
 
-        self._refreshing = False
+        The fetch runs in a background thread that posts its result back to
+        the scheduler; spinner frames are scheduler timers.
+        """
+        print("Refreshing slides...")
+        self._refreshing = True
+        self._end_slide()
 
-    # ── interruptible sleep ───────────────────────────────────────────────────
+        def _fetch():
+            slides = self._fetch_slides()
+            self.scheduler.call_soon(self._install_slides, slides, self._prepare(slides))
+
+        threading.Thread(target=_fetch, daemon=True).start()
+        self._spin(0)
+
+    def _spin(self, frame_idx):
+        """Draw one spinner frame and schedule the next."""
+        spinner = _SPINNER_FRAMES[frame_idx % len(_SPINNER_FRAMES)]
+        refresh_text = (
+            f"  Consulting the oracle...\n\n"
+            f"         {spinner}"
+        )
+        img = self._render_text(refresh_text, color=DEFAULT_COLOR)
+        self.output.submit(img)
+        self._timer = self.scheduler.call_later(_SPINNER_INTERVAL, self._spin, frame_idx + 1)
+
+    def _install_slides(self, new_slides, frames=None, show=True):
+        """Swap in a new deck, keeping what the old one already rendered.
+
+        Frames whose key survives are carried over and the rest dropped;
+        the viewer stays on the slide it was on if that slide still
+        exists, else at the same position.  *frames* are the new deck's
+        pre-rendered frames from _prepare.
+        """
+        total = len(new_slides)
+        keys = [self._frame_key(s) for s in new_slides]
+        with self._lock:
+            old_hashes = {s.get("hash") for s in self.slides}
+            current = self.slides[self.current_index].get("hash") \
+                if self.current_index < len(self.slides) else None
+
+            carried = {key: self._frames[key] for key in keys
+                       if key is not None and key in self._frames}
+            new_hashes = [s.get("hash") for s in new_slides]
+            unchanged = sum(1 for h in new_hashes if h in old_hashes)
+            self.refresh_stats = {
+                "slides": total,
+                "unchanged": unchanged,
+                "added": total - unchanged,
+                "removed": len(old_hashes - set(new_hashes)),
+                "frames_reused": len(carried),
+                "frames_rendered": len(frames or {}),
+            }
+            carried.update(frames or {})
 
-    def _wait_interruptible(self, duration):
-        start = time.time()
-        while (time.time() - start) < duration:
-            if self._skip_event.is_set():
-                break
-            time.sleep(0.01)
+            self.slides = new_slides
+            self._frames = carried
+            self.last_refresh = time.time()
+            if current in new_hashes:
+                self.current_index = new_hashes.index(current)
+            elif self.current_index >= total:
+                self.current_index = 0
+        print(f"[SlideshowHandler] Deck refreshed: {self.refresh_stats}")
+        interval = self.refresh_interval
+        if not any(e["outcome"] == "ok" or e["stale"] for e in self.providers.last_run):
+            # Nothing came back (e.g. a deck server still on its first
+            # refresh): try again soon rather than a whole interval later
+            interval = min(self.retry_interval, self.refresh_interval)
+            print(f"[SlideshowHandler] No provider delivered, retrying in {interval}s")
+        self._refresh_deadline = time.monotonic() + interval
+
+        if self._refreshing:
+            self._refreshing = False
+            self._end_slide()
+        if show:
+            self.show_current_slide()
 
     # ── slide navigation ──────────────────────────────────────────────────────
 
     def next_slide(self, triggered_by_encoder=False):
+        if triggered_by_encoder:
+            # Queued: a fast spin becomes one jump in the render loop
+            self.input.push_rotate(1)
+            return
         with self._lock:
             if not self.slides:
                 return
             self.current_index = (self.current_index + 1) % len(self.slides)
-            if triggered_by_encoder:
-                self._skip_event.set()
 
     def prev_slide(self, triggered_by_encoder=False):
+        if triggered_by_encoder:
+            self.input.push_rotate(-1)
+            return
         with self._lock:
             if not self.slides:
                 return
             self.current_index = (self.current_index - 1) % len(self.slides)
-            if triggered_by_encoder:
-                self._skip_event.set()
 
     def restart_slideshow(self):
+        self.input.push_restart()
+
+    def _apply_input(self):
+        """Move to the queued target slide; returns True if there was input."""
+        if not self.input.pending():
+            return False
+        restart, steps, generation = self.input.take()
+        with self._lock:
+            if restart:
+                self.current_index = 0
+            if self.slides:
+                self.current_index = (self.current_index + steps) % len(self.slides)
+        self._frame_generation = generation
+        return True
+
+    def _on_input(self):
+        """Scheduler callback posted by the input queue."""
+        # Input during a refresh waits for the new deck; repeat posts for
+        # input an earlier call already took are no-ops
+        if self._refreshing or not self.input.pending():
+            return
+        self.show_current_slide()
+
+    def _end_slide(self):
+        """Cancel the current slide's timer and run its finish hook."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        finish, self._finish = self._finish, None
+        if finish:
+            finish()
+
+    def _on_dwell_end(self):
+        """A slide's display time is up: auto-advance, refreshing when due."""
+        self._end_slide()
         with self._lock:
-            self.current_index = 0
-            self._skip_event.set()
+            if self.slides:
+                self.current_index = (self.current_index + 1) % len(self.slides)
+        # The refresh keeps the viewer on the slide it would have shown next
+        if self._refresh_due():
+            self._do_refresh()
+            return
+        self.show_current_slide()
 
     # ── boot splash ───────────────────────────────────────────────────────────
 
@@ -230,98 +646,177 @@ class SlideshowHandler:
         ]
         splash_text = "\n".join(splash_lines)
         img = self._render_text(splash_text, color=DEFAULT_COLOR)
-        self.disp.display(img)
+        self.output.submit(img)
         time.sleep(duration)
 
     # ── display ───────────────────────────────────────────────────────────────
 
-    def show_text(self, text, color=None, slide_index=None, total_slides=None):
-        """Render a text slide, optionally with progress dots."""
+    def show_text(self, text, color=None, slide_index=None, total_slides=None,
+                  live=None, live_fps=None, font_size=None):
+        """Render a text slide, optionally with progress dots.
+
+        Draws the slide and schedules its end; it does not block.  *live*
+        is the slide's ``"live"`` callable, if any: it is re-evaluated
+        every ``live_tick`` seconds (or at *live_fps* frames per second)
+        while the slide is up, and only the character cells that changed
+        are repainted and pushed to the panel.
+        """
         overlay = None
         if slide_index is not None and total_slides is not None:
             overlay = self._dot_overlay(total_slides, slide_index)
 
-        img = self._render_text(text, color=color, overlay=overlay)
-        self.disp.display(img)
+        img = self._render_text(text, color=color, overlay=overlay,
+                                font_size=font_size)
+        self._present(img)
 
-        # Duration proportional to content lines
+        duration = self._text_duration(text)
+
+        if live is None:
+            self._timer = self.scheduler.call_later(duration, self._on_dwell_end)
+            return
+
+        interval = 1.0 / live_fps if live_fps else self.live_tick
+        stats = FrameStats(live_fps, self.live_cpu_budget) if live_fps else None
+        now = time.monotonic()
+        deadline = now + duration
+        shown = [text]
+
+        def _tick(next_tick):
+            if self._superseded():
+                return          # _on_input is about to replace this slide
+            if time.monotonic() >= deadline:
+                self._on_dwell_end()
+                return
+
+            started = time.perf_counter()
+            new_text = self._eval_live(live, shown[0])
+            pixels = 0
+            if new_text != shown[0]:
+                boxes = self._redraw_changed(img, shown[0], new_text, color, font_size)
+                if boxes:
+                    if overlay:
+                        overlay(ImageDraw.Draw(img), img)
+                        # A repaint may have clipped the dot row: resend it
+                        dots_top = self.screen_height - DOT_BAND
+                        if any(box[3] > dots_top for box in boxes):
+                            boxes.append((0, dots_top, self.screen_width, self.screen_height))
+                    pixels = self._push_regions(img, boxes)
+            shown[0] = new_text
+            frame_time = time.perf_counter() - started
+            if stats:
+                stats.add(frame_time, pixels)
+
+            # Stretch the interval when frames run long so the slide stays
+            # inside live_cpu_budget; never try to catch up missed frames.
+            next_tick += max(interval, frame_time / self.live_cpu_budget)
+            next_tick = max(next_tick, time.monotonic())
+            self._timer = self.scheduler.call_at(min(next_tick, deadline), _tick, next_tick)
+
+        def _finish():
+            if stats:
+                self.live_stats = stats.summary()
+                print(f"[SlideshowHandler] Live slide stats: {self.live_stats}")
+
+        self._finish = _finish
+        self._timer = self.scheduler.call_at(min(now + interval, deadline), _tick, now + interval)
+
+    def _text_duration(self, text):
+        """Display time proportional to the lines with real content."""
         lines = text.splitlines()
         content_lines = sum(1 for line in lines if re.search(r"[A-Za-z0-9]", line))
         if content_lines == 0:
             content_lines = 1
+        return self.text_display_time * content_lines * 0.66
 
-        self._wait_interruptible(self.text_display_time * content_lines * 0.66)
-
-    def show_image(self, slide):
-        img = None
+    @staticmethod
+    def _eval_live(live, fallback):
         try:
-            if "url" in slide:
-                # Remote image URL (string)
-                img = fetch_and_fit_image(slide["url"], self.screen_width, self.screen_height)
-
-            elif "image" in slide:
-                if isinstance(slide["image"], Image.Image):
-                    # Already a PIL image (from slides.py)
-                    img = slide["image"].convert("RGB")
-                    img = img.resize((self.screen_width, self.screen_height), Image.LANCZOS)
-                elif isinstance(slide["image"], str):
-                    # Local file path
-                    img_path = slide["image"]
-                    img = Image.open(img_path).convert("RGB")
-                    img = img.resize((self.screen_width, self.screen_height), Image.LANCZOS)
-
-            elif "path" in slide:
-                # Legacy: explicit local path
-                img_path = slide["path"]
-                img = Image.open(img_path).convert("RGB")
-                img = img.resize((self.screen_width, self.screen_height), Image.LANCZOS)
-
-            elif "content" in slide and isinstance(slide["content"], Image.Image):
-                # Directly an Image object
-                img = slide["content"].convert("RGB")
-                img = img.resize((self.screen_width, self.screen_height), Image.LANCZOS)
-
+            return live()
         except Exception as e:
-            print(f"[show_image] Image error: {e}")
-            img = Image.new("RGB", (self.screen_width, self.screen_height), "black")
-
-        if img is None:
-            img = Image.new("RGB", (self.screen_width, self.screen_height), "black")
+            print(f"[SlideshowHandler] Live field error: {e}")
+            return fallback
 
-        self.disp.display(img)
-        self._wait_interruptible(self.image_display_time)
+    def show_image(self, slide):
+        img = load_slide_image(slide, self.screen_width, self.screen_height)
+        self._present(img)
+        self._timer = self.scheduler.call_later(self.image_display_time, self._on_dwell_end)
 
     def show_current_slide(self):
-        slides = self.get_slides()
+        """Show the slide at current_index (after any queued input)."""
+        self._end_slide()
+        self._apply_input()
+        if self._refreshing:
+            return
+        if not self.slides:
+            self._do_refresh()
+            return
         with self._lock:
+            slides = self.slides
+            # Guard against a stale index
+            if self.current_index >= len(slides):
+                self.current_index = 0
             idx = self.current_index
             total = len(slides)
 
-        # Guard against empty list or stale index
-        if not slides or idx >= total:
-            return
-
         slide = slides[idx]
-        if slide["type"] == "text":
+        key = self._frame_key(slide) if "hash" in slide else None
+        frame = self._frames.get(key) if key is not None else None
+        if frame is None and key is not None:
+            frame = self._render_frame(slide)
+            # A failed image load comes back black: retry it next time round
+            if frame.image.getbbox() is not None:
+                self._frames[key] = frame
+            self.refresh_stats["frames_rendered"] = \
+                self.refresh_stats.get("frames_rendered", 0) + 1
+        if frame is not None:
+            if slide["type"] == "text":
+                frame = with_dots(frame, self.screen_width, self.screen_height, total, idx)
+            self._present(frame.image, frame.rgb565)
+            if slide["type"] == "text":
+                duration = self._text_duration(slide.get("content", ""))
+            else:
+                duration = self.image_display_time
+            self._timer = self.scheduler.call_later(duration, self._on_dwell_end)
+        elif slide["type"] == "text":
             color = slide.get("color", DEFAULT_COLOR)
+            live = slide.get("live")
+            content = slide.get("content", "")
+            if live is not None:
+                content = self._eval_live(live, content)
             self.show_text(
-                slide.get("content", ""),
+                content,
                 color=color,
                 slide_index=idx,
                 total_slides=total,
+                live=live,
+                live_fps=slide.get("live_fps"),
+                font_size=slide.get("font_size"),
             )
         elif slide["type"] == "image":
             self.show_image(slide)
+        else:
+            self._timer = self.scheduler.call_later(0, self._on_dwell_end)
+
+    def _render_frame(self, slide):
+        """Render a static slide the way show_text/show_image would, minus dots."""
+        if slide["type"] == "image":
+            img = load_slide_image(slide, self.screen_width, self.screen_height)
+        else:
+            img = self._render_text(slide.get("content", ""),
+                                    color=slide.get("color", DEFAULT_COLOR),
+                                    font_size=slide.get("font_size"))
+        return Frame(img, image_to_rgb565(img))
 
     # ── main loop ─────────────────────────────────────────────────────────────
 
     def run(self):
-        while True:
-            self.show_current_slide()
-            # Auto-advance only if user hasn't triggered skip
-            if not self._skip_event.is_set():
-                with self._lock:
-                    if self.slides:
-                        self.current_index = (self.current_index + 1) % len(self.slides)
-            # Clear skip event after handling
-            self._skip_event.clear()
+        """Run the slideshow on the calling thread until stop()."""
+        self.scheduler.call_soon(self.show_current_slide)
+        self.scheduler.run()
+
+    def stop(self):
+        self._end_slide()
+        self.scheduler.stop()
+        self.output.stop()
+        if self.prerender:
+            self.prerender.close()
@@ -0,0 +1,121 @@
+"""Slide-bundle sizes, delta savings and memory-mapped read cost.
+
+Builds a deck like a real refresh (NEO and forecast text slides, a
+climate clock, a quote and two photos), then reports:
+
+  - full bundle size, against the base64-in-JSON form used before
+  - a delta bundle after only the weather slides change
+  - the same bundle carrying compressed pre-rendered RGB565 frames
+  - time to mmap the bundle and reach every frame, and a round-trip check
+
+    python tests/bundle-bench.py
+"""
+import base64
+import json
+import os
+import sys
+import time
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np
+from PIL import Image
+
+from ascii_presenter import get_presenter
+from display_output import image_to_rgb565
+from font_manager import configure_fonts
+from prerender import slide_job, render_job
+from slide_bundle import BundleReader, content_hash, pack_slide, write_bundle
+
+WIDTH, HEIGHT = 320, 240
+
+
+def build_deck(temperature):
+    presenter = get_presenter()
+    deck = []
+    deck += presenter.make_text_slide("WEATHER", f"Now {temperature}F, wind 8 mph NW. "
+                                                 f"Tonight clear, low {temperature - 12}F.")
+    deck += presenter.make_text_slide("FORECAST", f"Tomorrow sunny, high {temperature + 3}F. " * 4)
+    for i in range(6):
+        deck += presenter.make_text_slide(f"NEO {i}", f"2024 AB{i} passes at 0.0{i + 1} AU. " * 3)
+    deck += presenter.make_text_slide("CLIMATE CLOCK", "4 YRS 200 DAYS 12:00:00")
+    deck += presenter.make_text_slide("ZEN", '"Be here now." - Ram Dass')
+    rng = np.random.default_rng(3)
+    for _ in range(2):
+        # Smooth gradient plus a little noise, closer to a photo than pure noise
+        y, x = np.mgrid[0:480, 0:640]
+        photo = np.stack([x * 255 // 640, y * 255 // 480, (x + y) % 256], axis=-1)
+        photo = (photo + rng.integers(0, 24, photo.shape)).clip(0, 255).astype(np.uint8)
+        deck.append({"type": "image", "image": Image.fromarray(photo, "RGB")})
+    return deck
+
+
+def pack(deck):
+    packed = [pack_slide(s, WIDTH, HEIGHT) for s in deck]
+    order = [content_hash(*p) for p in packed]
+    return order, dict(zip(order, packed))
+
+
+def json_size(order, slides):
+    """Size of the previous JSON bundle: metadata plus base64 PNG."""
+    body = {}
+    for h in order:
+        meta, data = slides[h]
+        entry = json.loads(meta)
+        if data:
+            entry["png"] = base64.b64encode(data).decode("ascii")
+        body[h.hex()] = entry
+    return len(json.dumps({"version": 1, "order": [h.hex() for h in order],
+                           "slides": body}, separators=(",", ":")).encode())
+
+
+def main():
+    fonts = configure_fonts()
+    deck = build_deck(61)
+    order, slides = pack(deck)
+    full = write_bundle(1, order, slides, WIDTH, HEIGHT)
+    print(f"{len(deck)} slides\n")
+    print(f"  full, JSON + base64      {json_size(order, slides) / 1024:8.1f} KB")
+    print(f"  full, binary             {len(full) / 1024:8.1f} KB")
+
+    order2, slides2 = pack(build_deck(64))
+    changed = [h for h in order2 if h not in slides]
+    delta = write_bundle(2, order2, slides2, WIDTH, HEIGHT, base_version=1, known=order)
+    print(f"  delta, {len(changed)} slides changed   {len(delta) / 1024:8.1f} KB")
+
+    frames = {}
+    for h, slide in zip(order, deck):
+        job = slide_job(slide, fonts.default_size)
+        frames[h] = image_to_rgb565(render_job(job, WIDTH, HEIGHT, fonts))
+    raw = sum(len(f) for f in frames.values())
+    with_frames = write_bundle(1, order, slides, WIDTH, HEIGHT, frames=frames)
+    print(f"  full + frames            {len(with_frames) / 1024:8.1f} KB"
+          f"   (raw RGB565 {raw / 1024:.0f} KB)")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "deck.orcb")
+        with open(path, "wb") as f:
+            f.write(with_frames)
+
+        started = time.perf_counter()
+        reader = BundleReader.open(path)
+        views = [reader.compressed_frame(h) for h in reader.order]
+        opened = time.perf_counter() - started
+        started = time.perf_counter()
+        decoded = [reader.frame(h) for h in reader.order]
+        inflated = time.perf_counter() - started
+        print(f"\n  mmap + index {len(views)} frames   {opened * 1000:8.2f} ms")
+        print(f"  inflate every frame      {inflated * 1000:8.2f} ms")
+
+        mismatched = sum(decoded[i] != frames[h] for i, h in enumerate(order))
+        mismatched += sum(reader.slide(h).get("content") != deck[i].get("content")
+                          for i, h in enumerate(order))
+        print(f"  round-trip mismatches    {mismatched:8d}")
+        del views
+        reader.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Refresh time through an upstream outage, with per-host circuit breakers.
+
+Three local HTTP servers stand in for zenquotes, the stoic API and
+iNaturalist.  Providers call them through circuit_breaker.get the way
+the real modules do: one zen call, a parallel batch of stoic calls, and
+an observations call followed by taxon lookups.  After two healthy
+refreshes every server starts hanging past the request timeout, and
+later it recovers.  Each refresh's time and the breaker states are
+printed: once the breakers open, a refresh should skip the dead hosts
+in milliseconds, probe once per cool-down, and close on recovery.
+
+    python tests/circuit-breaker-bench.py [--rounds N]
+"""
+import os
+import sys
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, ROOT)
+
+import requests
+
+import circuit_breaker
+from providers import ProviderRunner
+
+TIMEOUT = 0.5
+circuit_breaker.COOLDOWN_MIN = 1.0
+circuit_breaker.COOLDOWN_MAX = 2.0
+
+outage = threading.Event()
+
+
+class Upstream(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if outage.is_set():
+            time.sleep(TIMEOUT * 3)
+        body = json.dumps([{"q": "Be here now.", "a": "Ram Dass"}]).encode()
+        try:
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except OSError:
+            pass            # the client timed out and hung up
+
+    def log_message(self, fmt, *args):
+        pass
+
+
+def start_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Upstream)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+ZEN, STOIC, INAT = start_server(), start_server(), start_server()
+
+
+def fetch(url):
+    try:
+        return circuit_breaker.get(url, timeout=TIMEOUT).json()
+    except requests.RequestException:
+        return None
+
+
+def zen():
+    quote = fetch(f"{ZEN}/api/quotes")
+    return [{"type": "text", "content": quote[0]["q"] if quote else "zen unavailable"}]
+
+
+def stoic():
+    with ThreadPoolExecutor(4) as pool:
+        quotes = [q for q in pool.map(lambda _: fetch(f"{STOIC}/stoic-quote"), range(8)) if q]
+    return [{"type": "text", "content": f"{len(quotes)} stoic quotes"}]
+
+
+def inaturalist():
+    observations = fetch(f"{INAT}/v1/observations")
+    if not observations:
+        return [{"type": "text", "content": "No recent observations found."}]
+    taxa = [fetch(f"{INAT}/v1/taxa/{i}") for i in range(5)]
+    return [{"type": "text", "content": f"{sum(1 for t in taxa if t)} taxa"}]
+
+
+def main():
+    rounds = int(sys.argv[sys.argv.index("--rounds") + 1]) if "--rounds" in sys.argv else 20
+    runner = ProviderRunner(deadline=10)
+    print(f"request timeout {TIMEOUT} s, cool-down "
+          f"{circuit_breaker.COOLDOWN_MIN}-{circuit_breaker.COOLDOWN_MAX} s\n")
+    for r in range(rounds):
+        if r == 2:
+            outage.set()
+        if r == rounds - 8:
+            outage.clear()
+        started = time.monotonic()
+        runner.collect([zen, stoic, inaturalist])
+        elapsed = time.monotonic() - started
+        states = circuit_breaker.states()
+        summary = " ".join(f"{name}={states[url[7:]]['state']}"
+                           for name, url in (("zen", ZEN), ("stoic", STOIC), ("inat", INAT)))
+        print(f"refresh {r:>2} {'outage' if outage.is_set() else 'up    '}"
+              f" {elapsed:6.2f} s   {summary}")
+        time.sleep(0.4)
+
+    skipped = sum(s["skipped"] for s in circuit_breaker.states().values())
+    print(f"\ncalls skipped by open breakers: {skipped}")
+
+
+if __name__ == "__main__":
+    main()
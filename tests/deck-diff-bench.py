@@ -0,0 +1,110 @@
+"""Frames re-rendered per refresh when only part of the deck changes.
+
+Drives SlideshowHandler's refresh path directly (no scheduler thread):
+each round fetches a deck in which only the weather slides differ (a
+live countdown slide shows new text each round but is the same slide),
+installs it, then visits every slide once the way the slideshow would.
+Reports the handler's refresh_stats and the render time per round.  The
+first round renders everything; later rounds should render only the
+changed slides.  Then a slide is inserted ahead of the viewer: it should
+stay on the same logical slide, and every other frame should be reused
+(text frames are cached without their progress dots).
+
+    python tests/deck-diff-bench.py [--rounds N] [--workers N]
+"""
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, ROOT)
+
+from PIL import Image
+
+from ascii_presenter import get_presenter, live_builder, make_live_slides
+from font_manager import configure_fonts
+from slideshow_handler import SlideshowHandler
+
+
+class NullDisplay:
+    def display(self, img):
+        pass
+
+
+@live_builder
+def countdown(deadline):
+    left = max(0, int(deadline - time.time()))
+    return get_presenter().make_text_slide("COUNTDOWN", f"{left // 60:02d}:{left % 60:02d}")
+
+
+def make_provider():
+    presenter = get_presenter()
+    photo = Image.new("RGB", (640, 480), (40, 120, 40))
+    state = {"temperature": 60, "alert": False}
+    deadline = time.time() + 3600
+
+    def provider():
+        t = state["temperature"]
+        deck = []
+        if state["alert"]:
+            deck += presenter.make_text_slide("ALERT", "Frost advisory tonight.")
+        deck += presenter.make_text_slide("WEATHER", f"Now {t}F, wind 8 mph NW.")
+        deck += presenter.make_text_slide("FORECAST", f"Tomorrow high {t + 3}F. " * 4)
+        for i in range(12):
+            deck += presenter.make_text_slide(f"NEO {i}", f"2024 AB{i} at 0.0{i % 9 + 1} AU. " * 3)
+        deck.append({"type": "image", "image": photo})
+        deck += make_live_slides(countdown, deadline)
+        return deck
+
+    return provider, state
+
+
+def refresh(handler):
+    slides = handler._fetch_slides()
+    handler._install_slides(slides, handler._prepare(slides), show=False)
+
+
+def visit_all(handler):
+    started = time.perf_counter()
+    for i in range(len(handler.slides)):
+        handler.current_index = i
+        handler.show_current_slide()
+    handler._end_slide()
+    return time.perf_counter() - started
+
+
+def main():
+    rounds = int(sys.argv[sys.argv.index("--rounds") + 1]) if "--rounds" in sys.argv else 5
+    workers = int(sys.argv[sys.argv.index("--workers") + 1]) if "--workers" in sys.argv else 0
+    fonts = configure_fonts()
+    provider, state = make_provider()
+    handler = SlideshowHandler([provider], NullDisplay(), fonts.default, fonts=fonts,
+                               prerender_workers=workers)
+
+    print(f"{'round':>5} {'slides':>6} {'unchanged':>9} {'reused':>6} "
+          f"{'rendered':>8} {'render ms':>9}")
+    for r in range(rounds):
+        refresh(handler)
+        elapsed = visit_all(handler)
+        stats = handler.refresh_stats
+        print(f"{r:>5} {stats['slides']:>6} {stats['unchanged']:>9} "
+              f"{stats['frames_reused']:>6} {stats['frames_rendered']:>8} {elapsed * 1000:>9.1f}")
+        state["temperature"] += 1
+
+    # Park on a NEO slide, then refresh with an alert slide inserted first
+    handler.current_index = 5
+    watching = handler.slides[5]["content"]
+    state["alert"] = True
+    refresh(handler)
+    kept = handler.slides[handler.current_index]["content"] == watching
+    print(f"\nslide inserted ahead: viewer moved 5 -> {handler.current_index}, "
+          f"same slide {'yes' if kept else 'NO'}")
+    elapsed = visit_all(handler)
+    stats = handler.refresh_stats
+    print(f"  frames reused {stats['frames_reused']} of {stats['slides']}, "
+          f"rendered {stats['frames_rendered']} in {elapsed * 1000:.1f} ms")
+    handler.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Load-test the fan-out deck server with simulated display units.
+
+Six fake providers stand in for ipinfo, OWM, NASA, climateclock,
+zenquotes and iNaturalist and count their "upstream" calls; only the
+weather slide changes between refreshes.  For each client count, N
+DeckClients pull deltas in a loop while the server refreshes every
+REFRESH seconds.  Upstream calls should depend on refreshes only, not
+on N; standalone units would make N times as many.
+
+Last, a cold start: a client pulling while the server's first refresh
+(held up by a slow provider) is still running must get a failed pull,
+not an empty deck.
+
+    python tests/deck-server-load.py [--unix] [--seconds S]
+"""
+import os
+import sys
+import time
+import tempfile
+import threading
+from collections import Counter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, ROOT)
+
+from PIL import Image
+
+from deck_server import DeckServer, DeckClient, DeckNotReady
+
+REFRESH = 1.0
+PULL_EVERY = 0.25
+CLIENT_COUNTS = (1, 10, 50, 100)
+
+upstream = Counter()
+
+
+def provider(name, slides):
+    def call():
+        upstream[name] += 1
+        time.sleep(0.02)                 # network round trip
+        return slides() if callable(slides) else slides
+    return call
+
+
+PROVIDERS = [
+    provider("ipinfo", [{"type": "text", "content": "Green Bay, WI, Earth"}]),
+    provider("owm", lambda: [{"type": "text", "content": f"Temp {time.time() % 100:.1f}F"}]),
+    provider("nasa", [{"type": "text", "content": f"Asteroid {i}"} for i in range(5)]),
+    provider("climateclock", [{"type": "text", "content": "CLIMATE CLOCK 4y 200d"}]),
+    provider("zenquotes", [{"type": "text", "content": '"Be here now." - Ram Dass'}]),
+    provider("inaturalist", [{"type": "image",
+                              "image": Image.new("RGB", (640, 480), (40, 120, 40))}]),
+]
+
+
+def run_clients(url, count, seconds):
+    clients = [DeckClient(url) for _ in range(count)]
+    latencies, lock = [], threading.Lock()
+    stop = time.monotonic() + seconds
+
+    def loop(client):
+        while time.monotonic() < stop:
+            started = time.perf_counter()
+            slides = client.fetch_slides()
+            with lock:
+                latencies.append(time.perf_counter() - started)
+            assert len(slides) == 10, len(slides)
+            time.sleep(PULL_EVERY)
+
+    threads = [threading.Thread(target=loop, args=(c,)) for c in clients]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    latencies.sort()
+    return clients, latencies
+
+
+def cold_start(address, url):
+    slow = provider("slow", lambda: time.sleep(2) or [{"type": "text", "content": "ready"}])
+    server = DeckServer([slow], refresh_interval=60)
+    threading.Thread(target=server.serve, args=(address,), daemon=True).start()
+    time.sleep(0.3)
+    client = DeckClient(url)
+    try:
+        early = f"{len(client.fetch_slides())} slides (wrong: should fail)"
+    except DeckNotReady as e:
+        early = f"failed pull ({e})"
+    time.sleep(2.2)
+    late = client.fetch_slides()
+    server.stop()
+    print(f"\ncold start: pull during first refresh -> {early}")
+    print(f"            pull after it -> {len(late)} slide(s), version {client.version}")
+
+
+def main():
+    seconds = float(sys.argv[sys.argv.index("--seconds") + 1]) if "--seconds" in sys.argv else 5
+    tmpdir = tempfile.mkdtemp()
+    if "--unix" in sys.argv:
+        address = os.path.join(tmpdir, "deck.sock")
+        url = f"unix://{address}"
+    else:
+        address, url = ("127.0.0.1", 18765), "http://127.0.0.1:18765"
+
+    print(f"{seconds:.0f} s per run, server refresh every {REFRESH} s, "
+          f"clients pull every {PULL_EVERY} s ({url})\n")
+    print(f"{'clients':>7} {'refreshes':>9} {'upstream':>8} {'standalone':>10} "
+          f"{'requests':>8} {'304s':>6} {'built':>6} {'KB sent':>8} {'p50 ms':>7} {'p95 ms':>7}")
+    for count in CLIENT_COUNTS:
+        upstream.clear()
+        server = DeckServer(PROVIDERS, refresh_interval=REFRESH)
+        threading.Thread(target=server.serve, args=(address,), daemon=True).start()
+        time.sleep(0.3)
+
+        _, latencies = run_clients(url, count, seconds)
+        server.stop()
+        stats = server.stats
+        calls = sum(upstream.values())
+        print(f"{count:>7} {stats['refreshes']:>9} {calls:>8} {calls * count:>10} "
+              f"{stats['requests']:>8} {stats['not_modified']:>6} {stats['bundles_built']:>6} "
+              f"{stats['bytes_sent'] / 1024:>8.1f} "
+              f"{latencies[len(latencies) // 2] * 1000:>7.1f} "
+              f"{latencies[int(len(latencies) * 0.95)] * 1000:>7.1f}")
+        time.sleep(0.2)
+
+    cold_start(address, url)
+
+
+if __name__ == "__main__":
+    main()
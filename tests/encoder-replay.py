@@ -0,0 +1,124 @@
+"""Replay encoder edge traces through RotaryEncoder on a mock lgpio.
+
+Checks the edge-triggered quadrature decoder against synthetic traces
+(clean, bouncy, fast, anticlockwise, chattering button), then compares
+idle cost of the alert and polling modes: gpio_read calls and CPU time
+over one second with the knob untouched.
+
+    python tests/encoder-replay.py                 # synthetic traces
+    python tests/encoder-replay.py --trace FILE    # replay a recording
+    python tests/encoder-replay.py --record FILE   # on the Pi: record edges
+"""
+import os
+import sys
+import json
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "tests"))
+
+CLK, DT, SW = 17, 23, 24
+
+
+def record(path, seconds=20):
+    """Log real CLK/DT/SW edges (lgpio timestamps) as JSON lines."""
+    import lgpio
+    chip = lgpio.gpiochip_open(0)
+    edges = []
+    callbacks = []
+    for gpio in (CLK, DT, SW):
+        lgpio.gpio_claim_alert(chip, gpio, lgpio.BOTH_EDGES)
+        callbacks.append(lgpio.callback(chip, gpio, lgpio.BOTH_EDGES,
+                                        lambda c, g, level, ts: edges.append((ts, g, level))))
+    print(f"Recording for {seconds}s - turn the knob and press the button...")
+    time.sleep(seconds)
+    for cb in callbacks:
+        cb.cancel()
+    lgpio.gpiochip_close(chip)
+    with open(path, "w") as f:
+        for edge in sorted(edges):
+            f.write(json.dumps(edge) + "\n")
+    print(f"{len(edges)} edges written to {path}")
+
+
+def make_encoder(lgpio, mode):
+    from rotary_encoder import RotaryEncoder
+    lgpio.reset({CLK: 1, DT: 1, SW: 1})
+    encoder = RotaryEncoder(mode=mode)
+    events = []
+    encoder.on_rotate = events.append
+    encoder.on_button = lambda: events.append("BUTTON")
+    encoder.start()
+    return encoder, events
+
+
+def summarize(events):
+    return {name: events.count(name) for name in ("CLOCKWISE", "COUNTERCLOCKWISE", "BUTTON")
+            if events.count(name)}
+
+
+def run_synthetic(lgpio):
+    ms = 1_000_000
+    cases = [
+        ("5 clean clicks cw", lgpio.detent_trace(CLK, DT, 5), {"CLOCKWISE": 5}),
+        ("5 clicks ccw", lgpio.detent_trace(CLK, DT, -5), {"COUNTERCLOCKWISE": 5}),
+        ("10 bouncy clicks cw", lgpio.detent_trace(CLK, DT, 10, bounce=3), {"CLOCKWISE": 10}),
+        ("20 clicks in 100 ms", lgpio.detent_trace(CLK, DT, 20, period_ns=5 * ms),
+         {"CLOCKWISE": 20}),
+        ("button, 6 chatter pulses", lgpio.press_trace(SW, chatter=6), {"BUTTON": 1}),
+        ("two presses 300 ms apart",
+         lgpio.press_trace(SW) + lgpio.press_trace(SW, start_ns=300 * ms), {"BUTTON": 2}),
+    ]
+    failures = 0
+    for name, trace, expected in cases:
+        encoder, events = make_encoder(lgpio, "alert")
+        # Start each trace well clear of the encoder's zeroed timestamps
+        lgpio.replay([(t + 1000 * ms, g, level) for t, g, level in trace])
+        encoder.stop()
+        got = summarize(events)
+        ok = got == expected
+        failures += not ok
+        print(f"  {'ok  ' if ok else 'FAIL'} {name:<28} {len(trace):>4} edges -> {got}")
+    return failures
+
+
+def idle_cost(lgpio, mode, seconds=1.0):
+    encoder, _ = make_encoder(lgpio, mode)
+    lgpio.reads = 0
+    cpu = time.process_time()
+    time.sleep(seconds)
+    cpu = time.process_time() - cpu
+    reads = lgpio.reads
+    encoder.stop()
+    return reads / seconds, cpu / seconds * 100
+
+
+def main():
+    if "--record" in sys.argv:
+        record(sys.argv[sys.argv.index("--record") + 1])
+        return
+
+    import mock_lgpio
+    lgpio = mock_lgpio.install()
+
+    if "--trace" in sys.argv:
+        trace = lgpio.load_trace(sys.argv[sys.argv.index("--trace") + 1])
+        encoder, events = make_encoder(lgpio, "alert")
+        lgpio.replay(trace, realtime="--realtime" in sys.argv)
+        encoder.stop()
+        print(f"{len(trace)} edges -> {summarize(events)}")
+        return
+
+    print("Edge-triggered decoder:")
+    failures = run_synthetic(lgpio)
+
+    print("\nIdle cost, knob untouched for 1 s:")
+    for mode in ("poll", "alert"):
+        reads, cpu = idle_cost(lgpio, mode)
+        print(f"  {mode:<6} {reads:>7.0f} gpio_read/s   {cpu:5.1f}% CPU")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""Count how often the slideshow wakes up when nothing needs doing.
+
+Runs SlideshowHandler on a null display through three phases: a refresh
+(slow fetch with spinner), a static text slide and a 1 fps live slide.
+For each phase it reports wakeups per second, next to the same phases
+run by the fixed-sleep loop the Scheduler replaced (spinner frames every
+0.15 s, every wait polled every 10 ms), plus time.sleep calls per thread.
+An idle static slide should cost no wakeups at all.
+
+    python tests/idle-wakeups-bench.py
+"""
+import os
+import sys
+import time
+import threading
+from collections import Counter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, ROOT)
+
+sleeps = Counter()
+_sleep = time.sleep
+
+
+def counting_sleep(seconds):
+    sleeps[threading.current_thread().name] += 1
+    _sleep(seconds)
+
+
+time.sleep = counting_sleep
+
+from font_manager import configure_fonts
+from slideshow_handler import SlideshowHandler
+
+PHASES = (("refresh spinner", 0.9), ("static slide", 4.0), ("live slide 1 fps", 4.0))
+
+
+class NullDisplay:
+    def display(self, img):
+        pass
+
+
+class PollingLoop:
+    """The waits of the sleep-polling loop, as it ran before the Scheduler."""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.refresh = threading.Event()
+        self.live = False
+        self.stopped = False
+
+    def _wait_interruptible(self, duration):
+        start = time.time()
+        while time.time() - start < duration and not self.refresh.is_set():
+            time.sleep(0.01)
+
+    def _do_refresh(self):
+        fetch = threading.Thread(target=_sleep, args=(1.0,), daemon=True)
+        fetch.start()
+        frame = 0
+        while fetch.is_alive():
+            self.handler._render_text(f"  Consulting the oracle...\n\n         {frame % 4}")
+            frame += 1
+            time.sleep(0.15)
+
+    def run(self):
+        while not self.stopped:
+            self.refresh.clear()
+            self._do_refresh()
+            while not self.stopped and not self.refresh.is_set():
+                if self.live:
+                    self.handler._render_text(f"tick {int(time.time())}")
+                    self._wait_interruptible(1.0)
+                else:
+                    self._wait_interruptible(60)
+
+
+def measure(name, seconds, wakeups):
+    """Wakeups per second during the next *seconds*; *wakeups* reads a counter."""
+    sleeps.clear()
+    before = wakeups()
+    _sleep(seconds)
+    rate = (wakeups() - before) / seconds
+    per_thread = {k: round(v / seconds, 1) for k, v in sleeps.items()}
+    return rate, per_thread
+
+
+def run_scheduler(fonts):
+    mode = {"live": False}
+
+    def slides():
+        _sleep(1.0)                      # a slow provider, to show the spinner
+        if mode["live"]:
+            return [{"type": "text", "content": "tick 0",
+                     "live": lambda: f"tick {int(time.time())}"}]
+        return [{"type": "text", "content": "A static slide\nwith two lines"}]
+
+    handler = SlideshowHandler([slides], NullDisplay(), fonts.default, fonts=fonts,
+                               text_display_time=60)
+    threading.Thread(target=handler.run, daemon=True, name="slideshow").start()
+    wakeups = lambda: handler.scheduler.wakeups
+
+    results = [measure(*PHASES[0], wakeups)]
+    _sleep(0.3)
+    results.append(measure(*PHASES[1], wakeups))
+    mode["live"] = True
+    handler.scheduler.call_soon(handler._do_refresh)
+    _sleep(1.3)
+    results.append(measure(*PHASES[2], wakeups))
+    handler.stop()
+    return results
+
+
+def run_polling(fonts):
+    handler = SlideshowHandler([], NullDisplay(), fonts.default, fonts=fonts)
+    loop = PollingLoop(handler)
+    threading.Thread(target=loop.run, daemon=True, name="slideshow").start()
+    # Every sleep() on the loop's thread is one wakeup
+    wakeups = lambda: sleeps["slideshow"]
+
+    results = [measure(*PHASES[0], wakeups)]
+    _sleep(0.3)
+    results.append(measure(*PHASES[1], wakeups))
+    loop.live = True
+    loop.refresh.set()
+    _sleep(1.3)
+    results.append(measure(*PHASES[2], wakeups))
+    loop.stopped = True
+    loop.refresh.set()
+    handler.stop()
+    return results
+
+
+def main():
+    fonts = configure_fonts()
+    before = run_polling(fonts)
+    after = run_scheduler(fonts)
+
+    print("Wakeups per second, per phase:")
+    print(f"  {'phase':<17}{'sleep-polling':>14}{'scheduler':>11}   sleep() calls/s (scheduler)")
+    for (name, _), (old, _), (new, per_thread) in zip(PHASES, before, after):
+        print(f"  {name:<17}{old:>14.1f}{new:>11.1f}   {per_thread or 0}")
+
+
+if __name__ == "__main__":
+    main()
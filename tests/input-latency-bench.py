@@ -0,0 +1,167 @@
+"""Input-to-photon latency: encoder detent to the new slide fully on glass.
+
+Runs the real RotaryEncoder (edge-alert mode, on tests/mock_lgpio.py) and
+SlideshowHandler against a recording display that simulates SPI transfer
+time.  Synthetic edge traces are replayed in real time and each input is
+timed from the encoder callback to the completion of the first full frame
+showing the expected slide.
+
+Scenarios:
+    single   one detent at a time
+    spin     a fast spin of 6 detents in ~60 ms (timed from the last one)
+    restart  a button press jumping back to slide 0
+
+    python tests/input-latency-bench.py [--rounds N] [--spi-hz HZ]
+"""
+import os
+import sys
+import time
+import random
+import threading
+
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "tests"))
+
+import mock_lgpio
+lgpio = mock_lgpio.install()
+
+from ascii_presenter import get_presenter
+from font_manager import configure_fonts
+from rotary_encoder import RotaryEncoder
+from slideshow_handler import SlideshowHandler
+
+CLK, DT, SW = 17, 23, 24
+WIDTH, HEIGHT = 320, 240
+SLIDES = 24
+MS = 1_000_000
+
+
+class RecordingDisplay:
+    """ST7789 stand-in: sleeps for the SPI time and logs finished frames."""
+
+    def __init__(self, spi_hz, on_frame):
+        self.byte_time = 8.0 / spi_hz
+        self.on_frame = on_frame
+        self._window = None
+        self._remaining = 0
+
+    def set_window(self, x0, y0, x1, y1):
+        self._window = (x0, y0, x1, y1)
+        self._remaining = (x1 - x0 + 1) * (y1 - y0 + 1) * 2
+
+    def data(self, chunk):
+        time.sleep(len(chunk) * self.byte_time)
+        self._remaining -= len(chunk)
+        if self._remaining <= 0 and self._window == (0, 0, WIDTH - 1, HEIGHT - 1):
+            self.on_frame()
+
+    def display(self, img):
+        time.sleep(WIDTH * HEIGHT * 2 * self.byte_time)
+        self.on_frame()
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    if not ordered:
+        return float("nan")
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+class Bench:
+    def __init__(self, spi_hz):
+        fonts = configure_fonts()
+        presenter = get_presenter()
+        deck = [presenter.make_text_slide(f"SLIDE {i}", f"Body text for slide {i}. " * 6)[0]
+                for i in range(SLIDES)]
+        self.frames = []            # (perf_counter, slide index) per finished frame
+        self.disp = RecordingDisplay(spi_hz, self._frame_done)
+        self.slideshow = SlideshowHandler([lambda: deck], self.disp, fonts.default,
+                                          fonts=fonts, text_display_time=5)
+
+        lgpio.reset({CLK: 1, DT: 1, SW: 1})
+        self.encoder = RotaryEncoder(mode="alert")
+        self.last_input = 0.0
+        self.encoder.on_rotate = self._rotate
+        self.encoder.on_button = self._button
+        self.encoder.start()
+
+    def _frame_done(self):
+        self.frames.append((time.perf_counter(), self.slideshow.current_index))
+
+    def _rotate(self, direction):
+        self.last_input = time.perf_counter()
+        if direction == 'CLOCKWISE':
+            self.slideshow.next_slide(triggered_by_encoder=True)
+        else:
+            self.slideshow.prev_slide(triggered_by_encoder=True)
+
+    def _button(self):
+        self.last_input = time.perf_counter()
+        self.slideshow.restart_slideshow()
+
+    def measure(self, trace, target):
+        """Replay *trace* and return ms until *target* is fully displayed."""
+        lgpio.replay(trace, realtime=True)
+        sent = self.last_input
+        deadline = time.perf_counter() + 2.0
+        while time.perf_counter() < deadline:
+            for stamp, index in self.frames:
+                if stamp >= sent and index == target:
+                    return (stamp - sent) * 1000
+            time.sleep(0.0005)
+        return None
+
+    def run(self, rounds):
+        threading.Thread(target=self.slideshow.run, daemon=True).start()
+        while not self.frames:
+            time.sleep(0.01)
+
+        results = {"single": [], "spin": [], "restart": []}
+        missed = 0
+        for _ in range(rounds):
+            for scenario in results:
+                # Let the previous slide settle, with jitter against the
+                # 10 ms-style polling periods
+                time.sleep(0.08 + random.random() * 0.02)
+                index = self.slideshow.current_index
+                if scenario == "single":
+                    trace, target = lgpio.detent_trace(CLK, DT, 1, period_ns=8 * MS), index + 1
+                elif scenario == "spin":
+                    trace, target = lgpio.detent_trace(CLK, DT, 6, period_ns=10 * MS), index + 6
+                else:
+                    trace, target = lgpio.press_trace(SW, hold_ns=20 * MS), 0
+                # A restart lands on slide 0: start it from elsewhere
+                if scenario == "restart" and index == 0:
+                    continue
+                latency = self.measure(trace, target % SLIDES)
+                if latency is None:
+                    missed += 1
+                else:
+                    results[scenario].append(latency)
+        self.encoder.stop()
+        return results, missed
+
+
+def main():
+    rounds = int(sys.argv[sys.argv.index("--rounds") + 1]) if "--rounds" in sys.argv else 30
+    spi_hz = float(sys.argv[sys.argv.index("--spi-hz") + 1]) if "--spi-hz" in sys.argv else 40e6
+    print(f"{rounds} rounds, simulated SPI {spi_hz / 1e6:.0f} MHz "
+          f"(full frame {WIDTH * HEIGHT * 16 / spi_hz * 1000:.1f} ms)\n")
+
+    bench = Bench(spi_hz)
+    results, missed = bench.run(rounds)
+
+    print(f"{'scenario':<10}{'n':>4}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}")
+    for scenario, values in results.items():
+        print(f"{scenario:<10}{len(values):>4}{percentile(values, 50):>9.1f}"
+              f"{percentile(values, 95):>9.1f}{percentile(values, 99):>9.1f}"
+              f"{max(values or [float('nan')]):>9.1f}")
+    stats = bench.slideshow.input.stats()
+    print(f"\ninput events {stats['received']}, coalesced {stats['coalesced']}, "
+          f"frames cancelled {bench.slideshow.frames_cancelled}, missed {missed}")
+    print(f"display output {bench.slideshow.output.stats()}")
+
+
+if __name__ == "__main__":
+    main()
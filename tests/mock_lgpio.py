@@ -0,0 +1,151 @@
+"""Stand-in for the lgpio module, for running encoder code off the Pi.
+
+Install it before importing anything that does ``import lgpio``:
+
+    import mock_lgpio
+    mock_lgpio.install()
+
+Line levels live in ``levels``; ``replay`` feeds a trace of
+``(timestamp_ns, gpio, level)`` edges to the registered alert callbacks
+(optionally in real time), and ``reads`` counts gpio_read calls.
+"""
+import sys
+import json
+import time
+import threading
+
+RISING_EDGE = 1
+FALLING_EDGE = 2
+BOTH_EDGES = 3
+
+levels = {}
+reads = 0
+_callbacks = []
+_lock = threading.Lock()
+
+
+def install():
+    """Make ``import lgpio`` return this module."""
+    sys.modules["lgpio"] = sys.modules[__name__]
+    return sys.modules[__name__]
+
+
+def reset(initial=None):
+    """Forget callbacks and counters; set starting levels (default all high)."""
+    global reads
+    levels.clear()
+    levels.update(initial or {})
+    reads = 0
+    del _callbacks[:]
+
+
+# ── the subset of the lgpio API the repo uses ──────────────────────────────
+
+def gpiochip_open(chip):
+    return chip
+
+
+def gpiochip_close(handle):
+    pass
+
+
+def gpio_claim_input(handle, gpio, lFlags=0):
+    levels.setdefault(gpio, 1)
+
+
+def gpio_claim_alert(handle, gpio, eFlags, lFlags=0, notify_handle=None):
+    levels.setdefault(gpio, 1)
+
+
+def gpio_read(handle, gpio):
+    global reads
+    reads += 1
+    return levels.get(gpio, 1)
+
+
+class _Callback:
+    def __init__(self, gpio, edge, func):
+        self.gpio, self.edge, self.func = gpio, edge, func
+
+    def cancel(self):
+        with _lock:
+            if self in _callbacks:
+                _callbacks.remove(self)
+
+
+def callback(handle, gpio, edge=RISING_EDGE, func=None):
+    cb = _Callback(gpio, edge, func)
+    with _lock:
+        _callbacks.append(cb)
+    return cb
+
+
+# ── driving the lines ──────────────────────────────────────────────────────
+
+def set_level(gpio, level, timestamp=None):
+    """Change a line and deliver the edge to matching callbacks."""
+    if levels.get(gpio, 1) == level:
+        return
+    levels[gpio] = level
+    timestamp = time.monotonic_ns() if timestamp is None else timestamp
+    edge = RISING_EDGE if level else FALLING_EDGE
+    with _lock:
+        targets = [cb for cb in _callbacks if cb.gpio == gpio and cb.edge & edge]
+    for cb in targets:
+        cb.func(0, gpio, level, timestamp)
+
+
+def replay(trace, realtime=False):
+    """Deliver ``(timestamp_ns, gpio, level)`` edges in order.
+
+    With *realtime* the gaps between timestamps are slept, and edges are
+    stamped on the monotonic clock at their scheduled time (lgpio stamps
+    the edge itself, not when the callback gets to run).
+    """
+    start_wall = time.monotonic_ns()
+    start_trace = trace[0][0] if trace else 0
+    for timestamp, gpio, level in trace:
+        if realtime:
+            offset = timestamp - start_trace
+            delay = offset - (time.monotonic_ns() - start_wall)
+            if delay > 0:
+                time.sleep(delay / 1e9)
+            timestamp = start_wall + offset
+        set_level(gpio, level, timestamp)
+
+
+def load_trace(path):
+    """Read a trace written by tests/encoder-replay.py --record (JSON lines)."""
+    with open(path) as f:
+        return [tuple(json.loads(line)) for line in f if line.strip()]
+
+
+def detent_trace(clk, dt, clicks, start_ns=0, period_ns=20_000_000, bounce=0,
+                 bounce_ns=50_000):
+    """Synthesize edges for *clicks* detents (negative = anticlockwise).
+
+    Each detent is one full quadrature cycle from the both-high rest
+    state.  *bounce* extra chatter pulses follow every edge.
+    """
+    cw = [(clk, 0), (dt, 0), (clk, 1), (dt, 1)]
+    ccw = [(dt, 0), (clk, 0), (dt, 1), (clk, 1)]
+    trace, t = [], start_ns
+    quarter = period_ns // 4
+    for _ in range(abs(clicks)):
+        for gpio, level in (cw if clicks > 0 else ccw):
+            trace.append((t, gpio, level))
+            for b in range(bounce):
+                trace.append((t + (2 * b + 1) * bounce_ns, gpio, 1 - level))
+                trace.append((t + (2 * b + 2) * bounce_ns, gpio, level))
+            t += quarter
+    return trace
+
+
+def press_trace(sw, start_ns=0, hold_ns=150_000_000, chatter=0, chatter_ns=200_000):
+    """Synthesize a button press and release with optional contact chatter."""
+    trace = [(start_ns, sw, 0)]
+    for b in range(chatter):
+        trace.append((start_ns + (2 * b + 1) * chatter_ns, sw, 1))
+        trace.append((start_ns + (2 * b + 2) * chatter_ns, sw, 0))
+    trace.append((start_ns + hold_ns, sw, 1))
+    return trace
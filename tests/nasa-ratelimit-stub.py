@@ -0,0 +1,114 @@
+"""Exercise the NASA request scheduler against a local stub server.
+
+The stub mimics api.nasa.gov: it counts requests per api_key, reports
+X-RateLimit-Limit / X-RateLimit-Remaining, and answers 429 once the quota
+is spent.  Several simulated devices share one key; then one device runs
+with DEMO_KEY and the default reserve, which must still get requests out.
+
+    python tests/nasa-ratelimit-stub.py
+"""
+import os
+import sys
+import json
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, ROOT)
+
+from neo_module.ratelimit import NasaScheduler, RateLimited
+
+SERVER_LIMIT = 40
+DEMO_LIMIT = 30
+DEMO_REQUESTS = 30
+DEVICES = 4
+REQUESTS_PER_DEVICE = 20
+
+served = Counter()
+rejected = Counter()
+
+
+class StubNasa(BaseHTTPRequestHandler):
+    def do_GET(self):
+        key = parse_qs(urlparse(self.path).query).get("api_key", [""])[0]
+        limit = DEMO_LIMIT if key == "DEMO_KEY" else SERVER_LIMIT
+        remaining = limit - served[key]
+        if remaining <= 0:
+            rejected[key] += 1
+            self.send_response(429)
+            self.send_header("Retry-After", "120")
+            body = b'{"error": "OVER_RATE_LIMIT"}'
+        else:
+            served[key] += 1
+            self.send_response(200)
+            body = json.dumps({"path": self.path}).encode()
+        self.send_header("X-RateLimit-Limit", str(limit))
+        self.send_header("X-RateLimit-Remaining", str(max(0, remaining - 1)))
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def device(n, base_url, outcomes):
+    sched = NasaScheduler(reserve=5, coalesce_ttl=30, state_file=None)
+    for i in range(REQUESTS_PER_DEVICE):
+        # Every device repeats the feed call; coalescing collapses repeats
+        url = f"{base_url}/DONKI/{'GST' if i % 2 else 'FLR'}"
+        params = {"api_key": "SHARED", "startDate": f"day{i // 4}"}
+        try:
+            sched.get(url, params=params, timeout=5)
+            outcomes["ok"] += 1
+        except RateLimited:
+            outcomes["deferred"] += 1
+        except Exception as e:
+            outcomes[type(e).__name__] += 1
+    outcomes[f"quota{n}"] = sched.quota()
+
+
+def demo_key(base_url):
+    sched = NasaScheduler(coalesce_ttl=0, state_file=None)
+    outcomes = Counter()
+    for i in range(DEMO_REQUESTS):
+        try:
+            sched.get(f"{base_url}/neo/rest/v1/feed",
+                      params={"api_key": "DEMO_KEY", "start_date": f"day{i}"}, timeout=5)
+            outcomes["ok"] += 1
+        except RateLimited:
+            outcomes["deferred"] += 1
+    return outcomes, sched.quota()
+
+
+def main():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubNasa)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    outcomes = Counter()
+    threads = [threading.Thread(target=device, args=(n, base_url, outcomes))
+               for n in range(DEVICES)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    demo, demo_quota = demo_key(base_url)
+    server.shutdown()
+
+    print(f"calls made by devices : {DEVICES * REQUESTS_PER_DEVICE}")
+    print(f"served upstream       : {served['SHARED']} / limit {SERVER_LIMIT}")
+    print(f"429s from upstream    : {rejected['SHARED']}")
+    print(f"answered (incl. coalesced): {outcomes['ok']}, deferred locally: {outcomes['deferred']}")
+    for n in range(DEVICES):
+        print(f"device {n} quota: {outcomes[f'quota{n}']}")
+    print(f"\nDEMO_KEY, default reserve: {demo['ok']} served, {demo['deferred']} deferred"
+          f" (limit {DEMO_LIMIT})")
+    print(f"DEMO_KEY quota: {demo_quota}")
+
+
+if __name__ == "__main__":
+    main()
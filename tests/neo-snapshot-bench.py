@@ -0,0 +1,90 @@
+"""Compare the raw NeoWs cache against the slim NEO snapshot.
+
+Reports file size, load+parse time and resident (tracemalloc) size of
+what each format keeps in memory.  Both cache files are written from the
+raw feed in neo_cache.json, and each row times the file it reports.
+
+    python tests/neo-snapshot-bench.py
+"""
+import os
+import sys
+import json
+import time
+import tempfile
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, ROOT)
+
+from neo_module.snapshot import parse_feed, pack, unpack, split_by_hazard
+
+RAW_FEED = os.path.join(ROOT, "neo_cache.json")
+ROUNDS = 200
+
+
+def legacy_load(path):
+    """What get_neo_slides used to do: load the raw-feed cache and sort it all."""
+    with open(path) as f:
+        data = json.load(f)
+    asteroids = []
+    for _, objs in data["neo"]["near_earth_objects"].items():
+        for obj in objs:
+            approach = obj["close_approach_data"][0]
+            asteroids.append({
+                "name": obj["name"],
+                "hazardous": obj["is_potentially_hazardous_asteroid"],
+                "distance_km": float(approach["miss_distance"]["kilometers"]),
+                "speed_kmh": float(approach["relative_velocity"]["kilometers_per_hour"]),
+                "approach_time": approach["close_approach_date_full"],
+                "diameter": f"{obj['estimated_diameter']['meters']['estimated_diameter_min']:.0f}-{obj['estimated_diameter']['meters']['estimated_diameter_max']:.0f} m"
+            })
+    hazardous = sorted([a for a in asteroids if a["hazardous"]], key=lambda x: x["distance_km"])
+    non_hazardous = sorted([a for a in asteroids if not a["hazardous"]], key=lambda x: x["distance_km"])
+    return data, (hazardous, non_hazardous)
+
+
+def snapshot_load(path):
+    with open(path) as f:
+        table = json.load(f)
+    return split_by_hazard(unpack(table))
+
+
+def timed(fn, path):
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        fn(path)
+    return (time.perf_counter() - start) / ROUNDS * 1000
+
+
+def resident(fn, path):
+    tracemalloc.start()
+    kept = fn(path)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return size
+
+
+def main():
+    # Write the legacy cache exactly as save_cache used to (indent=2)
+    with open(RAW_FEED) as f:
+        feed = json.load(f)
+    tmp = tempfile.mkdtemp()
+    raw_path = os.path.join(tmp, "raw.json")
+    slim_path = os.path.join(tmp, "slim.json")
+    with open(raw_path, "w") as f:
+        json.dump({"neo": feed}, f, indent=2)
+    with open(slim_path, "w") as f:
+        json.dump(pack(parse_feed(feed)), f, separators=(",", ":"))
+
+    rows = [
+        ("raw feed", raw_path, os.path.getsize(raw_path), legacy_load),
+        ("snapshot", slim_path, os.path.getsize(slim_path), snapshot_load),
+    ]
+    print(f"{'format':<10}{'file':>10}{'load ms':>10}{'resident':>12}")
+    for name, path, size, fn in rows:
+        print(f"{name:<10}{size:>9}B{timed(fn, path):>10.3f}{resident(fn, path):>11}B")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Wall-clock deck pre-render time, in-process vs a process pool.
+
+Builds a deck like a real refresh (framed text slides plus large local
+photos that need LANCZOS fitting) and times rendering every frame to
+RGB565: once serially in this process, then with DeckPrerenderer at
+1, 2 and 4 workers.  Also checks pool frames match show-time rendering.
+
+    python tests/prerender-bench.py [--text N] [--images N]
+"""
+import os
+import sys
+import time
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np
+from PIL import Image
+
+from ascii_presenter import get_presenter
+from display_output import image_to_rgb565
+from font_manager import configure_fonts
+from prerender import DeckPrerenderer, slide_job, render_job
+
+WIDTH, HEIGHT = 320, 240
+
+
+def build_deck(text_slides, image_slides, tmpdir):
+    presenter = get_presenter()
+    deck = [presenter.make_text_slide(f"SLIDE {i}", f"Forecast line {i}: clear skies. " * 5)[0]
+            for i in range(text_slides)]
+    rng = np.random.default_rng(1)
+    for i in range(image_slides):
+        path = os.path.join(tmpdir, f"photo{i}.jpg")
+        noise = rng.integers(0, 255, (1200, 1600, 3), dtype=np.uint8)
+        Image.fromarray(noise, "RGB").save(path, quality=90)
+        deck.append({"type": "image", "image": path})
+    return deck
+
+
+def serial(deck, fonts):
+    started = time.perf_counter()
+    for slide in deck:
+        img = render_job(slide_job(slide, fonts.default_size), WIDTH, HEIGHT, fonts)
+        image_to_rgb565(img)
+    return time.perf_counter() - started
+
+
+def main():
+    text_count = int(sys.argv[sys.argv.index("--text") + 1]) if "--text" in sys.argv else 40
+    image_count = int(sys.argv[sys.argv.index("--images") + 1]) if "--images" in sys.argv else 8
+    fonts = configure_fonts()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        deck = build_deck(text_count, image_count, tmpdir)
+        print(f"{text_count} text + {image_count} image slides, {os.cpu_count()} CPU(s)\n")
+        baseline = serial(deck, fonts)
+        print(f"  in-process   {baseline:6.2f} s")
+
+        pools = {w: DeckPrerenderer(w, fonts, WIDTH, HEIGHT) for w in (1, 2, 4)}
+        for workers, pool in pools.items():
+            started = time.perf_counter()
+            frames = pool.render(deck, fonts.default_size)
+            elapsed = time.perf_counter() - started
+            print(f"  {workers} worker(s)  {elapsed:6.2f} s   x{baseline / elapsed:4.2f}"
+                  f"   ({len(frames)} frames)")
+
+        # Pool frames must match what the handler would draw at show time
+        frames = pools[2].render(deck, fonts.default_size)
+        mismatched = 0
+        for i, slide in enumerate(deck):
+            local = render_job(slide_job(slide, fonts.default_size),
+                               WIDTH, HEIGHT, fonts)
+            if frames[i].image.tobytes() != local.tobytes() \
+                    or frames[i].rgb565 != image_to_rgb565(local):
+                mismatched += 1
+        print(f"\n  frames differing from in-process render: {mismatched}")
+        for pool in pools.values():
+            pool.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Refresh latency with hung and failing providers, under a deadline.
+
+Runs ProviderRunner.collect over a deck of fake providers: three quick
+ones, one that hangs forever from the second refresh on (a TCP
+connection with no timeout), one that turns slow, and one that starts
+raising.  Each refresh should take no more than the deadline, and
+the misbehaving providers should come back as their last good slides,
+marked stale.
+
+    python tests/provider-deadline-bench.py [--deadline S] [--rounds N]
+"""
+import os
+import sys
+import time
+import threading
+
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, ROOT)
+
+from providers import ProviderRunner
+
+hang = threading.Event()      # never set
+state = {"round": 0}
+
+
+def quick(name, count=1):
+    def provider():
+        time.sleep(0.05)
+        return [{"type": "text", "content": f"{name} {i}"} for i in range(count)]
+    provider.__name__ = name
+    return provider
+
+
+def neo():
+    if state["round"] > 0:
+        hang.wait()
+    return [{"type": "text", "content": f"NEO {i}"} for i in range(5)]
+
+
+def weather():
+    time.sleep(0.1 if state["round"] < 2 else 5.0)
+    return [{"type": "text", "content": f"Temp {60 + state['round']}F"}]
+
+
+def meditation():
+    if state["round"] >= 1:
+        raise ConnectionError("zenquotes.io unreachable")
+    return [{"type": "text", "content": "Be here now."}]
+
+
+PROVIDERS = [quick("welcome"), quick("location"), weather, neo,
+             quick("climate"), meditation, quick("inaturalist", 2)]
+
+
+def main():
+    deadline = float(sys.argv[sys.argv.index("--deadline") + 1]) if "--deadline" in sys.argv else 1.0
+    rounds = int(sys.argv[sys.argv.index("--rounds") + 1]) if "--rounds" in sys.argv else 4
+    runner = ProviderRunner(deadline)
+
+    print(f"deadline {deadline} s\n")
+    for r in range(rounds):
+        state["round"] = r
+        started = time.monotonic()
+        slides = runner.collect(PROVIDERS)
+        elapsed = time.monotonic() - started
+        stale = sum(1 for s in slides if s.get("stale"))
+        outcomes = " ".join(f"{e['provider']}={e['outcome']}" for e in runner.last_run
+                            if e["outcome"] != "ok")
+        print(f"refresh {r}: {elapsed:5.2f} s  {len(slides):>2} slides ({stale} stale)"
+              f"  {outcomes or 'all ok'}")
+        assert elapsed < deadline + 0.5, "refresh overran its deadline"
+    print(f"\nthreads alive at exit: {threading.active_count() - 1} (abandoned calls)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Start-up cost of the provider modules: eager imports vs the registry.
+
+Each case runs in a fresh interpreter and reports the time to get the
+providers ready, how many modules were imported, and whether the
+network-touching timezone_config was imported.
+
+    eager      import every provider's slide module (what nature-oracle did)
+    registry   ProviderRegistry.add_module for every provider
+    disabled   the registry with neo and iNaturalist disabled
+    first use  the registry, then loading one provider as a refresh would
+
+Needs a secrets.py, as nature-oracle does.
+
+    python tests/provider-startup-bench.py
+"""
+import os
+import sys
+import json
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+MODULES = ["weather_module", "neo_module", "climate_module",
+           "meditation_module", "inaturalist_module"]
+
+SETUP = f"""
+import sys, time, json
+sys.path.insert(0, {ROOT!r})
+before = len(sys.modules)
+started = time.perf_counter()
+"""
+
+REPORT = """
+elapsed = time.perf_counter() - started
+print(json.dumps({"ms": elapsed * 1000, "modules": len(sys.modules) - before,
+                  "timezone": "timezone_config" in sys.modules}))
+"""
+
+REGISTRY = f"""
+from providers import ProviderRegistry
+registry = ProviderRegistry()
+registry.dependency("location", dict)
+registry.dependency("timezone", dict)
+for package in {MODULES!r}:
+    registry.add_module(package, enabled=package not in DISABLED)
+"""
+
+CASES = {
+    "eager": "\n".join(f"import {m}.slides" for m in MODULES),
+    "registry": "DISABLED = ()\n" + REGISTRY,
+    "disabled": "DISABLED = ('neo_module', 'inaturalist_module')\n" + REGISTRY,
+    "first use": "DISABLED = ()\n" + REGISTRY + "registry.providers[2]._load()\n",
+}
+
+
+def run(body):
+    out = subprocess.run([sys.executable, "-c", SETUP + body + REPORT],
+                         capture_output=True, text=True, cwd=ROOT, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    print(f"{'case':<10} {'ms':>8} {'modules':>8}  timezone lookup")
+    for name, body in CASES.items():
+        # Best of three, so a cold disk cache doesn't dominate
+        result = min((run(body) for _ in range(3)), key=lambda r: r["ms"])
+        print(f"{name:<10} {result['ms']:>8.1f} {result['modules']:>8}  "
+              f"{'yes' if result['timezone'] else 'no'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Compare the old per-module wrappers with the text_layout engine.
+
+The old path wrapped at a module-specific character limit (30-35) and
+AsciiPresenter then re-wrapped the body at 28 columns with textwrap, so
+lines could split twice and pages could run past the box's 8 body rows
+(the extra rows are cut off by _box).  Reports, for a set of sample
+texts, how many body rows each path loses to truncation and the time
+per wrap.
+
+    python tests/text-layout-bench.py
+"""
+import os
+import sys
+import time
+import textwrap
+
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, ROOT)
+
+from text_layout import wrap_text_into_slides, wrap_lines, box_inner_px, BOX_BODY_ROWS
+
+ROUNDS = 500
+
+SAMPLES = [
+    "GST Event\nDate: 2025-03-14T09:00Z\n\nA geomagnetic storm reached Kp 7 "
+    "following the arrival of a coronal mass ejection first observed by "
+    "SOHO/LASCO C2. Auroral activity may be visible at mid-latitudes tonight.",
+    "CME Event\nDate: 2025-03-12T18:24Z\n\nFull halo CME seen in SOHO LASCO "
+    "C2/C3 and STEREO A COR2 imagery, associated with an X1.1 flare from "
+    "Active Region 13998 (N15W22). Arrival estimated 2025-03-14T06:00Z "
+    "plus or minus 7 hours. Kp 5-7 predicted.",
+    "POTENTIALLY HAZARDOUS ASTEROID (2004 SU55)\nDiameter: 120-270 m\n"
+    "Miss Distance: 4512345 km\nSpeed: 74123 km/h\nTime until approach: 2d 4h 12m",
+    "https://api.nasa.gov/DONKI/notifications?type=all&startDate=2025-03-12 "
+    "contains the full report for this interplanetary shock.",
+]
+
+
+def legacy_slides(text, max_chars=35, max_lines_per_slide=8):
+    """The character-count wrapper the modules used to carry."""
+    wrapped_lines = []
+    for para in text.split("\n"):
+        words, current_line, current_len = para.split(), [], 0
+        for word in words:
+            if current_len + len(word) + (1 if current_line else 0) > max_chars:
+                wrapped_lines.append(" ".join(current_line))
+                current_line, current_len = [word], len(word)
+            else:
+                current_line.append(word)
+                current_len += len(word) + (1 if current_line else 0)
+        if current_line:
+            wrapped_lines.append(" ".join(current_line))
+        if not para.strip():
+            wrapped_lines.append("")
+    return ["\n".join(wrapped_lines[i:i + max_lines_per_slide])
+            for i in range(0, len(wrapped_lines), max_lines_per_slide)]
+
+
+def legacy_rewrap(text):
+    """AsciiPresenter._wrap before text_layout."""
+    out = []
+    for line in text.split("\n"):
+        out.extend(textwrap.wrap(line, 28) if line.strip() else [""])
+    return out
+
+
+def lost_rows(pages, rewrap):
+    """Body rows past the box height once each page is framed (title = line 1)."""
+    lost = 0
+    for page in pages:
+        body = page.split("\n", 1)[1] if "\n" in page else ""
+        lost += max(0, len(rewrap(body)) - BOX_BODY_ROWS)
+    return lost
+
+
+def timed(fn, text):
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        fn(text)
+    return (time.perf_counter() - start) / ROUNDS * 1e6
+
+
+def main():
+    max_px = box_inner_px()
+    print(f"box interior: {max_px:.0f} px, {BOX_BODY_ROWS} body rows\n")
+    print(f"{'sample':>6} {'old pages':>9} {'old lost':>8} {'old us':>7} "
+          f"{'new pages':>9} {'new lost':>8} {'new us':>7}")
+    for i, text in enumerate(SAMPLES):
+        old = legacy_slides(text)
+        new = wrap_text_into_slides(text)
+        print(f"{i:>6} {len(old):>9} {lost_rows(old, legacy_rewrap):>8} "
+              f"{timed(legacy_slides, text):>7.1f} {len(new):>9} "
+              f"{lost_rows(new, lambda t: wrap_lines(t, max_px)):>8} "
+              f"{timed(wrap_text_into_slides, text):>7.1f}")
+
+    widest = max(box_inner_px(1) * len(line)
+                 for text in SAMPLES for line in wrap_lines(text, max_px))
+    print(f"\nwidest engine line: {widest:.0f} px (limit {max_px:.0f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# text_layout.py
+"""
+One text-layout engine for every module.
+
+Lines are wrapped by measured pixel width, using the font manager's cached
+per-glyph advances at the size the slide will be drawn in, and paginated
+into the body rows of the standard ASCII box.  This replaces the per-module
+``wrap_text_into_slides`` copies (each with its own character limit) and
+the textwrap pass in AsciiPresenter.
+"""
+from functools import lru_cache
+
+from font_manager import get_fonts
+
+# Body area of the default 32x12 box: "│ " + 28 columns + " │", 8 rows
+BOX_INNER_COLUMNS = 28
+BOX_BODY_ROWS = 8
+
+
+@lru_cache(maxsize=8192)
+def text_width(text, font_size=None):
+    """Rendered width of *text* in pixels (cached per string and size)."""
+    return get_fonts().advance(font_size, text)
+
+
+def box_inner_px(columns=BOX_INNER_COLUMNS, font_size=None):
+    """Pixel width of *columns* character cells at *font_size*."""
+    return columns * get_fonts().cell_size(font_size)[0]
+
+
+def _split_long_word(word, max_px, font_size):
+    """Break a word wider than *max_px* into pieces that each fit."""
+    pieces, current = [], ""
+    for ch in word:
+        if current and text_width(current + ch, font_size) > max_px:
+            pieces.append(current)
+            current = ch
+        else:
+            current += ch
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def wrap_lines(text, max_px=None, font_size=None):
+    """Greedy word wrap of *text* to lines no wider than *max_px* pixels.
+
+    Explicit newlines are kept and blank lines are preserved as "".
+    *max_px* defaults to the default box's inner width.
+    """
+    if max_px is None:
+        max_px = box_inner_px(font_size=font_size)
+    space = text_width(" ", font_size)
+    lines = []
+    for para in text.split("\n"):
+        words = para.split()
+        if not words:
+            lines.append("")
+            continue
+        current, used = [], 0.0
+        for word in words:
+            width = text_width(word, font_size)
+            if width > max_px:
+                pieces = _split_long_word(word, max_px, font_size)
+                if current:
+                    lines.append(" ".join(current))
+                lines.extend(pieces[:-1])
+                current, used = [pieces[-1]], text_width(pieces[-1], font_size)
+            elif current and used + space + width > max_px:
+                lines.append(" ".join(current))
+                current, used = [word], width
+            else:
+                used += (space if current else 0) + width
+                current.append(word)
+        if current:
+            lines.append(" ".join(current))
+    return lines
+
+
+def paginate(lines, rows=BOX_BODY_ROWS):
+    """Split *lines* into pages of at most *rows* lines."""
+    return [lines[i:i + rows] for i in range(0, len(lines), rows)] or [[]]
+
+
+def wrap_text_into_slides(text, max_lines_per_slide=BOX_BODY_ROWS, max_px=None,
+                          font_size=None):
+    """Wrap *text* to the box width and split it into per-slide strings."""
+    return ["\n".join(page)
+            for page in paginate(wrap_lines(text, max_px, font_size), max_lines_per_slide)]
@@ -1,4 +1,22 @@
 # weather_module/__init__.py
-from .slides import get_weather_slides
+import importlib
 
-__all__ = ["get_weather_slides"]
+# Read by ProviderRegistry.add_module; see providers.Provider
+PROVIDER = {
+    "name": "weather",
+    "entry": "weather_module.slides:get_weather_slides",
+    "ttl": 900,
+    "timeout": 20,
+    "needs": ("location", "timezone"),
+    "args": ("latitude", "longitude", "tz"),
+}
+
+# Exported lazily so importing the package for PROVIDER stays cheap
+_EXPORTS = {"get_weather_slides": ".slides"}
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,155 @@
+# weather_module/astro.py
+"""
+Local solar engine: sunrise, sunset, twilight, day length and the true
+equinox/solstice instants, with no network access.
+
+Sun times use the NOAA/Wikipedia sunrise equation; seasons use Meeus,
+"Astronomical Algorithms" ch. 27.  Both are vectorised with NumPy so a whole
+year is one call, and single-day lookups are memoised per (day, location).
+Accuracy is about a minute, which is all a 320 px display needs.
+"""
+from datetime import date, datetime, timezone
+from functools import lru_cache
+
+import numpy as np
+
+from .config import COORD_PRECISION
+
+# Sun altitude at the horizon events, in degrees
+SUNRISE_ALTITUDE = -0.833    # refraction + solar radius
+CIVIL_TWILIGHT_ALTITUDE = -6.0
+
+_J2000 = 2451545.0
+_UNIX_EPOCH_JD = 2440587.5
+_J2000_ORDINAL = date(2000, 1, 1).toordinal()
+_OBLIQUITY = np.radians(23.4397)
+_DELTA_T_DAYS = 69.0 / 86400   # TT - UT, close enough for this century
+
+SEASON_EVENTS = ("Spring Equinox", "Summer Solstice", "Fall Equinox", "Winter Solstice")
+
+
+def _jd_to_unix(jd):
+    return (jd - _UNIX_EPOCH_JD) * 86400.0
+
+
+def _hour_angle(lat_rad, decl, altitude):
+    """Hour angle (days) of the sun at *altitude*; NaN when it never gets there."""
+    cos_w = ((np.sin(np.radians(altitude)) - np.sin(lat_rad) * np.sin(decl))
+             / (np.cos(lat_rad) * np.cos(decl)))
+    with np.errstate(invalid="ignore"):
+        return np.degrees(np.arccos(cos_w)) / 360.0
+
+
+def sun_times(lat, lon, days):
+    """Sun events for many days at one location.
+
+    Parameters
+    ----------
+    lat, lon : float
+        Degrees, east longitude positive.
+    days : array-like of int
+        Proleptic Gregorian ordinals (``date.toordinal()``).
+
+    Returns
+    -------
+    dict[str, numpy.ndarray]
+        ``noon``, ``sunrise``, ``sunset``, ``dawn`` and ``dusk`` as Unix
+        timestamps (NaN during polar day/night) and ``day_length`` in hours.
+    """
+    n = np.asarray(days, dtype=np.float64) - _J2000_ORDINAL
+    j_star = n - lon / 360.0
+    m = np.radians((357.5291 + 0.98560028 * j_star) % 360.0)
+    c = 1.9148 * np.sin(m) + 0.02 * np.sin(2 * m) + 0.0003 * np.sin(3 * m)
+    ecliptic_lon = np.radians((np.degrees(m) + c + 180.0 + 102.9372) % 360.0)
+    transit = _J2000 + j_star + 0.0053 * np.sin(m) - 0.0069 * np.sin(2 * ecliptic_lon)
+    decl = np.arcsin(np.sin(ecliptic_lon) * np.sin(_OBLIQUITY))
+
+    lat_rad = np.radians(lat)
+    w_rise = _hour_angle(lat_rad, decl, SUNRISE_ALTITUDE)
+    w_civil = _hour_angle(lat_rad, decl, CIVIL_TWILIGHT_ALTITUDE)
+
+    # Polar day: the sun never sets, so daylight is the whole day
+    always_up = np.sin(lat_rad) * np.sin(decl) > 0
+    day_length = np.where(np.isnan(w_rise), np.where(always_up, 24.0, 0.0),
+                          w_rise * 48.0)
+
+    return {
+        "noon": _jd_to_unix(transit),
+        "sunrise": _jd_to_unix(transit - w_rise),
+        "sunset": _jd_to_unix(transit + w_rise),
+        "dawn": _jd_to_unix(transit - w_civil),
+        "dusk": _jd_to_unix(transit + w_civil),
+        "day_length": day_length,
+    }
+
+
+def year_table(lat, lon, year):
+    """:func:`sun_times` for every day of *year* in one call."""
+    first = date(year, 1, 1).toordinal()
+    return sun_times(lat, lon, np.arange(first, date(year + 1, 1, 1).toordinal()))
+
+
+@lru_cache(maxsize=128)
+def _sun_day(lat, lon, ordinal):
+    table = sun_times(lat, lon, [ordinal])
+    return {k: float(v[0]) for k, v in table.items()}
+
+
+def sun_day(lat, lon, day, tz=timezone.utc):
+    """Sun events for one *day* as aware datetimes in *tz* (``None`` if absent).
+
+    Memoised per day and location rounded to COORD_PRECISION.
+    """
+    raw = _sun_day(round(lat, COORD_PRECISION), round(lon, COORD_PRECISION),
+                   day.toordinal())
+    out = {"day_length": raw["day_length"]}
+    for key in ("noon", "sunrise", "sunset", "dawn", "dusk"):
+        ts = raw[key]
+        out[key] = None if np.isnan(ts) else datetime.fromtimestamp(ts, tz=tz)
+    return out
+
+
+# Meeus table 27.A (years 2000-3000) and periodic terms 27.C
+_MEAN_EVENT_COEFFS = np.array([
+    [2451623.80984, 365242.37404,  0.05169, -0.00411, -0.00057],  # March equinox
+    [2451716.56767, 365241.62603,  0.00325,  0.00888, -0.00030],  # June solstice
+    [2451810.21715, 365242.01767, -0.11575,  0.00337,  0.00078],  # September equinox
+    [2451900.05952, 365242.74049, -0.06223, -0.00823,  0.00032],  # December solstice
+])
+_PERIODIC_TERMS = np.array([
+    [485, 324.96, 1934.136], [203, 337.23, 32964.467], [199, 342.08, 20.186],
+    [182, 27.85, 445267.112], [156, 73.14, 45036.886], [136, 171.52, 22518.443],
+    [77, 222.54, 65928.934], [74, 296.72, 3034.906], [70, 243.58, 9037.513],
+    [58, 119.81, 33718.147], [52, 297.17, 150.678], [50, 21.02, 2281.226],
+    [45, 247.54, 29929.562], [44, 325.15, 31555.956], [29, 60.93, 4443.417],
+    [18, 155.12, 67555.328], [17, 288.79, 4562.452], [16, 198.04, 62894.029],
+    [14, 199.76, 31436.921], [12, 95.39, 14577.848], [12, 287.11, 31931.756],
+    [12, 320.81, 34777.259], [9, 227.73, 1222.114], [8, 15.45, 16859.074],
+])
+
+
+def season_instants(years):
+    """Equinox/solstice instants for each of *years*.
+
+    Returns an array of Unix timestamps shaped ``(len(years), 4)``, columns
+    in SEASON_EVENTS order (March, June, September, December).
+    """
+    y = (np.asarray(years, dtype=np.float64)[:, None] - 2000.0) / 1000.0
+    powers = np.stack([np.ones_like(y), y, y ** 2, y ** 3, y ** 4], axis=-1)
+    jde0 = (powers * _MEAN_EVENT_COEFFS).sum(axis=-1)
+
+    t = (jde0 - _J2000) / 36525.0
+    w = np.radians(35999.373 * t - 2.47)
+    d_lambda = 1 + 0.0334 * np.cos(w) + 0.0007 * np.cos(2 * w)
+    a, b, c = _PERIODIC_TERMS.T
+    s = (a * np.cos(np.radians(b + c * t[..., None]))).sum(axis=-1)
+    jde = jde0 + 0.00001 * s / d_lambda
+    return _jd_to_unix(jde - _DELTA_T_DAYS)
+
+
+@lru_cache(maxsize=8)
+def season_events(year, tz=timezone.utc):
+    """``[(name, datetime), ...]`` for the four season events of *year*."""
+    instants = season_instants([year])[0]
+    return [(name, datetime.fromtimestamp(ts, tz=tz))
+            for name, ts in zip(SEASON_EVENTS, instants)]
@@ -6,3 +6,18 @@ Configuration for weather module
 PLANET = "Earth"
 LAT_DEFAULT = 44.5161
 LON_DEFAULT = -88.0903
+
+# OpenWeatherMap refreshes its data roughly every 10 minutes, so parsed
+# results are reused for that long per (rounded) location
+OWM_CACHE_TTL = 600
+COORD_PRECISION = 2          # decimal places of lat/lon in the cache key (~1 km)
+FORECAST_ENTRIES = 4         # 3-hour steps requested from the forecast API
+REQUEST_TIMEOUT = 10
+
+# Weather history ring buffer (see history.py) and trend slides
+HISTORY_FILE = "weather_history.bin"
+HISTORY_CAPACITY = 16384     # 12 bytes each: ~170 days at one sample / 15 min
+TREND_WINDOWS = [
+    ("48 HOURS", 48 * 3600),
+    ("30 DAYS", 30 * 86400),
+]
@@ -0,0 +1,109 @@
+# weather_module/history.py
+"""
+Fixed-size, memory-mapped ring buffer of weather samples.
+
+Each sample is 12 bytes of scaled integers, so the default 16384 slots
+(about 170 days at one sample per 15 minute refresh) take 192 KB on disk.
+The file is a small header followed by the slots; it survives restarts
+and is written in place, never rewritten wholesale.
+"""
+import os
+import threading
+
+import numpy as np
+
+from .config import HISTORY_FILE, HISTORY_CAPACITY
+
+_MAGIC = b"NOWH"
+_VERSION = 1
+
+_HEADER_DTYPE = np.dtype([
+    ("magic", "S4"), ("version", "<u2"), ("reserved", "<u2"),
+    ("capacity", "<u4"), ("head", "<u4"), ("count", "<u4"), ("pad", "<u4"),
+])
+
+# Scaled so everything fits small integer types
+SAMPLE_DTYPE = np.dtype([
+    ("time", "<u4"),          # unix seconds
+    ("temp", "<i2"),          # 0.1 °F
+    ("pressure", "<u2"),      # 0.1 hPa
+    ("wind", "<u2"),          # 0.1 mph
+    ("humidity", "u1"),       # %
+    ("pad", "u1"),
+])
+_SCALE = {"temp": 10.0, "pressure": 10.0, "wind": 10.0, "humidity": 1.0}
+FIELDS = tuple(_SCALE)
+
+
+class WeatherHistory:
+    def __init__(self, path=HISTORY_FILE, capacity=HISTORY_CAPACITY):
+        self.path = path
+        self._lock = threading.Lock()
+        size = _HEADER_DTYPE.itemsize + capacity * SAMPLE_DTYPE.itemsize
+
+        fresh = not os.path.exists(path) or os.path.getsize(path) != size
+        if fresh:
+            with open(path, "wb") as f:
+                f.truncate(size)
+
+        self._header = np.memmap(path, dtype=_HEADER_DTYPE, mode="r+", shape=(1,))
+        self._slots = np.memmap(path, dtype=SAMPLE_DTYPE, mode="r+",
+                                offset=_HEADER_DTYPE.itemsize, shape=(capacity,))
+        header = self._header[0]
+        if fresh or header["magic"] != _MAGIC or header["version"] != _VERSION \
+                or header["capacity"] != capacity:
+            self._header[0] = (_MAGIC, _VERSION, 0, capacity, 0, 0, 0)
+            self._header.flush()
+
+    @property
+    def capacity(self):
+        return int(self._header["capacity"][0])
+
+    def __len__(self):
+        return int(self._header["count"][0])
+
+    def append(self, timestamp, temp, pressure, humidity, wind):
+        """Store one sample, overwriting the oldest once full."""
+        with self._lock:
+            head = int(self._header["head"][0])
+            self._slots[head] = (
+                int(timestamp),
+                int(round(temp * _SCALE["temp"])),
+                int(round(pressure * _SCALE["pressure"])),
+                int(round(wind * _SCALE["wind"])),
+                int(round(humidity)),
+                0,
+            )
+            self._header["head"][0] = (head + 1) % self.capacity
+            self._header["count"][0] = min(len(self) + 1, self.capacity)
+            self._slots.flush()
+            self._header.flush()
+
+    def since(self, timestamp):
+        """Samples newer than *timestamp*, oldest first, in real units.
+
+        Returns a dict of float arrays keyed by "time" and FIELDS.
+        """
+        with self._lock:
+            count, head = len(self), int(self._header["head"][0])
+            if count < self.capacity:
+                ordered = np.array(self._slots[:count])
+            else:
+                ordered = np.concatenate((self._slots[head:], self._slots[:head]))
+
+        ordered = ordered[ordered["time"] > timestamp]
+        out = {"time": ordered["time"].astype(np.float64)}
+        for field, scale in _SCALE.items():
+            out[field] = ordered[field].astype(np.float64) / scale
+        return out
+
+
+_history = None
+
+
+def get_history():
+    """The process-wide history buffer, opened on first use."""
+    global _history
+    if _history is None:
+        _history = WeatherHistory()
+    return _history
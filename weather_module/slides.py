@@ -1,108 +1,145 @@
 # weather_module/slides.py
-import requests
+import time
+import threading
+import circuit_breaker
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from . import logic
-from timezone_config import LOCAL_TZ  # Global timezone
-from ascii_presenter import AsciiPresenter, MODULE_BANNERS, MODULE_COLORS
+from . import astro, logic
+from .history import get_history
+from .trends import get_trend_slides
+from .config import OWM_CACHE_TTL, COORD_PRECISION, FORECAST_ENTRIES, REQUEST_TIMEOUT
+from ascii_presenter import get_presenter, MODULE_BANNERS, MODULE_COLORS
 from secrets import OWM_API_KEY
 # Initialize presenter (32x12 characters by default)
-presenter = AsciiPresenter()
+presenter = get_presenter()
+
+
+OWM_BASE_URL = "https://api.openweathermap.org/data/2.5"
+
+# (rounded lat, rounded lon) -> (monotonic time, parsed result)
+_weather_cache = {}
+_weather_lock = threading.Lock()
+
+
+def _owm_get(endpoint, lat, lon, **extra):
+    params = {"lat": lat, "lon": lon, "appid": OWM_API_KEY, "units": "imperial"}
+    params.update(extra)
+    r = circuit_breaker.get(f"{OWM_BASE_URL}/{endpoint}", params=params,
+                            timeout=REQUEST_TIMEOUT)
+    r.raise_for_status()
+    return r.json()
+
+
+def _fetch_weather(lat, lon, tz):
+    """Fetch current conditions and the short forecast (times in *tz*) concurrently."""
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        current_future = pool.submit(_owm_get, "weather", lat, lon)
+        # Only the next few 3-hour steps are shown, so only ask for those
+        forecast_future = pool.submit(_owm_get, "forecast", lat, lon,
+                                      cnt=FORECAST_ENTRIES)
+        current_data = current_future.result()
+        forecast_data = forecast_future.result()
+
+    temp = current_data["main"]["temp"]
+    feels = current_data["main"]["feels_like"]
+    humidity = current_data["main"]["humidity"]
+    pressure = current_data["main"]["pressure"]
+    wind_speed = current_data["wind"]["speed"]
+    wind_dir = current_data["wind"].get("deg", 0)
+    desc = current_data["weather"][0]["description"].capitalize()
+
+    # --- Forecast (next few entries, ~3-hour intervals) ---
+    forecast_summaries = []
+    for item in forecast_data.get("list", [])[:FORECAST_ENTRIES]:  # next ~12 hours
+        dt = datetime.fromtimestamp(item["dt"], tz=timezone.utc).astimezone(tz)
+        w = item["weather"][0]["description"].capitalize()
+        t = item["main"]["temp"]
+        ws = item["wind"]["speed"]
+        forecast_summaries.append(f"{dt:%a %I:%M %p}: {w}, {t:.0f}°F, wind {ws:.0f} mph")
+
+    return {
+        "current": (
+            f"{desc}, {temp:.1f}°F (feels {feels:.1f}°F)\n"
+            f"Humidity {humidity}%  Pressure {pressure} hPa\n"
+            f"Wind {wind_speed:.1f} mph @ {wind_dir}°"
+        ),
+        "forecast": forecast_summaries,
+        "sample": {
+            "temp": temp, "pressure": pressure,
+            "humidity": humidity, "wind": wind_speed,
+        },
+    }
+
+
+def get_weather(lat, lon, tz):
+    """Current weather and short-term forecast from OpenWeatherMap.
+
+    Forecast times are shown in *tz*.  Results are cached for OWM_CACHE_TTL seconds per location rounded to
+    COORD_PRECISION decimals; errors are returned but never cached.
+    """
+    key = (round(lat, COORD_PRECISION), round(lon, COORD_PRECISION))
+    with _weather_lock:
+        cached = _weather_cache.get(key)
+        if cached and time.monotonic() - cached[0] < OWM_CACHE_TTL:
+            return cached[1]
 
-
-def get_weather(lat, lon):
-    """Fetch current weather and short-term forecast from OpenWeatherMap."""
     try:
-        # --- Current weather ---
-        current_url = (
-            f"https://api.openweathermap.org/data/2.5/weather?"
-            f"lat={lat}&lon={lon}&appid={OWM_API_KEY}&units=imperial"
-        )
-        current_data = requests.get(current_url, timeout=10).json()
-
-        temp = current_data["main"]["temp"]
-        feels = current_data["main"]["feels_like"]
-        humidity = current_data["main"]["humidity"]
-        pressure = current_data["main"]["pressure"]
-        wind_speed = current_data["wind"]["speed"]
-        wind_dir = current_data["wind"].get("deg", 0)
-        desc = current_data["weather"][0]["description"].capitalize()
-
-        # Convert sunrise/sunset to LOCAL_TZ
-        sunrise_local = datetime.fromtimestamp(
-            current_data["sys"]["sunrise"], tz=timezone.utc
-        ).astimezone(LOCAL_TZ)
-        sunset_local = datetime.fromtimestamp(
-            current_data["sys"]["sunset"], tz=timezone.utc
-        ).astimezone(LOCAL_TZ)
-        daylight_hours = (sunset_local - sunrise_local).seconds / 3600
-
-        # --- Forecast (next few entries, ~3-hour intervals) ---
-        forecast_url = (
-            f"https://api.openweathermap.org/data/2.5/forecast?"
-            f"lat={lat}&lon={lon}&appid={OWM_API_KEY}&units=imperial"
-        )
-        forecast_data = requests.get(forecast_url, timeout=10).json()
-
-        forecast_summaries = []
-        for item in forecast_data.get("list", [])[:4]:  # next ~12 hours
-            dt = datetime.fromtimestamp(item["dt"], tz=timezone.utc).astimezone(LOCAL_TZ)
-            w = item["weather"][0]["description"].capitalize()
-            t = item["main"]["temp"]
-            ws = item["wind"]["speed"]
-            forecast_summaries.append(f"{dt:%a %I:%M %p}: {w}, {t:.0f}°F, wind {ws:.0f} mph")
-
-        return {
-            "current": (
-                f"{desc}, {temp:.1f}°F (feels {feels:.1f}°F)\n"
-                f"Humidity {humidity}%  Pressure {pressure} hPa\n"
-                f"Wind {wind_speed:.1f} mph @ {wind_dir}°"
-            ),
-            "forecast": forecast_summaries,
-            "sunrise_local": sunrise_local.strftime("%I:%M %p %Z"),
-            "sunset_local": sunset_local.strftime("%I:%M %p %Z"),
-            "daylight_hours": round(daylight_hours, 2),
-        }
-
+        result = _fetch_weather(*key, tz)
     except Exception as e:
         return {"error": str(e)}
 
+    with _weather_lock:
+        _weather_cache[key] = (time.monotonic(), result)
 
-def get_weather_slides(lat, lon):
-    """Return a list of weather slides framed with ASCII boxes in the specified order."""
-    slides = []
+    # One history sample per real fetch; cached repeats aren't recorded
+    try:
+        get_history().append(time.time(), **result["sample"])
+    except Exception as e:
+        print(f"[weather_module] Failed to record history: {e}")
+    return result
 
-    # Fetch weather
-    weather_data = get_weather(lat, lon)
-    if "error" in weather_data:
-        slides.extend(presenter.make_text_slide("WEATHER ERROR", weather_data["error"]))
-        return slides
+
+def get_weather_slides(lat, lon, tz=None):
+    """Return a list of weather slides framed with ASCII boxes in the specified order.
+
+    *tz* is the local timezone; without it timezone_config looks it up.
+    """
+    if tz is None:
+        from timezone_config import LOCAL_TZ as tz
+    slides = []
 
     weather_color  = MODULE_COLORS["weather"]
     forecast_color = MODULE_COLORS["forecast"]
     season_color   = MODULE_COLORS["season"]
     daylight_color = MODULE_COLORS["daylight"]
 
-    # --- 1. Current conditions (with weather banner on first slide) ---
-    slides.extend(presenter.make_text_slide(
-        "WEATHER", weather_data["current"],
-        color=weather_color,
-        banner=MODULE_BANNERS["weather"],
-    ))
-
-    # --- 2. Forecast details ---
-    if weather_data.get("forecast"):
-        for entry in weather_data["forecast"]:
-            slides.extend(presenter.make_text_slide(
-                "FORECAST", entry, color=forecast_color,
-            ))
+    # Fetch weather; season and daylight below are computed locally and
+    # are shown even when OWM is unreachable
+    weather_data = get_weather(lat, lon, tz)
+    if "error" in weather_data:
+        slides.extend(presenter.make_text_slide("WEATHER ERROR", weather_data["error"]))
     else:
+        # --- 1. Current conditions (with weather banner on first slide) ---
         slides.extend(presenter.make_text_slide(
-            "FORECAST", "No forecast data available.", color=forecast_color,
+            "WEATHER", weather_data["current"],
+            color=weather_color,
+            banner=MODULE_BANNERS["weather"],
         ))
 
+        # --- 2. Forecast details ---
+        if weather_data.get("forecast"):
+            for entry in weather_data["forecast"]:
+                slides.extend(presenter.make_text_slide(
+                    "FORECAST", entry, color=forecast_color,
+                ))
+        else:
+            slides.extend(presenter.make_text_slide(
+                "FORECAST", "No forecast data available.", color=forecast_color,
+            ))
+
     # --- 3. Season + Astronomical Event ---
-    today = datetime.now(LOCAL_TZ).date()
-    season, start, end, next_event = logic.season_dates(today)
+    today = datetime.now(tz).date()
+    season, start, end, next_event = logic.season_dates(today, tz)
     percent = logic.season_progress(start, end, today)
     days_until = (end - today).days
 
@@ -117,17 +154,29 @@ def get_weather_slides(lat, lon):
     ))
 
     # --- 4. Daylight info ---
-    daylight_text = (
-        f"Daylight hours: {weather_data['daylight_hours']} hrs\n"
-        f"Sunrise: {weather_data['sunrise_local']}\n"
-        f"Sunset:  {weather_data['sunset_local']}"
-    )
+    sun = astro.sun_day(lat, lon, today, tz)
+    if sun["sunrise"] is None:
+        sun_lines = "The sun stays up all day" if sun["day_length"] else "The sun stays down all day"
+    else:
+        sun_lines = (
+            f"Sunrise: {sun['sunrise']:%I:%M %p %Z}\n"
+            f"Sunset:  {sun['sunset']:%I:%M %p %Z}"
+        )
+    if sun["dawn"] is not None:
+        sun_lines += f"\nDawn {sun['dawn']:%I:%M %p} Dusk {sun['dusk']:%I:%M %p}"
+    daylight_text = f"Daylight hours: {sun['day_length']:.2f} hrs\n{sun_lines}"
     slides.extend(presenter.make_text_slide(
         "DAYLIGHT", daylight_text,
         color=daylight_color,
         banner=MODULE_BANNERS["daylight"],
     ))
 
+    # --- 5. Trends from the local history buffer ---
+    try:
+        slides.extend(get_trend_slides(weather_color))
+    except Exception as e:
+        print(f"[weather_module] Trend slide error: {e}")
+
     return slides
 
 
@@ -0,0 +1,109 @@
+# weather_module/trends.py
+"""
+Sparkline trend slides drawn straight into a NumPy framebuffer.
+
+One slide per TREND_WINDOWS entry: temperature, pressure, humidity and
+wind stacked as four panels.  Samples are averaged into one bucket per
+pixel column, and the line is drawn as vertical runs between neighbouring
+columns so the whole plot is a handful of array operations.
+"""
+import time
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from .config import TREND_WINDOWS
+from .history import get_history
+from font_manager import get_fonts
+
+SCREEN_WIDTH, SCREEN_HEIGHT = 320, 240
+_LABEL_HEIGHT = 16
+_PLOT_LEFT, _PLOT_RIGHT = 8, SCREEN_WIDTH - 8
+_AXIS_COLOR = (80, 60, 0)
+
+# field, label, unit, format
+_PANELS = [
+    ("temp", "Temp", "°F", "{:.0f}"),
+    ("pressure", "Press", "hPa", "{:.0f}"),
+    ("humidity", "Humid", "%", "{:.0f}"),
+    ("wind", "Wind", "mph", "{:.0f}"),
+]
+_LABEL_FONT_SIZE = 12
+
+
+def _bucket(times, values, start, end, columns):
+    """Mean of *values* per pixel column over [start, end]; NaN where empty."""
+    col = ((times - start) / (end - start) * columns).astype(np.int64)
+    keep = (col >= 0) & (col < columns)
+    sums = np.bincount(col[keep], weights=values[keep], minlength=columns)
+    counts = np.bincount(col[keep], minlength=columns)
+    with np.errstate(invalid="ignore"):
+        return sums / counts
+
+
+def _draw_sparkline(fb, top, height, series, color):
+    """Plot *series* (one value per column, NaN gaps) into ``fb[top:top+height]``."""
+    valid = ~np.isnan(series)
+    if not valid.any():
+        return None, None
+    lo, hi = np.nanmin(series), np.nanmax(series)
+    span = (hi - lo) or 1.0
+    y = np.where(valid, (height - 1) - (series - lo) / span * (height - 1), np.nan)
+
+    # Join each point to its left neighbour (or itself) with a vertical run
+    prev = np.concatenate(([np.nan], y[:-1]))
+    prev = np.where(np.isnan(prev), y, prev)
+    y0 = np.fmin(y, prev)
+    y1 = np.fmax(y, prev)
+
+    rows = np.arange(height)[:, None]
+    with np.errstate(invalid="ignore"):
+        mask = (rows >= np.floor(y0)) & (rows <= np.ceil(y1))
+    region = fb[top:top + height, _PLOT_LEFT:_PLOT_LEFT + series.size]
+    region[mask] = color
+    return lo, hi
+
+
+def render_trend(history, title, span, color, now=None):
+    """Return a PIL image with four stacked sparklines for the last *span* s."""
+    now = now or time.time()
+    start = now - span
+    samples = history.since(start)
+
+    fb = np.zeros((SCREEN_HEIGHT, SCREEN_WIDTH, 3), dtype=np.uint8)
+    columns = _PLOT_RIGHT - _PLOT_LEFT
+    panel_height = (SCREEN_HEIGHT - _LABEL_HEIGHT) // len(_PANELS)
+    plot_height = panel_height - _LABEL_HEIGHT
+
+    labels = []
+    for i, (field, name, unit, fmt) in enumerate(_PANELS):
+        top = _LABEL_HEIGHT + i * panel_height
+        plot_top = top + _LABEL_HEIGHT - 2
+        fb[plot_top + plot_height, _PLOT_LEFT:_PLOT_RIGHT] = _AXIS_COLOR
+        series = _bucket(samples["time"], samples[field], start, now, columns)
+        lo, hi = _draw_sparkline(fb, plot_top, plot_height, series, color)
+        if lo is None:
+            labels.append((top, f"{name}: no data"))
+        else:
+            latest = series[~np.isnan(series)][-1]
+            labels.append((top, f"{name} {fmt.format(latest)}{unit}  "
+                                f"({fmt.format(lo)}-{fmt.format(hi)})"))
+
+    img = Image.fromarray(fb, "RGB")
+    draw = ImageDraw.Draw(img)
+    font = get_fonts().get(_LABEL_FONT_SIZE)
+    draw.text((_PLOT_LEFT, 0), f"TRENDS - {title}  ({len(samples['time'])} samples)",
+              font=font, fill=color)
+    for top, text in labels:
+        draw.text((_PLOT_LEFT, top), text, font=font, fill=color)
+    return img
+
+
+def get_trend_slides(color):
+    """One image slide per TREND_WINDOWS entry, skipped until data exists."""
+    history = get_history()
+    if len(history) < 2:
+        return []
+    now = time.time()
+    return [{"type": "image", "image": render_trend(history, title, span, color, now)}
+            for title, span in TREND_WINDOWS]